@@ -21,7 +21,9 @@ import subprocess
 import threading
 import unicodedata
 
+from .devicestate import DeviceState
 from .dumpsys import Dumpsys
+from .logcat import Logcat
 
 __version__ = '15.4.0'
 
@@ -40,6 +42,8 @@ import string
 import datetime
 import struct
 import io
+import random
+import zlib
 import socket
 import time
 import re
@@ -47,7 +51,7 @@ import os
 import platform
 
 from ..window import Window
-from ..common import _nd, _nh, _ns, obtainPxPy, obtainVxVy, obtainVwVh, profileStart, profileEnd
+from ..common import _nd, _nh, _ns, obtainPxPy, obtainVxVy, obtainVwVh, profileStart, profileEnd, distribution
 from .androidkeymap import KEY_MAP
 
 DEBUG = False
@@ -82,6 +86,12 @@ TIMEOUT = 15
 
 WIFI_SERVICE = 'wifi'
 
+DEVICE_STATE_TTL = 1.0
+''' Seconds a L{DeviceState} snapshot is reused, unless invalidated by an input event '''
+
+TEMPLATE_FIELD_TTL = 2.0
+''' Seconds a device template field value obtained from the device is reused '''
+
 # some device properties
 VERSION_SDK_PROPERTY = 'ro.build.version.sdk'
 VERSION_RELEASE_PROPERTY = 'ro.build.version.release'
@@ -134,7 +144,9 @@ class WifiManager:
         @return: One of WIFI_STATE_DISABLED, WIFI_STATE_DISABLING, WIFI_STATE_ENABLED, WIFI_STATE_ENABLING, WIFI_STATE_UNKNOWN
         '''
 
-        result = self.device.shell('dumpsys wifi')
+        state = None
+        # only the first line is needed, which is the only one transferred if the device can filter it
+        result = self.device.shellFiltered('dumpsys wifi', lines=1)
         if result:
             state = result.splitlines()[0]
             if self.WIFI_IS_ENABLED_RE.match(state):
@@ -159,11 +171,155 @@ class Timer:
         pass
 
 
+class ShellSession:
+    '''
+    Persistent interactive shell.
+
+    Opens one C{shell:} stream to the device and runs many commands through it instead of opening a new
+    connection per command. Every command is framed by unique begin and end sentinels so its output and
+    exit code can be separated from prompts, echoed input and the output of previous commands.
+
+    Usage::
+
+        with adbClient.shell() as session:
+            for p in ['ro.product.model', 'ro.build.version.sdk']:
+                print(session.shell('getprop ' + p))
+    '''
+
+    BEGIN = '__AVC_BEGIN'
+    END = '__AVC_END'
+
+    def __init__(self, adbclient, timeout=TIMEOUT):
+        '''
+        Constructor
+
+        @type adbclient: AdbClient
+        @param adbclient: the client whose device the session is opened on
+        @param timeout: the default per-command timeout in seconds (C{None} means no timeout)
+        '''
+
+        self.adbClient = adbclient
+        self.timeout = timeout
+        self.lock = threading.RLock()
+        self.socket = adbclient.openStream('shell:', timeout=timeout)
+        self.__id = '%08x' % random.getrandbits(32)
+        self.__n = 0
+        self.__buffer = bytearray()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except:
+            pass
+
+    def run(self, cmd, timeout=-1):
+        '''
+        Runs C{cmd} in the session and waits for it to finish.
+
+        The command is sent as a single shell line, so it should not contain newlines.
+        The terminal of the session ends the output lines with C{\\r\\n}, they are converted to C{\\n}.
+        If the timeout expires the running command is interrupted (as if C{Ctrl-C} was pressed) and
+        L{Timer.TimeoutException} is raised. The session can still be used afterwards.
+
+        @param cmd: the command line
+        @param timeout: the timeout in seconds, C{None} for no timeout or -1 to use the session default
+        @return: the tuple (output, exitCode)
+        '''
+
+        if DEBUG_SHELL:
+            print("ShellSession.run(cmd=%s, timeout=%s)" % (cmd, timeout), file=sys.stderr)
+        if timeout == -1:
+            timeout = self.timeout
+        with self.lock:
+            if not self.socket:
+                raise RuntimeError("ERROR: Shell session is closed")
+            self.__n += 1
+            tag = '%s_%d' % (self.__id, self.__n)
+            # The sentinels are split by quotes in the command line so the echo of the input by the terminal
+            # never matches them, only the output of the echo commands does
+            line = 'echo %s"_"%s; %s; echo %s"_"%s:$?\n' % (ShellSession.BEGIN, tag, cmd, ShellSession.END, tag)
+            self.socket.sendall(line.encode('utf-8'))
+            beginRE = re.compile(('%s_%s\r?\n' % (ShellSession.BEGIN, tag)).encode('ascii'))
+            endRE = re.compile(('%s_%s:(\\d+)\r?\n' % (ShellSession.END, tag)).encode('ascii'))
+            deadline = (time.time() + timeout) if timeout is not None else None
+            begin = None
+            while True:
+                if begin is None:
+                    m = beginRE.search(self.__buffer)
+                    if m:
+                        begin = m.end()
+                if begin is not None:
+                    m = endRE.search(self.__buffer, begin)
+                    if m:
+                        output = bytes(self.__buffer[begin:m.start()]).replace(b'\r\n', b'\n')
+                        exitCode = int(m.group(1))
+                        del self.__buffer[:m.end()]
+                        return output.decode('utf-8', errors='replace'), exitCode
+                self.__fill(deadline)
+
+    def shell(self, cmd, timeout=-1):
+        '''
+        Runs C{cmd} in the session.
+
+        @return: the command output, like L{AdbClient.shell}
+        '''
+
+        return self.run(cmd, timeout)[0]
+
+    def __fill(self, deadline):
+        if deadline is not None:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                self.__interrupt()
+            self.socket.settimeout(remaining)
+        else:
+            self.socket.settimeout(None)
+        try:
+            chunk = self.socket.recv(4096)
+        except socket.timeout:
+            self.__interrupt()
+        if not chunk:
+            self.close()
+            raise RuntimeError("ERROR: Shell session closed by the device")
+        self.__buffer += chunk
+
+    def __interrupt(self):
+        # Kills the foreground command, whatever is left in the buffer is discarded by the next run() as it
+        # searches for its own sentinels
+        self.__buffer.clear()
+        self.socket.sendall(b'\x03')
+        raise Timer.TimeoutException("Shell session command timed out")
+
+    def close(self):
+        with self.lock:
+            if self.socket:
+                try:
+                    self.socket.sendall(b'exit\n')
+                except socket.error:
+                    pass
+                self.socket.close()
+                self.socket = None
+
+
 class AdbClient:
     UP = UP
     DOWN = DOWN
     DOWN_AND_UP = DOWN_AND_UP
 
+    COLD = 'cold'
+    WARM = 'warm'
+    HOT = 'hot'
+    ''' The launch modes of L{measureLaunch()} '''
+
+    LAUNCH_TIMES_RE = re.compile(r'^(ThisTime|TotalTime|WaitTime): (\d+)', re.MULTILINE)
+    DISPLAYED_RE = re.compile(r'Displayed (\S+): \+(?:(\d+)s)?(\d+)ms')
+
     def __init__(self, serialno=None, hostname=HOSTNAME, port=PORT, settransport=True, reconnect=True,
                  ignoreversioncheck=False, timeout=TIMEOUT):
         self.Log = AdbClient.__Log(self)
@@ -191,6 +347,25 @@ class AdbClient:
         self.display = {}
         ''' The map containing the device's physical display properties: width, height and density '''
 
+        self.deviceStateTtl = DEVICE_STATE_TTL
+        ''' Seconds the device state snapshot is reused. Set it to 0 to obtain the state every time '''
+
+        self.__deviceState = None
+        ''' Cached device state, invalidated by the input events sent by this client '''
+
+        self.__onDeviceFiltering = None
+        ''' Whether the device has the tools (C{grep -m}, C{head}) to filter command outputs. Detected on first use. '''
+
+        self.__gzip = None
+        ''' Whether the device can gzip command outputs. Detected on first use. '''
+
+        self.templateFields = {}
+        ''' Maps the device template field names to their [function, ttl, value, expiration] '''
+        self.registerTemplateField('serialno', lambda: self.serialno.replace('.', '_').replace(':', '-'))
+        self.registerTemplateField('focusedwindowname', self.__getFocusedWindowNameForTemplate,
+                                   ttl=TEMPLATE_FIELD_TTL)
+        self.registerTemplateField('timestamp', self.__getTimestampForTemplate)
+
         self.isTransportSet = False
         if settransport and serialno is not None:
             self.__setTransport(timeout=timeout)
@@ -485,7 +660,6 @@ class AdbClient:
         #
         # synchronized
         #
-        self.lock.acquire()
         with self.lock:
             if _cmd:
                 self.__send('shell:%s' % _cmd, checkok=True, reconnect=False)
@@ -508,17 +682,138 @@ class AdbClient:
 
                 return ''.join(chunks)
             else:
-                self.__send('shell:')
-                # sin = self.socket.makefile("rw")
-                # sout = self.socket.makefile("r")
-                # return (sin, sin)
-                return adbClient.socket.makefile("r")
+                return ShellSession(self, timeout=self.timeout)
+
+    def openStream(self, service, timeout=-1):
+        '''
+        Opens a new connection to the ADB server, sets its transport to this device and requests C{service}.
+
+        The connection is independent of the one used by the other methods, so it can be read, for example
+        from another thread, while this client keeps sending commands.
+
+        @param service: the service (i.e. C{shell:}, C{shell:logcat})
+        @param timeout: the socket timeout in seconds, C{None} for no timeout or -1 to use this client timeout
+        @return: the connected socket, positioned at the beginning of the service output
+        '''
+
+        if DEBUG:
+            print("openStream(service=%s, timeout=%s)" % (service, timeout), file=sys.stderr)
+        self.__checkTransport()
+        if timeout == -1:
+            timeout = self.timeout
+        sock = AdbClient.connect(self.hostname, self.port, timeout)
+        try:
+            for msg in ['host:transport:%s' % self.serialno, service]:
+                b = bytearray(msg, 'utf-8')
+                sock.sendall(('%04X' % len(b)).encode() + b)
+                self.__checkOk(sock=sock)
+        except:
+            sock.close()
+            raise
+        return sock
+
+    def shellStream(self, cmd, timeout=-1):
+        '''
+        Runs C{cmd} like L{shell()} but over its own connection (see L{openStream()}), so it can be used from other
+        threads without waiting for, or interfering with, the commands sent by this client.
+
+        @return: the command output
+        '''
+
+        return b''.join(self.shellChunks(cmd, timeout=timeout)).decode('utf-8', errors='replace')
+
+    def shellChunks(self, cmd, timeout=-1, binary=False):
+        '''
+        Runs C{cmd} like L{shellStream()} but yields its output in C{bytes} chunks, as they are received, so it can be
+        processed while the command is still running.
+
+        @param binary: if C{True} the command is run by the C{exec:} service, which is available since API 21,
+        instead of C{shell:}, so the output is not altered by a terminal (i.e. C{LF} converted to C{CR LF})
+        @return: a generator of the output chunks
+        '''
+
+        sock = self.openStream('%s:%s' % ('exec' if binary else 'shell', cmd), timeout=timeout)
+        try:
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            sock.close()
+
+    def isGzipAvailable(self):
+        '''
+        Checks whether the device can compress command outputs with C{gzip} and transfer them unaltered with
+        L{shellChunks()}. The result is obtained once and cached.
+        '''
+
+        if self.__gzip is None:
+            self.__gzip = False
+            if self.getSdkVersion() >= 21:
+                try:
+                    out = b''.join(self.shellChunks('echo avc | gzip -c', binary=True))
+                    self.__gzip = (zlib.decompress(out, 16 + zlib.MAX_WBITS) == b'avc\n')
+                except (zlib.error, RuntimeError, socket.error):
+                    pass
+            if DEBUG:
+                print("isGzipAvailable: %s" % self.__gzip, file=sys.stderr)
+        return self.__gzip
+
+    def isOnDeviceFilteringAvailable(self):
+        '''
+        Checks whether the device can filter command outputs with C{grep -m} and C{head}.
+        The result is obtained once and cached.
+        '''
+
+        if self.__onDeviceFiltering is None:
+            out = self.shell("echo avc | grep -m 1 -E 'a(v)c' | head -n 1")
+            self.__onDeviceFiltering = (out.strip() == 'avc')
+            if DEBUG:
+                print("isOnDeviceFilteringAvailable: %s" % self.__onDeviceFiltering, file=sys.stderr)
+        return self.__onDeviceFiltering
+
+    def shellFiltered(self, cmd, pattern=None, maxCount=None, lines=None):
+        '''
+        Runs C{cmd} keeping only the lines of its output matching C{pattern} and then only the first C{lines}.
+
+        The filtering is done on the device, piping the output through C{grep} and C{head}, so only the lines
+        kept are transferred and the command is terminated as soon as no more lines are needed. If the device
+        lacks these tools the whole output is transferred and filtered here, giving the same result.
+
+        @param cmd: the command
+        @param pattern: the extended regex (C{grep -E}) the lines should match, it cannot contain single quotes
+        @param maxCount: the maximum number of matching lines (C{grep -m})
+        @param lines: the maximum number of lines (C{head -n})
+        @return: the filtered output
+        '''
+
+        if pattern and "'" in pattern:
+            raise ValueError("pattern cannot contain single quotes: %s" % pattern)
+        if self.isOnDeviceFilteringAvailable():
+            if pattern:
+                cmd += ' | grep%s -E \'%s\'' % (' -m %d' % maxCount if maxCount else '', pattern)
+            if lines:
+                cmd += ' | head -n %d' % lines
+            return self.shell(cmd)
+        out = self.shell(cmd)
+        if not pattern and not lines:
+            return out
+        regex = re.compile(pattern) if pattern else None
+        kept = []
+        for line in out.splitlines(True):
+            if regex and not regex.search(line):
+                continue
+            kept.append(line)
+            if (maxCount and len(kept) >= maxCount) or (lines and len(kept) >= lines):
+                break
+        return ''.join(kept)
 
     def getRestrictedScreen(self):
         ''' Gets C{mRestrictedScreen} values from dumpsys. This is a method to obtain display dimensions '''
 
         rsRE = re.compile('\s*mRestrictedScreen=\((?P<x>\d+),(?P<y>\d+)\) (?P<w>\d+)x(?P<h>\d+)')
-        for line in self.shell('dumpsys window').splitlines():
+        for line in self.shellFiltered('dumpsys window', pattern='mRestrictedScreen=', maxCount=1).splitlines():
             m = rsRE.match(line)
             if m:
                 return m.groups()
@@ -691,6 +986,7 @@ class AdbClient:
 
     def press(self, name, eventType=DOWN_AND_UP, repeat=1):
         self.__checkTransport()
+        self.invalidateDeviceState()
         if not isinstance(name, str):
             name = name.decode('ascii', errors='replace')
         cmd = 'input keyevent %s' % name
@@ -711,6 +1007,7 @@ class AdbClient:
         #     $ adb shell getevent -l
         # and post the output to https://github.com/dtmilano/AndroidViewClient/issues
         # specifying the device and API level.
+        self.invalidateDeviceState()
         if name[0:4] == 'KEY_':
             name = name[4:]
         # FIXME:
@@ -738,6 +1035,7 @@ class AdbClient:
 
     def startActivity(self, component=None, flags=None, uri=None):
         self.__checkTransport()
+        self.invalidateDeviceState()
         cmd = 'am start'
         if component:
             cmd += ' -n %s' % component
@@ -751,6 +1049,89 @@ class AdbClient:
         if re.search(r"(Error type)|(Error: )|(Cannot find 'App')", out, re.IGNORECASE | re.MULTILINE):
             raise RuntimeError(out)
 
+    def __startActivityAndWait(self, args):
+        out = self.shell('am start -W ' + args)
+        if re.search(r"(Error type)|(Error: )|(Cannot find 'App')", out, re.IGNORECASE | re.MULTILINE):
+            raise RuntimeError(out)
+        return out
+
+    def measureLaunch(self, component, mode=COLD, iterations=10, warmup=1, displayed=False, timeout=10):
+        '''
+        Measures the launch time of an activity.
+
+        Every launch is done with C{am start -W}, which waits until the activity is displayed and reports its
+        times. Before each one, the app is prepared according to C{mode}:
+            - L{COLD}: the app is force stopped, so the process is created
+            - L{WARM}: the device goes home and the activity is started clearing its task, so the process exists
+            but the activity is created
+            - L{HOT}: the device goes home and the activity, still alive, is brought to the front
+
+        @param component: the activity component (i.e. C{com.example/.MainActivity})
+        @param mode: L{COLD}, L{WARM} or L{HOT}
+        @param iterations: the number of launches measured
+        @param warmup: the number of launches done before, not measured
+        @param displayed: also obtain the time in the C{Displayed} line logged by the system. Hot launches don't
+        log it, so it's always C{None} for them.
+        @param timeout: the time to wait for the C{Displayed} line in seconds
+        @return: the map containing the C{samples}, a map of C{thisTime}, C{totalTime}, C{waitTime} and
+        C{displayed} to the lists of times in ms (C{None} if not reported), and the L{distribution()} of each one
+        under the same keys
+        '''
+
+        if mode not in (AdbClient.COLD, AdbClient.WARM, AdbClient.HOT):
+            raise ValueError("Invalid launch mode '%s'" % mode)
+        self.__checkTransport()
+        self.invalidateDeviceState()
+        pkg = component.split('/')[0]
+        home = '-a android.intent.action.MAIN -c android.intent.category.HOME'
+        keys = ['thisTime', 'totalTime', 'waitTime', 'displayed']
+        samples = dict((k, []) for k in keys)
+        logcat = None
+        try:
+            if mode != AdbClient.COLD:
+                # the process, and the activity for hot launches, should exist before the first one
+                self.__startActivityAndWait('-n ' + component)
+            if displayed and mode != AdbClient.HOT:
+                since = self.shell("date +'%m-%d %H:%M:%S.000'").strip()
+                logcat = self.logcat(['ActivityManager:I', 'ActivityTaskManager:I', '*:S'], since=since,
+                                     timeout=timeout)
+                # since has a resolution of seconds, so the Displayed line of the launch above may be included
+                logcat.drain()
+            for i in range(warmup + iterations):
+                if mode == AdbClient.COLD:
+                    self.shell('am force-stop %s' % pkg)
+                    args = '-n ' + component
+                elif mode == AdbClient.WARM:
+                    self.__startActivityAndWait(home)
+                    args = '--activity-clear-task -n ' + component
+                else:
+                    self.__startActivityAndWait(home)
+                    args = '-n ' + component
+                out = self.__startActivityAndWait(args)
+                times = dict((m.group(1), int(m.group(2))) for m in AdbClient.LAUNCH_TIMES_RE.finditer(out))
+                displayedTime = None
+                if logcat:
+                    record = logcat.waitFor(r'Displayed %s/' % re.escape(pkg), timeout=timeout)
+                    if record:
+                        m = AdbClient.DISPLAYED_RE.search(record.message)
+                        if m:
+                            displayedTime = int(m.group(2) or 0) * 1000 + int(m.group(3))
+                if DEBUG:
+                    print("measureLaunch: %d %s %s displayed=%s" % (i, mode, times, displayedTime), file=sys.stderr)
+                if i < warmup:
+                    continue
+                samples['thisTime'].append(times.get('ThisTime'))
+                samples['totalTime'].append(times.get('TotalTime'))
+                samples['waitTime'].append(times.get('WaitTime'))
+                samples['displayed'].append(displayedTime)
+        finally:
+            if logcat:
+                logcat.close()
+        result = {'component': component, 'mode': mode, 'samples': samples}
+        for k in keys:
+            result[k] = distribution(samples[k])
+        return result
+
     def takeSnapshot(self, reconnect=False):
         '''
         Takes a snapshot of the device and return it as a PIL Image.
@@ -881,6 +1262,7 @@ class AdbClient:
         self.__checkTransport()
         if orientation == -1:
             orientation = self.display['orientation']
+        self.invalidateDeviceState()
         version = self.getSdkVersion()
         if version > 10:
             self.shell(
@@ -931,6 +1313,7 @@ class AdbClient:
         (x0, y0) = self.__transformPointByOrientation((x0, y0), orientation, self.display['orientation'])
         (x1, y1) = self.__transformPointByOrientation((x1, y1), orientation, self.display['orientation'])
 
+        self.invalidateDeviceState()
         version = self.getSdkVersion()
         if version <= 15:
             raise RuntimeError('drag: API <= 15 not supported (version=%d)' % version)
@@ -963,6 +1346,7 @@ class AdbClient:
 
     def type(self, text):
         self.__checkTransport()
+        self.invalidateDeviceState()
         try:
             text.encode('ascii')
             # type(text) is str
@@ -984,6 +1368,33 @@ class AdbClient:
         self.__checkTransport()
         if not self.isScreenOn():
             self.shell('input keyevent POWER')
+            self.invalidateDeviceState()
+
+    def getDeviceState(self, ttl=-1):
+        '''
+        Gets the device state snapshot, obtaining a new one if the cached one is older than C{ttl} or was
+        invalidated by an input event sent by this client.
+
+        @param ttl: the time to live in seconds, -1 to use L{deviceStateTtl}
+        @return: the L{DeviceState}
+        '''
+
+        self.__checkTransport()
+        if ttl == -1:
+            ttl = self.deviceStateTtl
+        state = self.__deviceState
+        if state is None or state.isExpired(ttl):
+            state = DeviceState(self)
+            self.__deviceState = state
+        return state
+
+    def invalidateDeviceState(self):
+        '''
+        Invalidates the cached device state. Input events sent by this client do it automatically, this should
+        be invoked when the device state is changed by other means (i.e. L{shell} commands).
+        '''
+
+        self.__deviceState = None
 
     def isLocked(self):
         '''
@@ -993,16 +1404,10 @@ class AdbClient:
         '''
 
         self.__checkTransport()
-        lockScreenRE = re.compile('mShowingLockscreen=(true|false)')
-        dwp = self.shell('dumpsys window policy')
-        m = lockScreenRE.search(dwp)
-        if m:
-            return m.group(1) == 'true'
-        dreamingLockscreenRE = re.compile('mDreamingLockscreen=(true|false)')
-        m = dreamingLockscreenRE.search(dwp)
-        if m:
-            return m.group(1) == 'true'
-        raise RuntimeError("Couldn't determine screen lock state")
+        locked = self.getDeviceState().locked
+        if locked is None:
+            raise RuntimeError("Couldn't determine screen lock state")
+        return locked
 
     def isScreenOn(self):
         """
@@ -1012,11 +1417,10 @@ class AdbClient:
         """
 
         self.__checkTransport()
-        screenOnRE = re.compile('mScreenOnFully=(true|false)')
-        m = screenOnRE.search(self.shell('dumpsys window policy'))
-        if m:
-            return m.group(1) == 'true'
-        raise RuntimeError("Couldn't determine screen ON state")
+        screenOn = self.getDeviceState().screenOn
+        if screenOn is None:
+            raise RuntimeError("Couldn't determine screen ON state")
+        return screenOn
 
     def unlock(self):
         '''
@@ -1024,6 +1428,7 @@ class AdbClient:
         '''
 
         self.__checkTransport()
+        self.invalidateDeviceState()
         self.shell('input keyevent MENU')
         self.shell('input keyevent BACK')
 
@@ -1119,11 +1524,8 @@ class AdbClient:
         '''
 
         self.__checkTransport()
-        dim = self.shell('dumpsys input_method')
-        if dim:
-            # FIXME: API >= 15 ?
-            return "mInputShown=true" in dim
-        return False
+        # FIXME: API >= 15 ?
+        return self.getDeviceState().keyboardShown
 
     def initDisplayProperties(self):
         self.__checkTransport()
@@ -1142,6 +1544,23 @@ class AdbClient:
             print(tag + ':', message, file=sys.stderr)
         self.shell('log -p %c -t "%s" %s' % (priority, tag, message))
 
+    def logcat(self, filters=None, format=Logcat.THREADTIME, since=None, dump=False, bufferSize=0, timeout=None):
+        '''
+        Reads the device log.
+
+        @param filters: logcat filter specs (i.e. C{['ActivityManager:I', '*:S']}), applied on the device
+        @param format: the logcat format, one of C{threadtime}, C{time} or C{brief}
+        @param since: only lines since this time or this number of most recent lines (logcat C{-T})
+        @param dump: dump the current log and stop instead of waiting for new lines
+        @param bufferSize: keep the last C{bufferSize} records in a ring buffer
+        @param timeout: the socket timeout in seconds, C{None} means block until lines arrive
+        @return: a L{Logcat} that yields L{LogcatRecord}s when iterated
+        '''
+
+        self.__checkTransport()
+        return Logcat(self, filters=filters, format=format, since=since, dump=dump, bufferSize=bufferSize,
+                      timeout=timeout)
+
     class __Log:
         '''
         Log class to simulate C{android.util.Log}
@@ -1294,14 +1713,14 @@ class AdbClient:
         return None
 
     def getTopActivityNameAndPid(self):
-        dat = self.shell('dumpsys activity top')
-        lines = dat.splitlines()
+        # Only the first ACTIVITY line is needed, 'dumpsys activity top' is usually huge
+        line = self.shellFiltered('dumpsys activity top', pattern='^ *ACTIVITY ', maxCount=1)
         activityRE = re.compile('\s*ACTIVITY ([A-Za-z0-9_.]+)/([A-Za-z0-9_.]+) \w+ pid=(\d+)')
-        m = activityRE.search(lines[1])
+        m = activityRE.search(line)
         if m:
             return m.group(1), m.group(2), m.group(3)
         else:
-            warnings.warn("NO MATCH:" + lines[1])
+            warnings.warn("NO MATCH:" + line)
             return None
 
     def getTopActivityName(self):
@@ -1311,19 +1730,58 @@ class AdbClient:
         else:
             return None
 
-    def substituteDeviceTemplate(self, template):
-        serialno = self.serialno.replace('.', '_').replace(':', '-')
-        focusedWindowName = self.getFocusedWindowName().replace('/', '-').replace('.', '_')
+    def registerTemplateField(self, name, function, ttl=0):
+        '''
+        Registers a field that can be used as C{${name}} in device templates.
+
+        @param name: the field name
+        @param function: the function, invoked without arguments, returning the field value
+        @param ttl: the number of seconds the value is reused once obtained (0: never reused, C{None}: forever)
+        '''
+
+        self.templateFields[name] = [function, ttl, None, 0]
+
+    def __getFocusedWindowNameForTemplate(self):
+        focusedWindowName = self.getFocusedWindowName()
+        if focusedWindowName is None:
+            return 'None'
+        return focusedWindowName.replace('/', '-').replace('.', '_')
+
+    @staticmethod
+    def __getTimestampForTemplate():
         timestamp = datetime.datetime.now().isoformat()
         osName = platform.system()
         if osName.startswith('Windows'):  # ':' not supported in filenames
-            timestamp.replace(':', '_')
-        _map = {
-            'serialno': serialno,
-            'focusedwindowname': focusedWindowName,
-            'timestamp': timestamp
-        }
-        return string.Template(template).substitute(_map)
+            timestamp = timestamp.replace(':', '_')
+        return timestamp
+
+    class __TemplateMap:
+        '''
+        Mapping used by C{string.Template} that obtains only the fields actually referenced by the template,
+        once per substitution.
+        '''
+
+        def __init__(self, templateFields):
+            self.templateFields = templateFields
+            self.values = {}
+
+        def __getitem__(self, name):
+            if name in self.values:
+                return self.values[name]
+            field = self.templateFields[name]
+            function, ttl, value, expiration = field
+            now = time.time()
+            if ttl == 0 or now >= expiration:
+                value = function()
+                field[2] = value
+                field[3] = now + ttl if ttl is not None else float('inf')
+            self.values[name] = value
+            return value
+
+    def substituteDeviceTemplate(self, template):
+        if '$' not in template:
+            return template
+        return string.Template(template).substitute(AdbClient.__TemplateMap(self.templateFields))
 
     def dumpsys(self, subcommand, args):
         return Dumpsys(self, subcommand, args)
@@ -1333,24 +1791,15 @@ if __name__ == '__main__':
     adbClient = AdbClient(os.environ['ANDROID_SERIAL'])
     INTERACTIVE = False
     if INTERACTIVE:
-        sout = adbClient.shell()
-        prompt = re.compile(".+@android:(.*) [$#] \r\r\n")
-        while True:
-            try:
-                cmd = input('adb $ ')
-            except EOFError:
-                break
-            if cmd == 'exit':
-                break
-            adbClient.socket.__send(cmd + "\r\n")
-            sout.readline(4096)  # eat first line, which is the command
+        with adbClient.shell() as session:
             while True:
-                line = sout.readline(4096)
-                if prompt.match(line):
+                try:
+                    cmd = input('adb $ ')
+                except EOFError:
                     break
-                print(line, end=' ')
-                if not line:
+                if cmd == 'exit':
                     break
+                print(session.shell(cmd, timeout=None), end='')
 
         print("\nBye")
     else:
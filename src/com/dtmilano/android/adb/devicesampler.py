@@ -0,0 +1,322 @@
+'''
+Copyright (C) 2012-2018  Diego Torres Milano
+Created on Oct 18, 2018
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@author: Diego Torres Milano
+'''
+from __future__ import print_function
+
+import socket
+import sys
+import threading
+
+from .dumpsys import Dumpsys
+from .meminfosampler import MeminfoSampler
+
+__version__ = '15.4.0'
+
+DEBUG = False
+
+
+class DeviceSampler:
+    '''
+    Samples CPU and memory counters with a loop running on the device.
+
+    A single shell loop, started over its own connection, reads C{/proc/uptime}, C{/proc/stat},
+    C{/proc/<pid>/stat} and C{/proc/meminfo} every L{interval} seconds and writes one compact record per sample.
+    The counters are read and filtered with shell builtins (C{read}, C{case}, C{echo}), so the only process
+    started per sample is C{sleep}; C{pidof} runs once, when the loop starts. Optionally, every L{meminfoEvery}
+    samples, it also runs C{dumpsys meminfo <pkg>}.
+    The records are parsed incrementally, as they arrive, into numpy time series, so sampling every 100ms does
+    not need a round trip nor a new adbd shell per sample.
+
+    Usage::
+
+        with DeviceSampler(device, 'com.example', interval=0.1) as sampler:
+            vc.findViewWithTextOrRaise('Start').touch()
+        times, system, process = sampler.getCpuUsage()
+    '''
+
+    COLUMNS = ['uptime', 'cpuTotal', 'cpuIdle', 'procCpu', 'procRss', 'memTotal', 'memFree', 'memAvailable',
+               'cached']
+    ''' The columns of the samples. CPU times are in jiffies, memory in kB and C{uptime} in seconds. '''
+
+    PROC_MEMINFO_FIELDS = {'MemTotal:': 'memTotal', 'MemFree:': 'memFree', 'MemAvailable:': 'memAvailable',
+                           'Cached:': 'cached'}
+    ''' Maps the C{/proc/meminfo} labels to the columns '''
+
+    PAGE_SIZE_KB = 4
+    ''' The page size used to convert C{/proc/<pid>/stat} rss to kB '''
+
+    SAMPLE = 'S'
+    MEMINFO = 'M'
+    END = 'E'
+    ''' The record types '''
+
+    def __init__(self, adbclient, pkg=None, pid=None, interval=0.1, meminfoEvery=0, capacity=1024):
+        '''
+        Constructor
+
+        @type adbclient: AdbClient
+        @param adbclient: the client of the device sampled
+        @param pkg: the package whose process is sampled, if any. Its pid is obtained on the device.
+        @param pid: the pid of the process sampled, instead of C{pkg}
+        @param interval: the sampling interval in seconds
+        @param meminfoEvery: if greater than 0, C{dumpsys meminfo <pkg>} is sampled every this number of samples
+        @param capacity: the number of samples preallocated, the arrays grow as needed
+        '''
+
+        import numpy
+
+        if meminfoEvery and not pkg:
+            raise ValueError('meminfoEvery needs a package')
+        self.adbclient = adbclient
+        self.pkg = pkg
+        self.pid = pid
+        self.interval = interval
+        self.meminfoEvery = meminfoEvery
+        self.socket = None
+        self.__samples = numpy.empty((capacity, len(DeviceSampler.COLUMNS)), dtype=numpy.float64)
+        self.__count = 0
+        self.__meminfo = numpy.empty((max(1, capacity // max(1, meminfoEvery)), 1 + len(MeminfoSampler.FIELDS)),
+                                     dtype=numpy.float64)
+        self.__meminfoCount = 0
+        self.__meminfoLines = None
+        self.__meminfoUptime = None
+        self.__pending = bytearray()
+        self.__lock = threading.RLock()
+        self.__thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def getCommand(self):
+        '''
+        @return: the shell loop sampling the counters
+        '''
+
+        if self.pid:
+            cmd = 'p=%d; ' % self.pid
+        elif self.pkg:
+            cmd = 'set -- $(pidof %s); p=$1; ' % self.pkg
+        else:
+            cmd = 'p=; '
+        cmd += 'n=0; while :; do ' \
+               'read up idle < /proc/uptime; ' \
+               'read c cpu < /proc/stat; ' \
+               'pst=; [ -n "$p" ] && { read pst < /proc/$p/stat; } 2>/dev/null; ' \
+               'm=; while read k v u; do case $k in %s) m="$m $k$v";; esac; done < /proc/meminfo; ' \
+               'echo "%s|$up|$cpu|$pst|$m"; ' % ('|'.join(DeviceSampler.PROC_MEMINFO_FIELDS.keys()),
+                                                DeviceSampler.SAMPLE)
+        if self.meminfoEvery:
+            cmd += 'n=$((n+1)); if [ $((n %% %d)) -eq 0 ]; then ' \
+                   'echo "%s|$up"; dumpsys meminfo %s; echo "%s|"; fi; ' % (self.meminfoEvery, DeviceSampler.MEMINFO,
+                                                                          self.pkg, DeviceSampler.END)
+        cmd += 'sleep %s; done' % self.interval
+        return cmd
+
+    def start(self):
+        '''
+        Starts the loop on the device and the thread reading its records.
+        '''
+
+        if self.__thread:
+            raise RuntimeError('DeviceSampler already started')
+        cmd = self.getCommand()
+        if DEBUG:
+            print("DeviceSampler: %s" % cmd, file=sys.stderr)
+        self.socket = self.adbclient.openStream('shell:' + cmd, timeout=None)
+        self.__thread = threading.Thread(target=self.__run, name='DeviceSampler')
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        '''
+        Stops sampling. Closing the connection ends the loop on the device.
+        '''
+
+        sock = self.socket
+        self.socket = None
+        if sock:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            sock.close()
+        if self.__thread:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self):
+        while True:
+            sock = self.socket
+            if not sock:
+                break
+            try:
+                chunk = sock.recv(8192)
+            except (socket.error, ValueError, OSError):
+                break
+            if not chunk:
+                break
+            self.feed(chunk)
+
+    def feed(self, data):
+        '''
+        Parses the complete records in C{data}, keeping any incomplete one until more data arrives.
+        '''
+
+        self.__pending += data
+        nl = self.__pending.rfind(b'\n')
+        if nl == -1:
+            return
+        lines = self.__pending[:nl].decode('utf-8', errors='replace').split('\n')
+        del self.__pending[:nl + 1]
+        with self.__lock:
+            for line in lines:
+                try:
+                    self.parseLine(line.rstrip('\r'))
+                except Exception as ex:
+                    # a malformed or truncated record is skipped, not to stop sampling
+                    print("DeviceSampler: skipping '%s': %s" % (line.rstrip('\r'), ex), file=sys.stderr)
+
+    def parseLine(self, line):
+        if self.__meminfoLines is not None:
+            if line.startswith(DeviceSampler.END + '|'):
+                lines = self.__meminfoLines
+                self.__meminfoLines = None
+                self.__appendMeminfo(self.__meminfoUptime, '\n'.join(lines))
+            else:
+                self.__meminfoLines.append(line)
+        elif line.startswith(DeviceSampler.SAMPLE + '|'):
+            self.__appendSample(line.split('|'))
+        elif line.startswith(DeviceSampler.MEMINFO + '|'):
+            self.__meminfoUptime = float(line[2:])
+            self.__meminfoLines = []
+        elif DEBUG and line:
+            print("DeviceSampler: unexpected line '%s'" % line, file=sys.stderr)
+
+    @staticmethod
+    def __grow(array, count):
+        import numpy
+
+        grown = numpy.empty((2 * len(array), array.shape[1]), dtype=array.dtype)
+        grown[:count] = array[:count]
+        return grown
+
+    def __appendSample(self, fields):
+        if len(fields) != 5:
+            return
+        if self.__count == len(self.__samples):
+            self.__samples = DeviceSampler.__grow(self.__samples, self.__count)
+        row = self.__samples[self.__count]
+        row[:] = float('nan')
+        columns = DeviceSampler.COLUMNS
+        row[0] = float(fields[1])
+        cpu = [int(v) for v in fields[2].split()]
+        row[1] = sum(cpu[:8])
+        # idle + iowait
+        row[2] = cpu[3] + (cpu[4] if len(cpu) > 4 else 0)
+        pst = fields[3]
+        if pst:
+            # the process name, between parenthesis, may contain spaces
+            rest = pst[pst.rfind(')') + 2:].split()
+            row[3] = int(rest[11]) + int(rest[12])
+            row[4] = int(rest[21]) * DeviceSampler.PAGE_SIZE_KB
+        for kv in fields[4].split():
+            k, _, v = kv.partition(':')
+            name = DeviceSampler.PROC_MEMINFO_FIELDS.get(k + ':')
+            if name:
+                row[columns.index(name)] = int(v)
+        self.__count += 1
+
+    def __appendMeminfo(self, uptime, out):
+        if self.__meminfoCount == len(self.__meminfo):
+            self.__meminfo = DeviceSampler.__grow(self.__meminfo, self.__meminfoCount)
+        row = self.__meminfo[self.__meminfoCount]
+        row[:] = float('nan')
+        row[0] = uptime
+        for name, value in Dumpsys.parseMeminfoValues(out).items():
+            row[1 + MeminfoSampler.FIELDS.index(name)] = value
+        self.__meminfoCount += 1
+
+    def getSampleCount(self):
+        return self.__count
+
+    def getSamples(self, column=None):
+        '''
+        @param column: one of L{COLUMNS}, or C{None} for all of them
+        @return: the numpy array of the samples, with one column per L{COLUMNS} if C{column} is C{None}
+        '''
+
+        with self.__lock:
+            samples = self.__samples[:self.__count]
+            if column is not None:
+                samples = samples[:, DeviceSampler.COLUMNS.index(column)]
+            return samples.copy()
+
+    def getMeminfo(self, field=None):
+        '''
+        @param field: one of L{MeminfoSampler.FIELDS}, or C{None} for all of them
+        @return: the tuple (device uptimes, values) of the C{dumpsys meminfo} samples
+        '''
+
+        with self.__lock:
+            meminfo = self.__meminfo[:self.__meminfoCount].copy()
+        values = meminfo[:, 1:]
+        if field is not None:
+            values = values[:, MeminfoSampler.FIELDS.index(field)]
+        return meminfo[:, 0], values
+
+    def getCpuUsage(self):
+        '''
+        Computes the CPU usage between consecutive samples.
+
+        @return: the tuple (device uptimes, system usage %, process usage %), process usage is relative to all the
+        CPUs
+        '''
+
+        import numpy
+
+        samples = self.getSamples()
+        dTotal = numpy.diff(samples[:, 1])
+        dTotal[dTotal == 0] = numpy.nan
+        system = 100.0 * (1 - numpy.diff(samples[:, 2]) / dTotal)
+        process = 100.0 * numpy.diff(samples[:, 3]) / dTotal
+        return samples[1:, 0], system, process
+
+    def plot(self, column='cpu', filename=None):
+        '''
+        Plots a time series with L{Plot}.
+
+        @param column: one of L{COLUMNS}, C{'cpu'} for the system CPU usage or C{'procCpuUsage'} for the process
+        usage
+        @param filename: the file where the plot is saved, if C{None} it is shown
+        '''
+
+        from ..plot import Plot
+
+        if column == 'cpu':
+            values = self.getCpuUsage()[1]
+        elif column == 'procCpuUsage':
+            values = self.getCpuUsage()[2]
+        else:
+            values = self.getSamples(column)
+        plot = Plot().extend(values)
+        plot.plot(filename=filename)
+        return plot
@@ -0,0 +1,147 @@
+'''
+Copyright (C) 2012-2018  Diego Torres Milano
+Created on Oct 18, 2018
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@author: Diego Torres Milano
+'''
+from __future__ import print_function
+
+import re
+import sys
+import time
+
+__version__ = '15.4.0'
+
+DEBUG = False
+
+
+class DeviceState:
+    '''
+    Snapshot of the device state.
+
+    Screen on, lock, keyboard, orientation, focused window and top activity are obtained running all the
+    needed C{dumpsys} commands in a single shell invocation, and parsed once.
+    When the device supports it, the outputs are filtered there so only the lines parsed are transferred.
+    '''
+
+    SECTION_MARKER = '__AVC_SECTION__'
+
+    SECTIONS = [
+        ('policy', 'dumpsys window policy', 'mScreenOnFully=|screenState=|mShowingLockscreen=|mDreamingLockscreen='),
+        ('input_method', 'dumpsys input_method', 'mInputShown='),
+        ('display', 'dumpsys display', r'DisplayViewport\{valid=true|DisplayInfo\{'),
+        ('windows', 'dumpsys window windows', 'mCurrentFocus=|mFocusedApp='),
+    ]
+    ''' The (name, command, grep pattern of the lines parsed) of the sections obtained from the device, in order '''
+
+    SCREEN_ON_FULLY_RE = re.compile(r'mScreenOnFully=(true|false)')
+    SCREEN_STATE_RE = re.compile(r'screenState=SCREEN_STATE_(ON|OFF)')
+    SHOWING_LOCKSCREEN_RE = re.compile(r'mShowingLockscreen=(true|false)')
+    DREAMING_LOCKSCREEN_RE = re.compile(r'mDreamingLockscreen=(true|false)')
+    INPUT_SHOWN_RE = re.compile(r'mInputShown=(true|false)')
+    VIEWPORT_ORIENTATION_RE = re.compile(r'DisplayViewport\{valid=true, .*orientation=(\d+)')
+    DISPLAY_INFO_ROTATION_RE = re.compile(r'DisplayInfo\{.*, rotation (\d+)')
+    CURRENT_FOCUS_RE = re.compile(r'mCurrentFocus=Window\{[0-9a-f]+ (?:u\d+ )?([^ }]+)\}')
+    FOCUSED_APP_RE = re.compile(r'mFocusedApp=.*ActivityRecord\{[0-9a-f]+ (?:u\d+ )?([^ }]+)')
+
+    def __init__(self, adbclient=None, out=None):
+        '''
+        Constructor
+
+        @type adbclient: AdbClient
+        @param adbclient: if not C{None}, the state is obtained from this client's device
+        @param out: if not C{None}, the output of L{getCommand()} to parse instead of obtaining it
+        '''
+
+        self.screenOn = None
+        self.locked = None
+        self.keyboardShown = None
+        self.orientation = None
+        self.focusedWindowName = None
+        self.topActivityName = None
+        self.timestamp = time.time()
+        ''' The time the state was obtained '''
+        if out is None and adbclient:
+            out = adbclient.shell(DeviceState.getCommand(filtered=adbclient.isOnDeviceFilteringAvailable()))
+        if out is not None:
+            self.parse(out)
+
+    @staticmethod
+    def getCommand(filtered=False):
+        '''
+        @param filtered: if C{True}, the output of every section is filtered on the device with C{grep}
+        @return: the shell command line obtaining all the sections
+        '''
+
+        return '; '.join('echo %s%s; %s%s' % (DeviceState.SECTION_MARKER, name, cmd,
+                                               " | grep -E '%s'" % pattern if filtered else '')
+                         for name, cmd, pattern in DeviceState.SECTIONS)
+
+    @staticmethod
+    def splitSections(out):
+        '''
+        Splits the output of L{getCommand()}.
+
+        @return: the map of section names to their output
+        '''
+
+        sections = {}
+        for part in out.split(DeviceState.SECTION_MARKER)[1:]:
+            name, _, body = part.partition('\n')
+            sections[name.rstrip('\r')] = body
+        return sections
+
+    def parse(self, out):
+        sections = DeviceState.splitSections(out)
+        if DEBUG:
+            print("DeviceState: sections=%s" % list(sections.keys()), file=sys.stderr)
+
+        policy = sections.get('policy', '')
+        m = DeviceState.SCREEN_ON_FULLY_RE.search(policy) or DeviceState.SCREEN_STATE_RE.search(policy)
+        if m:
+            self.screenOn = m.group(1) in ('true', 'ON')
+        m = DeviceState.SHOWING_LOCKSCREEN_RE.search(policy) or DeviceState.DREAMING_LOCKSCREEN_RE.search(policy)
+        if m:
+            self.locked = m.group(1) == 'true'
+
+        m = DeviceState.INPUT_SHOWN_RE.search(sections.get('input_method', ''))
+        self.keyboardShown = bool(m) and m.group(1) == 'true'
+
+        display = sections.get('display', '')
+        m = DeviceState.VIEWPORT_ORIENTATION_RE.search(display) or DeviceState.DISPLAY_INFO_ROTATION_RE.search(
+            display)
+        if m:
+            self.orientation = int(m.group(1))
+
+        windows = sections.get('windows', '')
+        m = DeviceState.CURRENT_FOCUS_RE.search(windows)
+        if m:
+            self.focusedWindowName = m.group(1)
+        m = DeviceState.FOCUSED_APP_RE.search(windows)
+        if m:
+            self.topActivityName = m.group(1)
+
+    def isExpired(self, ttl):
+        '''
+        @param ttl: the time to live in seconds
+        @return: C{True} if the state is older than C{ttl}
+        '''
+
+        return time.time() - self.timestamp >= ttl
+
+    def __str__(self):
+        return "DeviceState(screenOn=%s, locked=%s, keyboardShown=%s, orientation=%s, focusedWindowName=%s, " \
+               "topActivityName=%s)" % (self.screenOn, self.locked, self.keyboardShown, self.orientation,
+                                        self.focusedWindowName, self.topActivityName)
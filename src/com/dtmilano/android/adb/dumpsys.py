@@ -18,16 +18,30 @@ limitations under the License.
 '''
 from __future__ import print_function
 
+import collections
+import gzip
+import io
+import os
 import re
 import sys
+import threading
 from _warnings import warn
 
+from .dumpsysdocument import DumpsysDocument
+
 __version__ = '15.4.0'
 
 DEBUG = False
 
 
 class Dumpsys:
+    ACTIVITY = 'activity'
+    BATTERY = 'battery'
+    INPUT = 'input'
+    PACKAGE = 'package'
+    WINDOW = 'window'
+    LIST = '-l'
+
     FRAMESTATS = 'framestats'
     GFXINFO = 'gfxinfo'
     MEMINFO = 'meminfo'
@@ -42,7 +56,51 @@ class Dumpsys:
     INTENDED_VSYNC = 1
     FRAME_COMPLETED = 13
 
-    def __init__(self, adbclient, subcommand, *args):
+    MEMINFO_FIELDS = {
+        'TOTAL': 'total',
+        'Native Heap': 'nativeHeap',
+        'Dalvik Heap': 'dalvikHeap',
+        'Views': 'views',
+        'Activities': 'activities',
+        'AppContexts': 'appContexts',
+        'ViewRootImpl': 'viewRootImpl',
+    }
+    ''' Maps the labels in the meminfo output to the names of the values '''
+
+    MEMINFO_RE = re.compile(
+        r'(?:(TOTAL|Native Heap|Dalvik Heap)|(Views|Activities|AppContexts|ViewRootImpl):)[ \t]*(\d+)')
+    ''' Matches all the meminfo values in a single pass, the first occurrence of every label is the one used '''
+
+    PROFILEDATA = '---PROFILEDATA---'
+
+    REFRESH_PERIOD_60HZ = 10 ** 9 / 60.0
+    ''' Refresh period in ns of a 60Hz display '''
+
+    FRAMESTATS_STAGES = [
+        ('vsync', 'IntendedVsync', 'Vsync'),
+        ('input', 'HandleInputStart', 'AnimationStart'),
+        ('animation', 'AnimationStart', 'PerformTraversalsStart'),
+        ('layoutMeasure', 'PerformTraversalsStart', 'DrawStart'),
+        ('draw', 'DrawStart', 'SyncStart'),
+        ('sync', 'SyncStart', 'IssueDrawCommandsStart'),
+        ('issueDrawCommands', 'IssueDrawCommandsStart', 'SwapBuffers'),
+        ('swapBuffers', 'SwapBuffers', 'FrameCompleted'),
+        ('total', 'IntendedVsync', 'FrameCompleted'),
+    ]
+    ''' The (name, start column, end column) of the frame stages '''
+
+    def __init__(self, adbclient, subcommand, *args, loader=None):
+        '''
+        Constructor
+
+        @type adbclient: AdbClient
+        @param adbclient: the client running C{dumpsys}
+        @param subcommand: the service
+        @param args: the service arguments
+        @param loader: if not C{None}, instead of running C{dumpsys}, the callable returning the output. It is
+        called, and the output parsed, when first accessed (see L{get()}, L{getOutput()} and L{getDocument()}).
+        '''
+
         self.nativeHeap = -1
         self.dalvikHeap = -1
         self.total = 0
@@ -52,6 +110,14 @@ class Dumpsys:
         self.viewRootImpl = -1
         self.gfxProfileData = []
         self.framestats = []
+        self.framestatsArray = None
+        ''' The gfxinfo framestats of all the frames as a numpy structured array with one int64 field per column '''
+        self.subcommand = subcommand
+        self.args = args
+        self.out = None
+        ''' The dumpsys output '''
+        self.__document = None
+        self.__loader = loader
         if args:
             args_str = ' '.join(args)
         else:
@@ -59,21 +125,57 @@ class Dumpsys:
         if adbclient:
             cmd = 'dumpsys ' + subcommand + (' ' + args_str if args_str else '')
             self.parse(adbclient.shell(cmd), subcommand, *args)
-        else:
+        elif loader is None:
             warn('No adbclient specified')
 
     @staticmethod
     def listSubCommands(adbclient):
-        return Dumpsys(adbclient, '-l')
+        return Dumpsys(adbclient, Dumpsys.LIST)
 
     @staticmethod
     def meminfo(adbclient, args=None):
         return Dumpsys(adbclient, Dumpsys.MEMINFO, args)
 
     def get(self, name):
+        if self.__loader:
+            self.parse(self.getOutput(), self.subcommand, *self.args)
         return getattr(self, name)
 
+    def getOutput(self):
+        '''
+        @return: the dumpsys output, obtained from the loader the first time if there is one
+        '''
+
+        if self.out is None and self.__loader:
+            self.out = self.__loader()
+        return self.out
+
+    def getDocument(self):
+        '''
+        Indexes the sections of the output, once.
+
+        @rtype: DumpsysDocument
+        @return: the document whose sections are parsed when accessed
+        '''
+
+        if self.__document is None:
+            if self.getOutput() is None:
+                raise RuntimeError('No dumpsys output')
+            self.__document = DumpsysDocument(self.out, self.subcommand)
+        return self.__document
+
+    def getSection(self, name):
+        '''
+        @return: the section of the output, parsed by the parser of the service (see L{DumpsysDocument})
+        '''
+
+        return self.getDocument().getSection(name)
+
     def parse(self, out, subcommand, *args):
+        if out is not self.out:
+            self.out = out
+            self.__document = None
+        self.__loader = None
         if subcommand == Dumpsys.MEMINFO:
             self.parseMeminfo(out)
         elif subcommand == Dumpsys.GFXINFO:
@@ -84,75 +186,251 @@ class Dumpsys:
                 self.parseGfxinfoFramestats(out)
             else:
                 self.parseGfxinfo(out)
-        elif '-l':
+        elif subcommand == Dumpsys.LIST:
             # list dumpsys subcommands
             return out
-        else:
-            pass
 
     def parseMeminfo(self, out):
-        m = re.search('Native Heap[ \t]*(\d+)', out, re.MULTILINE)
-        if m:
-            self.nativeHeap = int(m.group(1))
-        m = re.search('Dalvik Heap[ \t]*(\d+)', out, re.MULTILINE)
-        if m:
-            self.dalvikHeap = int(m.group(1))
-        m = re.search('Views:[ \t]*(\d+)', out, re.MULTILINE)
-        if m:
-            self.views = int(m.group(1))
-        m = re.search('Activities:[ \t]*(\d+)', out, re.MULTILINE)
-        if m:
-            self.activities = int(m.group(1))
-        m = re.search('AppContexts:[ \t]*(\d+)', out, re.MULTILINE)
-        if m:
-            self.appContexts = int(m.group(1))
-        m = re.search('ViewRootImpl:[ \t]*(\d+)', out, re.MULTILINE)
-        if m:
-            self.viewRootImpl = int(m.group(1))
-
-        m = re.search('TOTAL[ \t]*(\d+)', out, re.MULTILINE)
-        if m:
-            self.total = int(m.group(1))
-        else:
+        values = Dumpsys.parseMeminfoValues(out)
+        if 'total' not in values:
             raise RuntimeError('Cannot find TOTAL in "' + out + '"')
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    @staticmethod
+    def parseMeminfoValues(out):
+        '''
+        Parses the output of C{dumpsys meminfo <pkg>}.
+
+        @return: the map of the names in L{MEMINFO_FIELDS} to the values found
+        '''
+
+        values = {}
+        for m in Dumpsys.MEMINFO_RE.finditer(out):
+            name = Dumpsys.MEMINFO_FIELDS[m.group(1) or m.group(2)]
+            if name not in values:
+                values[name] = int(m.group(3))
+                if len(values) == len(Dumpsys.MEMINFO_FIELDS):
+                    break
+        return values
 
     def parseGfxinfo(self, out):
         pass
 
     def parseGfxinfoFramestats(self, out):
-        pd = '---PROFILEDATA---'
+        rows, columns = Dumpsys.extractFramestats(out)
+        self.framestatsArray = Dumpsys.framestatsToArray(rows, columns)
+        # Only keep lines with Flags=0
+        # If this is non-zero the row should be ignored, as the frame has been determined as being an
+        # outlier from normal performance, where it is expected that layout & draw take longer than
+        # 16ms.
+        # See https://developer.android.com/training/testing/performance.html#timing-info for details
+        # on format
+        valid = (self.framestatsArray['Flags'] == 0).nonzero()[0]
+        self.gfxProfileData = [rows[i].split(',')[:len(columns)] for i in valid]
+        if DEBUG:
+            print('gfxProfileData={}'.format(self.gfxProfileData), file=sys.stderr)
+        # All done! The total time spent working on this frame can be computed by doing
+        # FRAME_COMPLETED - INTENDED_VSYNC.
+        self.framestats = Dumpsys.framestatsDurations(self.framestatsArray)['total'].tolist()
+
+    @staticmethod
+    def extractFramestats(out):
+        '''
+        Extracts the framestats from the PROFILEDATA blocks in the output of C{dumpsys gfxinfo <pkg> framestats}.
+
+        @return: the tuple (non blank CSV lines without header, column names)
+        '''
+
+        pd = Dumpsys.PROFILEDATA
         l = re.findall(r'%s.*?%s' % (pd, pd), out, re.DOTALL)
-        if l:
-            s = ''
-            for e in l:
-                if not e:
-                    continue
-                sl = e.splitlines()
-                for s in sl:
-                    if s == pd:
-                        continue
-                    pda = s.split(',')
-                    if pda[Dumpsys.FLAGS] == 'Flags':
-                        if pda[Dumpsys.INTENDED_VSYNC] != 'IntendedVsync' and pda[
-                                Dumpsys.FRAME_COMPLETED] != 'FrameCompleted':
-                            raise RuntimeError('Unsupported gfxinfo version')
-                        continue
-                    if pda[Dumpsys.FLAGS] == '0':
-                        # Only keep lines with Flags=0
-                        # If this is non-zero the row should be ignored, as the frame has been determined as being an
-                        # outlier from normal performance, where it is expected that layout & draw take longer than
-                        # 16ms.
-                        # See https://developer.android.com/training/testing/performance.html#timing-info for details
-                        # on format
-                        if DEBUG:
-                            print('pda={}'.format(pda), file=sys.stderr)
-                        self.gfxProfileData.append(pda[:-1])
-                        # All done! The total time spent working on this frame can be computed by doing
-                        # FRAME_COMPLETED - INTENDED_VSYNC.
-                        self.framestats.append(
-                            (int(pda[Dumpsys.FRAME_COMPLETED]) - int(pda[Dumpsys.INTENDED_VSYNC])) / 10 ** 6)
-        else:
+        if not l:
             raise RuntimeError('No profile data found')
+        columns = None
+        rows = []
+        for e in l:
+            sl = e.splitlines()
+            if len(sl) < 3:
+                continue
+            # first and last lines are the PROFILEDATA markers, then comes the header
+            header = [c for c in sl[1].split(',') if c]
+            if columns is None:
+                if 'Flags' not in header or 'IntendedVsync' not in header or 'FrameCompleted' not in header:
+                    raise RuntimeError('Unsupported gfxinfo version')
+                columns = header
+            elif header != columns:
+                raise RuntimeError('Inconsistent gfxinfo framestats columns')
+            # blank lines would shift the rows of framestatsToArray(), which skips them
+            rows.extend(r for r in sl[2:-1] if r.strip())
+        if columns is None:
+            raise RuntimeError('No profile data found')
+        return rows, columns
+
+    @staticmethod
+    def framestatsToArray(rows, columns):
+        '''
+        Converts framestats CSV rows into a numpy structured array.
+
+        @param rows: the CSV lines, without header
+        @param columns: the column names
+        @return: the structured array with one int64 field per column
+        '''
+
+        import numpy
+
+        n = len(columns)
+        values = numpy.array(','.join(rows).replace(',', ' ').split(), dtype=numpy.int64)
+        if values.size % n != 0:
+            raise RuntimeError('Malformed gfxinfo framestats: %d values for %d columns' % (values.size, n))
+        dtype = numpy.dtype([(c, numpy.int64) for c in columns])
+        return numpy.ascontiguousarray(values.reshape(-1, n)).view(dtype).reshape(-1)
+
+    @staticmethod
+    def mergeFramestats(*arrays):
+        '''
+        Merges framestats arrays, usually obtained from consecutive dumps, dropping the frames that are repeated.
+        Frames are identified by their C{IntendedVsync}.
+
+        @return: the merged array sorted by C{IntendedVsync}
+        '''
+
+        import numpy
+
+        arrays = [a for a in arrays if a is not None and len(a) > 0]
+        if not arrays:
+            return None
+        merged = numpy.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+        _, first = numpy.unique(merged['IntendedVsync'], return_index=True)
+        return merged[first]
+
+    @staticmethod
+    def framestatsDurations(array, validOnly=True):
+        '''
+        Computes the duration of every stage (L{FRAMESTATS_STAGES}) of every frame.
+
+        @param array: the framestats array
+        @param validOnly: only consider the frames with C{Flags == 0}
+        @return: the map of stage names to numpy arrays of durations in ms
+        '''
+
+        if validOnly:
+            array = array[array['Flags'] == 0]
+        names = array.dtype.names
+        return dict((stage, (array[end] - array[start]) / 10.0 ** 6) for stage, start, end in
+                    Dumpsys.FRAMESTATS_STAGES if start in names and end in names)
+
+    @staticmethod
+    def framestatsJank(array, refreshPeriod=REFRESH_PERIOD_60HZ, validOnly=True):
+        '''
+        Determines the janky frames, the ones that took longer than the refresh period to complete.
+
+        @param refreshPeriod: the display refresh period in ns
+        @return: the numpy boolean array flagging the janky frames
+        '''
+
+        if validOnly:
+            array = array[array['Flags'] == 0]
+        return (array['FrameCompleted'] - array['IntendedVsync']) > refreshPeriod
+
+    @staticmethod
+    def framestatsSummary(array, refreshPeriod=REFRESH_PERIOD_60HZ):
+        '''
+        Summarizes the frames with C{Flags == 0}.
+
+        @return: the map containing the number of C{frames}, C{janky} frames, C{jankPercent} and the C{p50}, C{p90},
+        C{p99} and C{max} frame times in ms
+        '''
+
+        import numpy
+
+        total = Dumpsys.framestatsDurations(array)['total'] if array is not None and len(array) > 0 else []
+        frames = len(total)
+        if frames == 0:
+            return {'frames': 0, 'janky': 0, 'jankPercent': 0.0, 'p50': 0.0, 'p90': 0.0, 'p99': 0.0, 'max': 0.0}
+        janky = int(numpy.count_nonzero(total > refreshPeriod / 10.0 ** 6))
+        p50, p90, p99 = numpy.percentile(total, [50, 90, 99])
+        return {'frames': frames, 'janky': janky, 'jankPercent': 100.0 * janky / frames, 'p50': float(p50),
+                'p90': float(p90), 'p99': float(p99), 'max': float(total.max())}
+
+    def getFramestatsSummary(self, refreshPeriod=REFRESH_PERIOD_60HZ):
+        return Dumpsys.framestatsSummary(self.framestatsArray, refreshPeriod)
+
+    @staticmethod
+    def collect(adbclient, services, directory=None, maxConnections=8, timeout=-1):
+        '''
+        Obtains several services in parallel, each one over its own connection (see L{AdbClient.openStream()}).
+
+        The outputs are compressed as they arrive, into memory or into files, and are decompressed and parsed only
+        when accessed, so a diagnostics snapshot takes about as long as the slowest service.
+
+        @param services: the services, with their arguments if any (i.e. C{['window', 'gfxinfo com.example']})
+        @param directory: if not C{None}, the outputs are saved there as C{dumpsys-<service>.txt.gz}, otherwise
+        they are kept in memory
+        @param maxConnections: the maximum number of simultaneous connections
+        @param timeout: the socket timeout in seconds, C{None} for no timeout or -1 to use the client timeout
+        @return: the map of services to L{Dumpsys} loaded on first access. If obtaining a service failed,
+        accessing it raises C{RuntimeError}.
+        '''
+
+        pending = collections.deque(services)
+        sinks = collections.OrderedDict()
+        for service in services:
+            if directory:
+                sinks[service] = os.path.join(directory, 'dumpsys-%s.txt.gz' % re.sub(r'\W+', '_', service))
+            else:
+                sinks[service] = io.BytesIO()
+        errors = {}
+
+        def fetch():
+            while True:
+                try:
+                    service = pending.popleft()
+                except IndexError:
+                    return
+                sink = sinks[service]
+                try:
+                    sock = adbclient.openStream('shell:dumpsys %s' % service, timeout=timeout)
+                    try:
+                        with gzip.GzipFile(filename=sink if directory else '', mode='wb',
+                                           fileobj=None if directory else sink) as gz:
+                            while True:
+                                chunk = sock.recv(65536)
+                                if not chunk:
+                                    break
+                                gz.write(chunk)
+                    finally:
+                        sock.close()
+                except Exception as ex:
+                    errors[service] = ex
+                if DEBUG:
+                    print("collect: %s %s" % (service, errors.get(service, 'done')), file=sys.stderr)
+
+        workers = [threading.Thread(target=fetch, name='Dumpsys.collect-%d' % i) for i in
+                   range(max(1, min(maxConnections, len(services))))]
+        for worker in workers:
+            worker.daemon = True
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        def loader(service, sink):
+            def load():
+                if service in errors:
+                    raise RuntimeError("Cannot obtain dumpsys %s: %s" % (service, errors[service]))
+                if directory:
+                    with gzip.open(sink, 'rb') as f:
+                        data = f.read()
+                else:
+                    data = gzip.decompress(sink.getvalue())
+                return data.decode('utf-8', errors='replace')
+
+            return load
+
+        dumpsys = collections.OrderedDict()
+        for service, sink in sinks.items():
+            words = service.split()
+            dumpsys[service] = Dumpsys(None, words[0], *words[1:], loader=loader(service, sink))
+        return dumpsys
 
     @staticmethod
     def gfxinfo(adbclient, *args):
@@ -0,0 +1,319 @@
+'''
+Copyright (C) 2012-2018  Diego Torres Milano
+Created on Oct 18, 2018
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@author: Diego Torres Milano
+'''
+from __future__ import print_function
+
+import re
+import sys
+
+__version__ = '15.4.0'
+
+DEBUG = False
+
+
+class DumpsysDocument:
+    '''
+    The output of a C{dumpsys} service divided in sections.
+
+    The section headers, the lines starting at the first column, and the ranges of their bodies are indexed in
+    one pass when the document is created. A section is parsed only when it is accessed, by the parser registered
+    for the service (see L{registerParser()}), and the result is cached.
+
+    Usage::
+
+        document = Dumpsys(device, Dumpsys.WINDOW).getDocument()
+        print(document['windows']['mCurrentFocus'])
+    '''
+
+    HEADER_RE = re.compile(r'^(?![\s\d-])([^,\r\n]+?)\r?$', re.MULTILINE)
+    ''' Matches the section headers, lines starting at the first column that are not rows of values '''
+
+    HEADER_RES = {
+        'gfxinfo': re.compile(r'^(\*\* .* \*\*|Applications Graphics Acceleration Info:)\r?$', re.MULTILINE),
+        'meminfo': re.compile(r'^(\*\* .* \*\*|Applications Memory Usage.*|Total .* by .*:)\r?$', re.MULTILINE),
+    }
+    ''' The header regexes of the services whose sections contain lines starting at the first column '''
+
+    ALIAS_RE = re.compile(r'\(dumpsys \S+ (\S+)\)|^\*\* .* \[([^\]]+)\] \*\*$')
+    ''' Matches the short names of the sections, like C{activities} in
+    C{ACTIVITY MANAGER ACTIVITIES (dumpsys activity activities)} or the package in
+    C{** Graphics info for pid 1234 [com.example] **} '''
+
+    PROPERTY_RE = re.compile(r'^\s*([A-Za-z][^:=\r\n]*?): +(\S[^\r\n]*?)\s*$', re.MULTILINE)
+    ASSIGNMENT_RE = re.compile(r'(?:^|\s)([A-Za-z][\w.]*)=(\w*\{[^}\r\n]*\}|[^\s,}]+)')
+    INT_RE = re.compile(r'-?\d+$')
+
+    PARSERS = {}
+    ''' Maps service names to the section parsers, callables receiving the section name and text '''
+
+    def __init__(self, out, service=None):
+        '''
+        Constructor
+
+        @param out: the C{dumpsys} output
+        @param service: the service, selecting the header regex and the section parser
+        '''
+
+        self.out = out
+        self.service = service
+        self.sections = []
+        ''' The (name, start, end) of the sections, in order. C{start} and C{end} are the offsets of the body. '''
+        self.index = {}
+        ''' Maps section names and aliases to their position in L{sections}, the first one if repeated '''
+        self.__cache = {}
+        self.__buildIndex()
+
+    def __buildIndex(self):
+        headerRE = DumpsysDocument.HEADER_RES.get(self.service, DumpsysDocument.HEADER_RE)
+        previous = None
+        for m in headerRE.finditer(self.out):
+            if previous:
+                self.__addSection(previous.group(1), previous.end(), m.start())
+            previous = m
+        if previous:
+            self.__addSection(previous.group(1), previous.end(), len(self.out))
+        if DEBUG:
+            print("DumpsysDocument: %d sections" % len(self.sections), file=sys.stderr)
+
+    def __addSection(self, header, start, end):
+        name = header.strip().rstrip(':')
+        i = len(self.sections)
+        self.sections.append((name, start, end))
+        self.index.setdefault(name, i)
+        m = DumpsysDocument.ALIAS_RE.search(name)
+        if m:
+            self.index.setdefault(m.group(1) or m.group(2), i)
+
+    @staticmethod
+    def registerParser(service, parser):
+        '''
+        Registers the section parser of a service.
+
+        @param parser: the callable receiving the section name and text and returning the parsed section
+        '''
+
+        DumpsysDocument.PARSERS[service] = parser
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __getitem__(self, name):
+        return self.getSection(name)
+
+    def __len__(self):
+        return len(self.sections)
+
+    def getSectionNames(self):
+        return [s[0] for s in self.sections]
+
+    def getText(self, name):
+        '''
+        @return: the body of the section, without its header
+        '''
+
+        if name not in self.index:
+            raise KeyError("Section '%s' not found" % name)
+        _, start, end = self.sections[self.index[name]]
+        return self.out[start:end]
+
+    def getSection(self, name):
+        '''
+        Parses the section, once.
+
+        @return: the section parsed by the parser of the service, or L{parseProperties()} if there is none
+        '''
+
+        if name not in self.index:
+            raise KeyError("Section '%s' not found" % name)
+        i = self.index[name]
+        if i not in self.__cache:
+            parser = DumpsysDocument.PARSERS.get(self.service, DumpsysDocument.parseProperties)
+            self.__cache[i] = parser(self.sections[i][0], self.getText(name))
+        return self.__cache[i]
+
+    @staticmethod
+    def value(v):
+        '''
+        Converts integers and booleans, leaves everything else as strings.
+        '''
+
+        if v in ('true', 'false'):
+            return v == 'true'
+        if DumpsysDocument.INT_RE.match(v):
+            return int(v)
+        return v
+
+    @staticmethod
+    def parseProperties(name, text):
+        '''
+        The default section parser.
+
+        @return: the map of the C{key: value} lines and C{key=value} assignments, the first occurrence of every
+        key is kept
+        '''
+
+        properties = {}
+        for m in DumpsysDocument.PROPERTY_RE.finditer(text):
+            properties.setdefault(m.group(1), DumpsysDocument.value(m.group(2)))
+        for m in DumpsysDocument.ASSIGNMENT_RE.finditer(text):
+            properties.setdefault(m.group(1), DumpsysDocument.value(m.group(2)))
+        return properties
+
+    ACTIVITY_RECORD_RE = re.compile(r'ActivityRecord\{[0-9a-f]+ (?:u\d+ )?([^ }]+)')
+    RESUMED_ACTIVITY_RE = re.compile(
+        r'(?:mResumedActivity|ResumedActivity):? ActivityRecord\{[0-9a-f]+ (?:u\d+ )?([^ }]+)')
+
+    @staticmethod
+    def parseActivity(name, text):
+        '''
+        Parses the sections of C{dumpsys activity}.
+        Besides the properties, C{activityRecords} lists the components of the activity records, in order, and
+        C{resumedActivity} is the resumed one, if any.
+        '''
+
+        section = DumpsysDocument.parseProperties(name, text)
+        section['activityRecords'] = DumpsysDocument.ACTIVITY_RECORD_RE.findall(text)
+        m = DumpsysDocument.RESUMED_ACTIVITY_RE.search(text)
+        section['resumedActivity'] = m.group(1) if m else None
+        return section
+
+    WINDOW_RE = re.compile(r'^\s*Window #\d+ Window\{[0-9a-f]+ (?:u\d+ )?([^}]+)\}:', re.MULTILINE)
+
+    @staticmethod
+    def parseWindow(name, text):
+        '''
+        Parses the sections of C{dumpsys window}.
+        Besides the properties, C{windows} lists the window names, in order.
+        '''
+
+        section = DumpsysDocument.parseProperties(name, text)
+        section['windows'] = DumpsysDocument.WINDOW_RE.findall(text)
+        return section
+
+    INPUT_DEVICE_RE = re.compile(r'^( *)(?:Device )?(-?\d+): (\S.*?)\r?$')
+    INPUT_DEVICES_SECTIONS = ['Event Hub State', 'Input Reader State']
+
+    @staticmethod
+    def parseInput(name, text):
+        '''
+        Parses the sections of C{dumpsys input}.
+        Besides the properties, the sections listing the input devices have C{devices}, the map of the device ids to
+        their properties, including their C{name}.
+        '''
+
+        section = DumpsysDocument.parseProperties(name, text)
+        if name not in DumpsysDocument.INPUT_DEVICES_SECTIONS:
+            return section
+        devices = {}
+        lines = text.splitlines()
+        i = 0
+        while i < len(lines):
+            m = DumpsysDocument.INPUT_DEVICE_RE.match(lines[i])
+            i += 1
+            if not m:
+                continue
+            # the properties of the device are the lines indented below it
+            indent = len(m.group(1))
+            start = i
+            while i < len(lines) and (not lines[i].strip() or len(lines[i]) - len(lines[i].lstrip()) > indent):
+                i += 1
+            device = DumpsysDocument.parseProperties(m.group(3), '\n'.join(lines[start:i]))
+            device['name'] = m.group(3)
+            devices[int(m.group(2))] = device
+        section['devices'] = devices
+        return section
+
+    BATTERY_STATUS = {1: 'unknown', 2: 'charging', 3: 'discharging', 4: 'not charging', 5: 'full'}
+    BATTERY_HEALTH = {1: 'unknown', 2: 'good', 3: 'overheat', 4: 'dead', 5: 'over voltage',
+                      6: 'unspecified failure', 7: 'cold'}
+    ''' The names of the C{BatteryManager} status and health constants '''
+
+    @staticmethod
+    def parseBattery(name, text):
+        '''
+        Parses the sections of C{dumpsys battery}.
+        Besides the properties, there are the C{percent} of the C{level} relative to the C{scale}, the C{statusName}
+        and C{healthName}, the C{temperature}, which is in tenths of degree, in C{celsius} and C{plugged}, the list of
+        the power sources (i.e. C{['USB']}).
+        '''
+
+        section = DumpsysDocument.parseProperties(name, text)
+        level = section.get('level')
+        scale = section.get('scale')
+        if isinstance(level, int) and isinstance(scale, int) and scale > 0:
+            section['percent'] = 100.0 * level / scale
+        if 'status' in section:
+            section['statusName'] = DumpsysDocument.BATTERY_STATUS.get(section['status'], 'unknown')
+        if 'health' in section:
+            section['healthName'] = DumpsysDocument.BATTERY_HEALTH.get(section['health'], 'unknown')
+        if isinstance(section.get('temperature'), int):
+            section['celsius'] = section['temperature'] / 10.0
+        section['plugged'] = [k[:-len(' powered')] for k, v in section.items() if k.endswith(' powered') and v is True]
+        return section
+
+    PACKAGE_RE = re.compile(r'^  Package \[([^\]]+)\] \([0-9a-f]+\):\r?$', re.MULTILINE)
+
+    @staticmethod
+    def parsePackage(name, text):
+        '''
+        Parses the sections of C{dumpsys package}.
+
+        @return: for the C{Packages} section the map of package names to their properties, for the others the
+        properties
+        '''
+
+        if name != 'Packages':
+            return DumpsysDocument.parseProperties(name, text)
+        packages = {}
+        matches = list(DumpsysDocument.PACKAGE_RE.finditer(text))
+        for i, m in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+            packages[m.group(1)] = DumpsysDocument.parseProperties(m.group(1), text[m.end():end])
+        return packages
+
+    GRAPHICS_INFO_RE = re.compile(r'\*\* Graphics info for pid (\d+) \[([^\]]+)\] \*\*')
+    JANKY_FRAMES_RE = re.compile(r'^Janky frames: (\d+)', re.MULTILINE)
+
+    @staticmethod
+    def parseGfxinfo(name, text):
+        '''
+        Parses the sections of C{dumpsys gfxinfo}.
+        For the process sections, besides the properties, there are the C{pid}, C{package}, C{jankyFrames} and, if
+        the output contains framestats, C{framestats}, the L{Dumpsys.framestatsToArray()} array.
+        '''
+
+        section = DumpsysDocument.parseProperties(name, text)
+        m = DumpsysDocument.GRAPHICS_INFO_RE.match(name)
+        if m:
+            section['pid'] = int(m.group(1))
+            section['package'] = m.group(2)
+            m = DumpsysDocument.JANKY_FRAMES_RE.search(text)
+            if m:
+                section['jankyFrames'] = int(m.group(1))
+            from .dumpsys import Dumpsys
+            if Dumpsys.PROFILEDATA in text:
+                section['framestats'] = Dumpsys.framestatsToArray(*Dumpsys.extractFramestats(text))
+        return section
+
+
+DumpsysDocument.registerParser('activity', DumpsysDocument.parseActivity)
+DumpsysDocument.registerParser('window', DumpsysDocument.parseWindow)
+DumpsysDocument.registerParser('input', DumpsysDocument.parseInput)
+DumpsysDocument.registerParser('battery', DumpsysDocument.parseBattery)
+DumpsysDocument.registerParser('package', DumpsysDocument.parsePackage)
+DumpsysDocument.registerParser('gfxinfo', DumpsysDocument.parseGfxinfo)
@@ -0,0 +1,203 @@
+'''
+Copyright (C) 2012-2018  Diego Torres Milano
+Created on Oct 18, 2018
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@author: Diego Torres Milano
+'''
+from __future__ import print_function
+
+import contextlib
+import sys
+import threading
+
+from .dumpsys import Dumpsys
+
+__version__ = '15.4.0'
+
+DEBUG = False
+
+
+class FrameStatsMonitor:
+    '''
+    Collects the gfxinfo framestats of a package continuously.
+
+    C{dumpsys gfxinfo <pkg> framestats} only reports the last L{BUFFER_FRAMES} frames, so it is polled in the
+    background, over its own connection, often enough not to lose frames, and the new frames of every poll are
+    appended to a growing store.
+
+    Usage::
+
+        with FrameStatsMonitor(device, 'com.example') as monitor:
+            with monitor.interaction('scroll'):
+                device.drag((300, 1000), (300, 200), 500)
+        print(monitor.getInteractionSummaries())
+    '''
+
+    BUFFER_FRAMES = 120
+    ''' The number of frames kept by the device '''
+
+    def __init__(self, adbclient, pkg, interval=None, refreshPeriod=Dumpsys.REFRESH_PERIOD_60HZ):
+        '''
+        Constructor
+
+        @type adbclient: AdbClient
+        @param adbclient: the client of the device running the package
+        @param pkg: the package
+        @param interval: the polling interval in seconds, by default half the time the device takes to fill its
+        frame buffer, up to 1s
+        @param refreshPeriod: the display refresh period in ns
+        '''
+
+        self.adbclient = adbclient
+        self.pkg = pkg
+        self.refreshPeriod = refreshPeriod
+        if interval is None:
+            interval = min(1.0, FrameStatsMonitor.BUFFER_FRAMES * refreshPeriod / 10.0 ** 9 / 2)
+        self.interval = interval
+        self.interactions = []
+        ''' The (label, first frame index, end frame index) of the labelled interactions '''
+        self.gaps = 0
+        ''' The number of polls that may have missed frames because the device buffer was overrun '''
+        self.__chunks = []
+        self.__frames = 0
+        self.__lastVsync = None
+        self.__lock = threading.RLock()
+        self.__stopEvent = threading.Event()
+        self.__thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        '''
+        Resets the package gfxinfo and starts polling in the background.
+        '''
+
+        if self.__thread:
+            raise RuntimeError('FrameStatsMonitor already started')
+        Dumpsys.resetGfxinfo(self.adbclient, self.pkg)
+        self.__stopEvent.clear()
+        self.__thread = threading.Thread(target=self.__run, name='FrameStatsMonitor-%s' % self.pkg)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        '''
+        Stops polling and collects the frames rendered since the last poll.
+        '''
+
+        if self.__thread:
+            self.__stopEvent.set()
+            self.__thread.join()
+            self.__thread = None
+        self.poll()
+
+    def __run(self):
+        while not self.__stopEvent.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as ex:
+                print("FrameStatsMonitor: %s" % ex, file=sys.stderr)
+
+    def poll(self):
+        '''
+        Obtains the framestats and appends the frames not seen before.
+
+        @return: the number of new frames
+        '''
+
+        with self.__lock:
+            try:
+                rows, columns = Dumpsys.extractFramestats(
+                    self.adbclient.shellStream('dumpsys gfxinfo %s framestats' % self.pkg))
+            except RuntimeError as ex:
+                if 'No profile data' in str(ex):
+                    return 0
+                raise
+            array = Dumpsys.framestatsToArray(rows, columns)
+            array = array[array['IntendedVsync'].argsort(kind='mergesort')]
+            if self.__lastVsync is not None:
+                if len(array) >= FrameStatsMonitor.BUFFER_FRAMES and array['IntendedVsync'][0] > self.__lastVsync:
+                    self.gaps += 1
+                    if DEBUG:
+                        print("FrameStatsMonitor: frames may have been lost", file=sys.stderr)
+                array = array[array['IntendedVsync'] > self.__lastVsync]
+            if len(array) == 0:
+                return 0
+            self.__chunks.append(array)
+            self.__frames += len(array)
+            self.__lastVsync = array['IntendedVsync'][-1]
+            if DEBUG:
+                print("FrameStatsMonitor: %d new frames, %d total" % (len(array), self.__frames), file=sys.stderr)
+            return len(array)
+
+    def getFrameCount(self):
+        return self.__frames
+
+    def getFramestats(self, start=0, end=None):
+        '''
+        @param start: the index of the first frame
+        @param end: the index after the last frame, C{None} for all the frames collected
+        @return: the framestats structured array of the frames collected, or C{None} if there are none
+        '''
+
+        import numpy
+
+        with self.__lock:
+            if not self.__chunks:
+                return None
+            if len(self.__chunks) > 1:
+                self.__chunks = [numpy.concatenate(self.__chunks)]
+            return self.__chunks[0][start:end]
+
+    @contextlib.contextmanager
+    def interaction(self, label):
+        '''
+        Labels the frames rendered while the block runs.
+        The monitor should be started.
+
+        @param label: the interaction label
+        '''
+
+        self.poll()
+        start = self.__frames
+        try:
+            yield self
+        finally:
+            self.poll()
+            self.interactions.append((label, start, self.__frames))
+
+    def getSummary(self):
+        '''
+        @return: the L{Dumpsys.framestatsSummary()} of all the frames collected
+        '''
+
+        return Dumpsys.framestatsSummary(self.getFramestats(), self.refreshPeriod)
+
+    def getInteractionSummaries(self):
+        '''
+        @return: the list of (label, L{Dumpsys.framestatsSummary()}) of the labelled interactions, in order
+        '''
+
+        summaries = []
+        array = self.getFramestats()
+        for label, start, end in self.interactions:
+            frames = array[start:end] if array is not None else None
+            summaries.append((label, Dumpsys.framestatsSummary(frames, self.refreshPeriod)))
+        return summaries
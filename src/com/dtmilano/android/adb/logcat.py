@@ -0,0 +1,233 @@
+'''
+Copyright (C) 2012-2018  Diego Torres Milano
+Created on Oct 18, 2018
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@author: Diego Torres Milano
+'''
+from __future__ import print_function
+
+import collections
+import re
+import socket
+import sys
+import time
+
+__version__ = '15.4.0'
+
+DEBUG = False
+
+LogcatRecord = collections.namedtuple('LogcatRecord', ['timestamp', 'pid', 'tid', 'level', 'tag', 'message'])
+''' A parsed logcat line. C{timestamp} is C{None} and C{tid} is -1 when the format does not provide them. '''
+
+
+class Logcat:
+    '''
+    Streaming logcat reader.
+
+    Runs C{logcat} on the device over its own connection and parses the lines incrementally, as they arrive,
+    into L{LogcatRecord}s. Iterating over a C{Logcat} yields the records until the stream is closed.
+
+    Usage::
+
+        with device.logcat(['ActivityManager:I'], since=1) as logcat:
+            device.startActivity(component)
+            record = logcat.waitFor('Displayed', timeout=10)
+    '''
+
+    THREADTIME = 'threadtime'
+    TIME = 'time'
+    BRIEF = 'brief'
+
+    FORMAT_RES = {
+        THREADTIME: re.compile(
+            r'(?P<timestamp>\d\d-\d\d \d\d:\d\d:\d\d\.\d+)\s+(?P<pid>\d+)\s+(?P<tid>\d+)\s+(?P<level>[VDIWEFS])\s+'
+            r'(?P<tag>.*?)\s*: (?P<message>.*)'),
+        TIME: re.compile(
+            r'(?P<timestamp>\d\d-\d\d \d\d:\d\d:\d\d\.\d+)\s+(?P<level>[VDIWEFS])/(?P<tag>.*?)\(\s*(?P<pid>\d+)\): '
+            r'(?P<message>.*)'),
+        BRIEF: re.compile(r'(?P<level>[VDIWEFS])/(?P<tag>.*?)\(\s*(?P<pid>\d+)\): (?P<message>.*)'),
+    }
+    ''' Maps the supported logcat formats (C{-v}) to the regex parsing one line '''
+
+    def __init__(self, adbclient, filters=None, format=THREADTIME, since=None, dump=False, bufferSize=0,
+                 timeout=None):
+        '''
+        Constructor
+
+        @type adbclient: AdbClient
+        @param adbclient: the client whose device log is read
+        @param filters: logcat filter specs (i.e. C{['ActivityManager:I', '*:S']}), applied on the device
+        @param format: one of L{THREADTIME}, L{TIME} or L{BRIEF}
+        @param since: only print lines since this time (C{'MM-DD hh:mm:ss.mmm'}) or this number of most recent
+        lines (logcat C{-T})
+        @param dump: dump the current log and stop instead of waiting for new lines (logcat C{-d})
+        @param bufferSize: if greater than 0, keeps the last C{bufferSize} records in L{buffer}
+        @param timeout: the socket timeout in seconds, C{None} means block until lines arrive
+        '''
+
+        if format not in Logcat.FORMAT_RES:
+            raise ValueError("Unsupported logcat format '%s' (expecting one of %s)" % (
+                format, list(Logcat.FORMAT_RES.keys())))
+        self.format = format
+        self.lineRE = Logcat.FORMAT_RES[format]
+        self.buffer = collections.deque(maxlen=bufferSize) if bufferSize > 0 else None
+        ''' The ring buffer keeping the most recent records, if enabled '''
+        if isinstance(filters, str):
+            filters = filters.split()
+        cmd = 'logcat -v %s' % format
+        if dump:
+            cmd += ' -d'
+        if since is not None:
+            cmd += " -T '%s'" % since
+        if filters:
+            # quoted, otherwise the device shell expands '*:S'
+            cmd += ' ' + ' '.join("'%s'" % f for f in filters)
+        if DEBUG:
+            print("Logcat: %s" % cmd, file=sys.stderr)
+        self.socket = adbclient.openStream('shell:' + cmd, timeout=timeout)
+        self.timeout = self.socket.gettimeout()
+        ''' The socket timeout in seconds, used by L{next()} unless another one is given '''
+        self.__pending = bytearray()
+        self.__lines = collections.deque()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __iter__(self):
+        while True:
+            record = self.next()
+            if record is None:
+                return
+            yield record
+
+    def parse(self, line):
+        '''
+        Parses one logcat line.
+
+        @return: the L{LogcatRecord} or C{None} if the line is not a log line (i.e. C{--------- beginning of main})
+        '''
+
+        m = self.lineRE.match(line)
+        if not m:
+            return None
+        d = m.groupdict()
+        return LogcatRecord(d.get('timestamp'), int(d['pid']), int(d['tid']) if 'tid' in d else -1, d['level'],
+                            d['tag'], d['message'])
+
+    def next(self, timeout=-1):
+        '''
+        Reads the next record.
+
+        @param timeout: the time to wait for a record in seconds, C{None} to block or -1 to use the socket timeout
+        @return: the L{LogcatRecord} or C{None} if the stream ended or the timeout expired
+        '''
+
+        deadline = (time.time() + timeout) if timeout not in (-1, None) else None
+        if deadline is None and self.socket:
+            # a previous call may have left another timeout
+            self.socket.settimeout(self.timeout if timeout == -1 else None)
+        while True:
+            while self.__lines:
+                record = self.parse(self.__lines.popleft())
+                if record:
+                    if self.buffer is not None:
+                        self.buffer.append(record)
+                    return record
+            if not self.socket:
+                return None
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return None
+                self.socket.settimeout(remaining)
+            try:
+                chunk = self.socket.recv(8192)
+            except socket.timeout:
+                return None
+            if not chunk:
+                self.close()
+                if self.__pending:
+                    self.__lines.append(self.__pending.decode('utf-8', errors='replace').rstrip('\r'))
+                    self.__pending = bytearray()
+                continue
+            self.__pending += chunk
+            nl = self.__pending.rfind(b'\n')
+            if nl != -1:
+                complete = self.__pending[:nl].decode('utf-8', errors='replace')
+                del self.__pending[:nl + 1]
+                self.__lines.extend(l.rstrip('\r') for l in complete.split('\n'))
+
+    def drain(self, timeout=1):
+        '''
+        Discards the records already logged, reading until none arrives for C{timeout} seconds.
+
+        @return: the number of records discarded
+        '''
+
+        n = 0
+        while self.next(timeout=timeout) is not None:
+            n += 1
+        return n
+
+    def waitFor(self, pattern, timeout=10, tag=None):
+        '''
+        Waits for a record whose message matches C{pattern}.
+
+        @param pattern: the regex (string or compiled) searched in the message
+        @param timeout: the timeout in seconds
+        @param tag: if not C{None}, the record tag should also be equal to it
+        @return: the matching L{LogcatRecord} or C{None} if the timeout expired
+        '''
+
+        if isinstance(pattern, str):
+            pattern = re.compile(pattern)
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            record = self.next(timeout=remaining)
+            if record is None:
+                return None
+            if (tag is None or record.tag == tag) and pattern.search(record.message):
+                return record
+
+    def waitForAny(self, patterns, timeout=10):
+        '''
+        Waits for a record whose message matches any of C{patterns}.
+
+        @return: the tuple (index of the matching pattern, L{LogcatRecord}) or C{None} if the timeout expired
+        '''
+
+        regexes = [re.compile(p) if isinstance(p, str) else p for p in patterns]
+        deadline = time.time() + timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return None
+            record = self.next(timeout=remaining)
+            if record is None:
+                return None
+            for i, regex in enumerate(regexes):
+                if regex.search(record.message):
+                    return i, record
+
+    def close(self):
+        if self.socket:
+            self.socket.close()
+            self.socket = None
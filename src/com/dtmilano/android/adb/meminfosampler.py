@@ -0,0 +1,251 @@
+'''
+Copyright (C) 2012-2018  Diego Torres Milano
+Created on Oct 18, 2018
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@author: Diego Torres Milano
+'''
+from __future__ import print_function
+
+import sys
+import threading
+import time
+
+from .dumpsys import Dumpsys
+
+__version__ = '15.4.0'
+
+DEBUG = False
+
+
+class MeminfoSampler:
+    '''
+    Samples the meminfo of one or more packages into time series.
+
+    The meminfo of all the packages is obtained in a single shell invocation, over its own connection, and parsed
+    in one pass into preallocated numpy arrays, one row per sample and one column per L{FIELDS}.
+    Values not found, i.e. because the process is not running, are NaN.
+
+    Samples can be taken at a fixed cadence in the background (L{start()}/L{stop()}), on demand (L{sample()}) or
+    after every repetition of a scenario to detect leaks (L{detectLeaks()}).
+    '''
+
+    FIELDS = ['total', 'nativeHeap', 'dalvikHeap', 'views', 'activities', 'appContexts', 'viewRootImpl']
+    ''' The columns of the samples '''
+
+    LEAK_FIELDS = ['total', 'views', 'activities', 'viewRootImpl']
+    ''' The values whose growth is checked by L{detectLeaks()} '''
+
+    LEAK_THRESHOLDS = {'total': 64.0, 'views': 0.5, 'activities': 0.1, 'viewRootImpl': 0.1}
+    ''' The default slopes, per repetition, above which a value is considered leaking (C{total} is in kB) '''
+
+    PACKAGE_MARKER = '__AVC_MEMINFO__'
+
+    def __init__(self, adbclient, packages, interval=1.0, capacity=256):
+        '''
+        Constructor
+
+        @type adbclient: AdbClient
+        @param adbclient: the client of the device running the packages
+        @param packages: the package or list of packages
+        @param interval: the sampling interval in seconds used by L{start()}
+        @param capacity: the number of samples preallocated, the arrays grow as needed
+        '''
+
+        import numpy
+
+        if isinstance(packages, str):
+            packages = [packages]
+        self.adbclient = adbclient
+        self.packages = list(packages)
+        self.interval = interval
+        self.__count = 0
+        self.__timestamps = numpy.empty(capacity, dtype=numpy.float64)
+        self.__values = dict((pkg, numpy.empty((capacity, len(MeminfoSampler.FIELDS)), dtype=numpy.float64))
+                             for pkg in self.packages)
+        self.__cmd = '; '.join('echo %s%s; dumpsys meminfo %s' % (MeminfoSampler.PACKAGE_MARKER, pkg, pkg)
+                               for pkg in self.packages)
+        self.__lock = threading.RLock()
+        self.__stopEvent = threading.Event()
+        self.__thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def start(self):
+        '''
+        Starts sampling in the background every L{interval} seconds.
+        '''
+
+        if self.__thread:
+            raise RuntimeError('MeminfoSampler already started')
+        self.__stopEvent.clear()
+        self.__thread = threading.Thread(target=self.__run, name='MeminfoSampler')
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        if self.__thread:
+            self.__stopEvent.set()
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self):
+        while True:
+            started = time.time()
+            try:
+                self.sample()
+            except Exception as ex:
+                print("MeminfoSampler: %s" % ex, file=sys.stderr)
+            if self.__stopEvent.wait(max(0, self.interval - (time.time() - started))):
+                break
+
+    def __grow(self):
+        import numpy
+
+        capacity = 2 * len(self.__timestamps)
+        self.__timestamps = numpy.resize(self.__timestamps, capacity)
+        for pkg, values in self.__values.items():
+            grown = numpy.empty((capacity, values.shape[1]), dtype=values.dtype)
+            grown[:self.__count] = values[:self.__count]
+            self.__values[pkg] = grown
+
+    def parse(self, out, timestamp=None):
+        '''
+        Parses the output of the sampling command and appends it as a new sample.
+
+        @return: the index of the sample
+        '''
+
+        nan = float('nan')
+        with self.__lock:
+            if self.__count == len(self.__timestamps):
+                self.__grow()
+            i = self.__count
+            self.__timestamps[i] = time.time() if timestamp is None else timestamp
+            for pkg in self.packages:
+                self.__values[pkg][i] = nan
+            for part in out.split(MeminfoSampler.PACKAGE_MARKER)[1:]:
+                pkg, _, body = part.partition('\n')
+                pkg = pkg.rstrip('\r')
+                if pkg not in self.__values:
+                    continue
+                row = self.__values[pkg][i]
+                for name, value in Dumpsys.parseMeminfoValues(body).items():
+                    row[MeminfoSampler.FIELDS.index(name)] = value
+            self.__count += 1
+            if DEBUG:
+                print("MeminfoSampler: sample %d" % i, file=sys.stderr)
+            return i
+
+    def sample(self):
+        '''
+        Takes a sample of all the packages now.
+
+        @return: the index of the sample
+        '''
+
+        return self.parse(self.adbclient.shellStream(self.__cmd), time.time())
+
+    def getSampleCount(self):
+        return self.__count
+
+    def getTimestamps(self):
+        '''
+        @return: the numpy array of the sampling times, in seconds since the epoch
+        '''
+
+        with self.__lock:
+            return self.__timestamps[:self.__count].copy()
+
+    def getValues(self, pkg=None, field=None):
+        '''
+        @param pkg: the package, C{None} for the first one
+        @param field: one of L{FIELDS}, or C{None} for all of them
+        @return: the numpy array of the values sampled, with one column per field if C{field} is C{None}
+        '''
+
+        if pkg is None:
+            pkg = self.packages[0]
+        with self.__lock:
+            values = self.__values[pkg][:self.__count]
+            if field is not None:
+                values = values[:, MeminfoSampler.FIELDS.index(field)]
+            return values.copy()
+
+    @staticmethod
+    def slope(values):
+        '''
+        Fits a line to C{values}, ignoring NaNs, by least squares.
+
+        @return: the slope, the growth per sample, or NaN if there are less than 2 values
+        '''
+
+        import numpy
+
+        y = numpy.asarray(values, dtype=numpy.float64)
+        x = numpy.arange(len(y), dtype=numpy.float64)
+        valid = ~numpy.isnan(y)
+        if numpy.count_nonzero(valid) < 2:
+            return float('nan')
+        x = x[valid]
+        y = y[valid]
+        x -= x.mean()
+        return float(numpy.dot(x, y - y.mean()) / numpy.dot(x, x))
+
+    def getSlopes(self, pkg=None, start=0, end=None):
+        '''
+        @param start: the index of the first sample considered
+        @param end: the index after the last sample considered, C{None} for all the samples
+        @return: the map of L{LEAK_FIELDS} to their slopes across the samples
+        '''
+
+        values = self.getValues(pkg)[start:end]
+        return dict((field, MeminfoSampler.slope(values[:, MeminfoSampler.FIELDS.index(field)])) for field in
+                    MeminfoSampler.LEAK_FIELDS)
+
+    def detectLeaks(self, scenario, repetitions=50, warmup=1, thresholds=None):
+        '''
+        Runs C{scenario} repeatedly, sampling after every repetition, and fits the growth of L{LEAK_FIELDS}.
+
+        @param scenario: the callable running the scenario once, it receives the repetition number
+        @param repetitions: the number of repetitions measured
+        @param warmup: the number of repetitions run before, not measured, so caches and lazy initializations
+        don't look like leaks
+        @param thresholds: the map of fields to the slopes considered leaks, overriding L{LEAK_THRESHOLDS}
+        @return: the map of packages to maps containing the C{slopes} and the C{leaks}, the fields above threshold
+        '''
+
+        limits = dict(MeminfoSampler.LEAK_THRESHOLDS)
+        if thresholds:
+            limits.update(thresholds)
+        for i in range(warmup):
+            scenario(i)
+        # the sample taken before the first measured repetition is the baseline
+        start = self.sample()
+        for i in range(repetitions):
+            scenario(warmup + i)
+            self.sample()
+        report = {}
+        for pkg in self.packages:
+            slopes = self.getSlopes(pkg, start)
+            leaks = [f for f in MeminfoSampler.LEAK_FIELDS if slopes[f] > limits[f]]
+            report[pkg] = {'slopes': slopes, 'leaks': leaks}
+            if DEBUG:
+                print("MeminfoSampler: %s slopes=%s leaks=%s" % (pkg, slopes, leaks), file=sys.stderr)
+        return report
@@ -93,11 +93,24 @@ def which(program, isWindows=False):
     return None
 
 
+ADB_PATH = None
+''' The ADB path found by L{obtainAdbPath()}, cached for the process '''
+
+
 def obtainAdbPath():
     '''
-    Obtains the ADB path attempting know locations for different OSs
+    Obtains the ADB path attempting know locations for different OSs.
+    The locations are checked only once per process, following calls return the cached L{ADB_PATH}.
     '''
 
+    global ADB_PATH
+    if ADB_PATH is None:
+        ADB_PATH = _obtainAdbPath()
+    return ADB_PATH
+
+
+def _obtainAdbPath():
+
     FORCE_FAIL = False
     ''' Sometimes, you want it to fail to check the error messages '''
     osName = platform.system()
@@ -203,3 +216,30 @@ def debugArgsToDict(a):
     s = s.replace('=', ':')
     s = re.sub(r'([A-Z][A-Z_]+)', r"'\1'", s)
     return ast.literal_eval('{ ' + s + ' }')
+
+
+def distribution(values, percentiles=(50, 90, 95, 99)):
+    '''
+    Summarizes a set of measurements, i.e. launch times.
+
+    @param values: the values, C{None}s are ignored
+    @param percentiles: the percentiles computed
+    @return: the map containing C{n}, C{min}, C{max}, C{mean}, C{median} and C{p<N>} for every percentile, all
+    C{None} if there are no values
+    '''
+
+    import numpy
+
+    values = numpy.array([v for v in values if v is not None], dtype=numpy.float64)
+    d = {'n': len(values)}
+    keys = ['min', 'max', 'mean', 'median'] + ['p%d' % p for p in percentiles]
+    if len(values) == 0:
+        d.update((k, None) for k in keys)
+        return d
+    d['min'] = float(values.min())
+    d['max'] = float(values.max())
+    d['mean'] = float(values.mean())
+    d['median'] = float(numpy.median(values))
+    for p, v in zip(percentiles, numpy.percentile(values, percentiles)):
+        d['p%d' % p] = float(v)
+    return d
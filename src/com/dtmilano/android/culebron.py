@@ -23,8 +23,6 @@ import random
 import re
 import time
 
-import numpy
-
 from .common import profileEnd
 from .common import profileStart
 from .concertina import Concertina
@@ -39,15 +37,9 @@ import copy
 import string
 import os
 import platform
-from pkg_resources import Requirement, resource_filename
-
-try:
-    import PIL
-    from PIL import Image, ImageTk
 
-    PIL_AVAILABLE = True
-except:
-    PIL_AVAILABLE = False
+PIL_AVAILABLE = False
+''' PIL is imported by L{Culebron.checkDependencies()}, only when the GUI is used '''
 
 try:
     import tkinter
@@ -149,7 +141,7 @@ class Operation:
 class Culebron:
     APPLICATION_NAME = "Culebra"
 
-    UPPERCASE_CHARS = string.uppercase[:26]
+    UPPERCASE_CHARS = string.ascii_uppercase[:26]
 
     KEYSYM_TO_KEYCODE_MAP = {
         'Home': 'HOME',
@@ -194,8 +186,15 @@ class Culebron:
 
     @staticmethod
     def checkDependencies():
+        global PIL_AVAILABLE
         if not PIL_AVAILABLE:
-            raise Exception('''PIL or Pillow is needed for GUI mode
+            try:
+                global PIL, Image, ImageTk
+                import PIL
+                from PIL import Image, ImageTk
+                PIL_AVAILABLE = True
+            except:
+                raise Exception('''PIL or Pillow is needed for GUI mode
 
 On Ubuntu install
 
@@ -251,6 +250,7 @@ This is usually installed by python package. Check your distribution details.
         self.concertinaConfigFile = concertinaConfigFile
         self.window = tkinter.Tk()
         try:
+            from pkg_resources import Requirement, resource_filename
             f = resource_filename(Requirement.parse("androidviewclient"),
                                   "share/pixmaps/culebra.png")
             icon = ImageTk.PhotoImage(file=f)
@@ -285,6 +285,10 @@ This is usually installed by python package. Check your distribution details.
         self.screenshot = None
         self.iterations = 0
         self.noTargetViewsCount = 0
+        self.treeHash = None
+        ''' The L{ViewClient.treeHash} of the last dump whose targets were found '''
+        self.targetPositions = []
+        ''' The positions in the dump of the target Views '''
         if DEBUG:
             try:
                 self.printGridInfo()
@@ -587,10 +591,24 @@ This is usually installed by python package. Check your distribution details.
         else:
             dump = []
         self.dump = dump
+        treeHash = self.vc.treeHash if self.vc else None
+        if treeHash is not None and treeHash == self.treeHash:
+            # the screen didn't change, the targets are the Views at the same positions and the Treeview is kept
+            if DEBUG:
+                print("    findTargets: same tree, reusing %d targets" % len(self.targetPositions), file=sys.stderr)
+            for p in self.targetPositions:
+                v = dump[p]
+                ((x1, y1), (x2, y2)) = v.getCoords()
+                v.setTarget(True)
+                self.targets.append((x1, y1, x2, y2))
+                self.targetViews.append(v)
+            return
+        self.treeHash = treeHash
+        self.targetPositions = []
         # the root element cannot be deleted from Treeview once added.
         # We have no option but to recreate it
         self.viewTree = ViewTree(self.sideFrame)
-        for v in dump:
+        for p, v in enumerate(dump):
             if DEBUG:
                 print("    findTargets: analyzing", v.getClass(), v.getId(), file=sys.stderr)
             if v.getClass() == LISTVIEW_CLASS:
@@ -607,6 +625,7 @@ This is usually installed by python package. Check your distribution details.
                 v.setTarget(True)
                 self.targets.append((x1, y1, x2, y2))
                 self.targetViews.append(v)
+                self.targetPositions.append(p)
                 target = True
             else:
                 target = False
@@ -639,8 +658,8 @@ This is usually installed by python package. Check your distribution details.
             vlist.reverse()
             for v in vlist:
                 if DEBUG:
-                    print("checking if", v, "is in", self.targetViews, file=sys.stderr)
-                if v in self.targetViews:
+                    print("checking if", v, "is a target", file=sys.stderr)
+                if v.isTarget():
                     if DEBUG_TOUCH:
                         print(file=sys.stderr)
                         print("I guess you are trying to touch:", v, file=sys.stderr)
@@ -723,7 +742,7 @@ This is usually installed by python package. Check your distribution details.
                 self.touchView(candidate, v if candidate != v else None)
 
         self.printOperation(None, Operation.SLEEP, Operation.DEFAULT)
-        self.vc.sleep(5)
+        self.waitForStable(5)
         self.takeScreenshotAndShowItOnWindow()
 
     def pressBack(self):
@@ -751,7 +770,7 @@ This is usually installed by python package. Check your distribution details.
             self.printOperation(None, Operation.PRESS_RECENT_APPS_UI_AUTOMATOR_HELPER)
         else:
             self.printOperation(None, Operation.PRESS_RECENT_APPS)
-        self.vc.sleep(1)
+        self.waitForStable(1)
         self.takeScreenshotAndShowItOnWindow()
 
     def setText(self, v, text):
@@ -806,8 +825,7 @@ This is usually installed by python package. Check your distribution details.
             self.printOperation(None, Operation.TOUCH_POINT, x, y, self.coordinatesUnit,
                                 self.device.display['orientation'])
             self.printOperation(None, Operation.SLEEP, Operation.DEFAULT)
-            # FIXME: can we reduce this sleep? (was 5)
-            time.sleep(1)
+            self.waitForStable(1)
             self.isTouchingPoint = self.vc is None
             self.takeScreenshotAndShowItOnWindow()
             # self.hideVignette()
@@ -838,7 +856,8 @@ This is usually installed by python package. Check your distribution details.
                 y = round(y / self.device.display['density'], 2)
             self.printOperation(None, Operation.LONG_TOUCH_POINT, x, y, 2000, self.coordinatesUnit,
                                 self.device.display['orientation'])
-            self.sleep(5)
+            self.printOperation(None, Operation.SLEEP, 5)
+            self.waitForStable(5)
             self.isLongTouchingPoint = False
             self.takeScreenshotAndShowItOnWindow()
             # self.hideVignette()
@@ -1011,7 +1030,11 @@ This is usually installed by python package. Check your distribution details.
         self.showVignette()
         self.device.wake()
         display = copy.copy(self.device.display)
-        self.device.initDisplayProperties()
+        # The display properties are obtained again only if the orientation reported by the (cached) device
+        # state differs, this saves several shell commands per refresh
+        orientation = self.device.getDeviceState().orientation
+        if orientation is None or orientation != display.get('orientation'):
+            self.device.initDisplayProperties()
         changed = False
         for prop in display:
             if display[prop] != self.device.display[prop]:
@@ -1262,7 +1285,7 @@ This is usually installed by python package. Check your distribution details.
             self.printOperation(None, Operation.DRAG, start, end, duration, steps, units,
                                 self.device.display['orientation'])
         self.printOperation(None, Operation.SLEEP, 1)
-        time.sleep(1)
+        self.waitForStable(1)
         self.takeScreenshotAndShowItOnWindow()
 
     def enableEvents(self):
@@ -1373,7 +1396,7 @@ This is usually installed by python package. Check your distribution details.
         self.printOperation(view, Operation.fromCommandName(command.__name__))
         command()
         self.printOperation(None, Operation.SLEEP, Operation.DEFAULT)
-        self.vc.sleep(5)
+        self.waitForStable(5)
         # FIXME: perhaps refresh() should be invoked here just in case size or orientation changed
         self.takeScreenshotAndShowItOnWindow()
 
@@ -1438,6 +1461,8 @@ This is usually installed by python package. Check your distribution details.
         self.window.mainloop()
 
     def concertinaLoopCallback(self, dontinteract=False):
+        import numpy
+
         needToSleep = False
         if not dontinteract:
             if DEBUG_CONCERTINA:
@@ -1469,15 +1494,14 @@ This is usually installed by python package. Check your distribution details.
                     selector = numpy.random.choice(views['selector'], 1, p=views['probabilities'])[0]
                     _regex = numpy.random.choice(views[selector]['regexs'], 1, p=views[selector]['probabilities'])[0]
                     _tvli = []
-                    for _i in range(len(self.targetViews)):
-                        if selector == 'classes':
-                            if re.match(_regex, self.targetViews[_i].getClass()):
-                                _tvli.append(_i)
-                        elif selector == 'contentDescriptions':
-                            if re.match(_regex, self.targetViews[_i].getContentDescription()):
-                                _tvli.append(_i)
-                        else:
-                            print("CONCERTINA: unknown selector: {}".format(selector), file=sys.stderr)
+                    attr = {'classes': 'class', 'contentDescriptions': 'content-desc'}.get(selector)
+                    if attr:
+                        # the regex is resolved on the index of the dump, then the targets selected are kept
+                        query = '%s~=/^(?:%s)/' % (attr, _regex.replace('/', '\\/'))
+                        selected = set(id(v) for v in self.vc.findViewsWithSelector(query))
+                        _tvli = [_i for _i, v in enumerate(self.targetViews) if id(v) in selected]
+                    else:
+                        print("CONCERTINA: unknown selector: {}".format(selector), file=sys.stderr)
                     # i = random.randrange(len(self.targetViews))
                     if _tvli:
                         i = random.choice(_tvli)
@@ -1618,10 +1642,9 @@ This is usually installed by python package. Check your distribution details.
                             print("CONCERTINA: touching non-target view {}".format(target), file=sys.stderr)
                         self.touchView(target)
                         self.sleepAndRefreshScreen()
-                        needToSleep = True
                     else:
                         # Let's wait to see if some View appear
-                        needToSleep = True
+                        self.sleepAndRefreshScreen()
                         self.noTargetViewsCount += 1
                         if DEBUG_CONCERTINA:
                             print("CONCERTINA: No target views", self.noTargetViewsCount, file=sys.stderr)
@@ -1633,13 +1656,14 @@ This is usually installed by python package. Check your distribution details.
             print("CONCERTINA: Maximum number of iterations reached", file=sys.stderr)
             sys.exit(0)
         self.iterations += 1
-        self.window.after(5000 if dontinteract or needToSleep else 0, self.concertinaLoopCallback)
+        # the screen was refreshed once it was stable after any action
+        self.window.after(5000 if dontinteract else 0, self.concertinaLoopCallback)
 
     def sleepAndRefreshScreen(self):
         self.printOperation(None, Operation.SLEEP, Operation.DEFAULT)
         if DEBUG_CONCERTINA:
-            print("CONCERTINA: waiting 5 secs", file=sys.stderr)
-        time.sleep(5)
+            print("CONCERTINA: waiting up to 5 secs for the UI to be stable", file=sys.stderr)
+        self.waitForStable(5)
         if DEBUG_CONCERTINA:
             print("CONCERTINA: updating window", file=sys.stderr)
         self.takeScreenshotAndShowItOnWindow()
@@ -1648,6 +1672,18 @@ This is usually installed by python package. Check your distribution details.
         time.sleep(s)
         self.printOperation(None, Operation.SLEEP, s)
 
+    def waitForStable(self, timeout):
+        '''
+        Waits for the UI to be stable after an action, instead of sleeping C{timeout} seconds.
+        The focused window and the screenshot are used as signals, see L{ViewClient.waitForStable()}.
+        Nothing is printed, the callers print the sleep of the generated script.
+        '''
+
+        if self.vc:
+            self.vc.waitForStable(signals=[ViewClient.STABLE_FOCUS, ViewClient.STABLE_SCREENSHOT], timeout=timeout)
+        else:
+            time.sleep(timeout)
+
     def getViewContainingPointAndLongTouch(self, x, y):
         # FIXME: this method is almost exactly as getViewContainingPointAndTouch()
         if DEBUG:
@@ -1692,7 +1728,7 @@ This is usually installed by python package. Check your distribution details.
         self.longTouchView(candidate, v if candidate != v else None)
 
         self.printOperation(None, Operation.SLEEP, Operation.DEFAULT)
-        self.vc.sleep(5)
+        self.waitForStable(5)
         self.takeScreenshotAndShowItOnWindow()
 
 
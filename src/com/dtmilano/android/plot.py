@@ -23,35 +23,81 @@ from __future__ import print_function
 import sys
 from math import ceil
 
-import matplotlib.pyplot as plt
-import mpl_toolkits.axisartist as AA
 import numpy as np
-from mpl_toolkits.axes_grid1 import host_subplot
 
 from .adb.dumpsys import Dumpsys
 
 __version__ = '15.4.0'
 
-DEBUG = True
+DEBUG = False
 
 NumberTypes = (int, int, float)
 
+MAX_POINTS = 2000
+''' The default maximum number of points drawn per series, longer series are downsampled '''
+
+
+class Series:
+    '''
+    A growable numpy buffer.
+
+    Appending is amortized O(1): the capacity doubles when the buffer is full.
+    '''
+
+    def __init__(self, name=None, capacity=1024, dtype=np.float64):
+        self.name = name
+        self.__buffer = np.empty(capacity, dtype=dtype)
+        self.__n = 0
+
+    def __len__(self):
+        return self.__n
+
+    def __reserve(self, n):
+        if n > len(self.__buffer):
+            buffer = np.empty(max(n, 2 * len(self.__buffer)), dtype=self.__buffer.dtype)
+            buffer[:self.__n] = self.__buffer[:self.__n]
+            self.__buffer = buffer
+
+    def append(self, value):
+        self.__reserve(self.__n + 1)
+        self.__buffer[self.__n] = value
+        self.__n += 1
+
+    def extend(self, values):
+        values = np.asarray(values, dtype=self.__buffer.dtype).reshape(-1)
+        self.__reserve(self.__n + len(values))
+        self.__buffer[self.__n:self.__n + len(values)] = values
+        self.__n += len(values)
+
+    def getValues(self):
+        '''
+        @return: a view of the values, valid until the next append
+        '''
+
+        return self.__buffer[:self.__n]
+
 
 class Plot:
     def __init__(self):
         self.n = 0
-        self.na = []
-        self.va = []
+        self.va = Series('V')
+        ''' Values array '''
         self.ava = {}
         ''' Associative values array '''
         self.aava = {}
         ''' (another) Associative values array '''
+        self.__figure = None
+        self.__rendered = None
+
+    @property
+    def na(self):
+        ''' The sample numbers '''
+        return np.arange(1, self.n + 1)
 
     def append(self, value):
         if DEBUG:
             print('append({})'.format(value), file=sys.stderr)
         self.n += 1
-        self.na.append(self.n)
         if isinstance(value, NumberTypes):
             self.va.append(value)
         elif isinstance(value, Dumpsys):
@@ -64,19 +110,91 @@ class Plot:
             self.ava[Dumpsys.ACTIVITIES].append(dumpsys.get(Dumpsys.ACTIVITIES))
             self.ava[Dumpsys.VIEWS].append(dumpsys.get(Dumpsys.VIEWS))
             # self.ava[Dumpsys.VIEW_ROOT_IMPL].append(dumpsys.get(Dumpsys.VIEW_ROOT_IMPL))
-            self.aava[Dumpsys.FRAMESTATS].append(dumpsys.get(Dumpsys.FRAMESTATS))
+            self.aava[Dumpsys.FRAMESTATS].extend(dumpsys.get(Dumpsys.FRAMESTATS))
+        return self
+
+    def extend(self, values):
+        '''
+        Appends many numeric values at once.
+        '''
+
+        self.va.extend(values)
+        self.n = len(self.va)
+        return self
+
+    def appendFramestats(self, durations):
+        '''
+        Appends frame durations, in ms, to the framestats histogram.
+        '''
+
+        if not self.aava:
+            self.__initAava()
+        self.aava[Dumpsys.FRAMESTATS].extend(durations)
         return self
 
     def __initAva(self):
-        self.ava[Dumpsys.TOTAL] = []
-        self.ava[Dumpsys.ACTIVITIES] = []
-        self.ava[Dumpsys.VIEWS] = []
-        # self.ava[Dumpsys.VIEW_ROOT_IMPL] = []
+        self.ava[Dumpsys.TOTAL] = Series(Dumpsys.TOTAL)
+        self.ava[Dumpsys.ACTIVITIES] = Series(Dumpsys.ACTIVITIES)
+        self.ava[Dumpsys.VIEWS] = Series(Dumpsys.VIEWS)
+        # self.ava[Dumpsys.VIEW_ROOT_IMPL] = Series(Dumpsys.VIEW_ROOT_IMPL)
 
     def __initAava(self):
-        self.aava[Dumpsys.FRAMESTATS] = []
+        self.aava[Dumpsys.FRAMESTATS] = Series(Dumpsys.FRAMESTATS)
+
+    @staticmethod
+    def downsample(x, y, maxPoints=MAX_POINTS):
+        '''
+        Decimates a series keeping the minimum and maximum of every bucket, so peaks survive.
+
+        @param maxPoints: the maximum number of points returned
+        @return: the tuple (x, y) of numpy arrays with at most C{maxPoints} points
+        '''
+
+        x = np.asarray(x)
+        y = np.asarray(y)
+        n = len(y)
+        if n <= maxPoints or maxPoints < 2:
+            return x, y
+        buckets = maxPoints // 2
+        size = int(ceil(n / float(buckets)))
+        buckets = int(ceil(n / float(size)))
+        padded = np.empty(buckets * size, dtype=y.dtype)
+        padded[:n] = y
+        padded[n:] = y[-1]
+        padded = padded.reshape(buckets, size)
+        offsets = np.arange(buckets) * size
+        indexes = np.unique(np.concatenate([padded.argmin(axis=1) + offsets, padded.argmax(axis=1) + offsets]))
+        indexes = indexes[indexes < n]
+        return x[indexes], y[indexes]
+
+    @staticmethod
+    def __aggFigure():
+        '''
+        Creates a figure drawn on its own Agg canvas, so files are rendered without a display and without changing
+        the pyplot backend.
+        '''
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        return figure
 
-    def plot(self, _type=Dumpsys.MEMINFO, filename=None):
+    def plot(self, _type=Dumpsys.MEMINFO, filename=None, maxPoints=MAX_POINTS):
+        '''
+        Plots the values.
+
+        @param _type: L{Dumpsys.MEMINFO} or L{Dumpsys.FRAMESTATS}
+        @param filename: if not C{None}, the plot is saved there without a display, using an Agg canvas,
+        otherwise it is shown
+        @param maxPoints: the maximum number of points drawn per series
+        '''
+
+        if filename:
+            figure = Plot.__aggFigure()
+        else:
+            import matplotlib.pyplot as plt
+            figure = plt.figure()
         title = "Dumpsys"
         if _type == Dumpsys.FRAMESTATS:
             subtitle = "gfxinfo " + Dumpsys.FRAMESTATS
@@ -84,20 +202,27 @@ class Plot:
             subtitle = _type
         if _type == Dumpsys.MEMINFO:
             if self.ava:
+                import mpl_toolkits.axisartist as AA
+                from mpl_toolkits.axes_grid1 import host_subplot
+
+                na = self.na
+                ava = {}
+                for k in self.ava.keys():
+                    ava[k] = Plot.downsample(na, self.ava[k].getValues(), maxPoints)
                 if DEBUG:
                     print("plot:", file=sys.stderr)
-                    for k in self.ava.keys():
-                        print("   {}: {}".format(k, self.ava[k]), file=sys.stderr)
+                    for k in ava.keys():
+                        print("   {}: {}".format(k, ava[k][1]), file=sys.stderr)
 
-                host = host_subplot(111, axes_class=AA.Axes)
-                plt.subplots_adjust(right=0.75)
+                host = host_subplot(111, axes_class=AA.Axes, figure=figure)
+                figure.subplots_adjust(right=0.75)
                 par = {}
-                for k in self.ava.keys():
+                for k in ava.keys():
                     if k != Dumpsys.TOTAL:
                         par[k] = host.twinx()
 
                 axis = 1
-                for k in self.ava.keys():
+                for k in ava.keys():
                     if k != Dumpsys.TOTAL and k != Dumpsys.ACTIVITIES:
                         offset = axis * 60
                         axis += 1
@@ -107,81 +232,124 @@ class Plot:
                                                               offset=(offset, 0))
                         par[k].axis["right"].toggle(all=True)
 
+                minx = np.amin(na)
+                maxx = np.amax(na)
                 if DEBUG:
-                    print("setting host x lim {} {}".format(np.amin(self.na), np.amax(self.na)), file=sys.stderr)
-                minx = np.amin(self.na)
-                maxx = np.amax(self.na)
-                divx = abs(maxx - minx) / (len(self.na) * 1.0)
+                    print("setting host x lim {} {}".format(minx, maxx), file=sys.stderr)
+                divx = abs(maxx - minx) / (len(na) * 1.0)
                 host.set_xlim(minx - divx, maxx + divx)
-                miny = np.amin(self.ava[Dumpsys.TOTAL])
-                maxy = np.amax(self.ava[Dumpsys.TOTAL])
-                divy = ceil(abs(maxy - miny) / (len(self.ava[Dumpsys.TOTAL]) * 1.0))
+                total = self.ava[Dumpsys.TOTAL].getValues()
+                miny = np.amin(total)
+                maxy = np.amax(total)
+                divy = ceil(abs(maxy - miny) / (len(total) * 1.0))
                 if DEBUG:
                     print("setting host y lim {} {}".format(miny - divy, maxy + divy), file=sys.stderr)
                 host.set_ylim(miny - divy, maxy + divy)
                 host.set_xlabel('N')
                 host.set_ylabel(Dumpsys.TOTAL)
 
-                for k in self.ava.keys():
+                for k in ava.keys():
                     if k != Dumpsys.TOTAL:
                         par[k].set_ylabel(k)
 
                 plots = {}
-                if DEBUG:
-                    print("    host plot {} : {}".format(self.na, self.ava[Dumpsys.TOTAL]), file=sys.stderr)
-                plots[Dumpsys.TOTAL], = host.plot(self.na, self.ava[Dumpsys.TOTAL], label=Dumpsys.TOTAL, linewidth=2)
-                for k in self.ava.keys():
+                plots[Dumpsys.TOTAL], = host.plot(*ava[Dumpsys.TOTAL], label=Dumpsys.TOTAL, linewidth=2)
+                for k in ava.keys():
                     if k != Dumpsys.TOTAL:
-                        if DEBUG:
-                            print("   {} plot {} : {}".format(k, self.na, self.ava[k]), file=sys.stderr)
-                        plots[k], = par[k].plot(self.na, self.ava[k], label=k, linewidth=2)
+                        plots[k], = par[k].plot(*ava[k], label=k, linewidth=2)
 
-                for k in self.ava.keys():
+                for k in ava.keys():
                     if k != Dumpsys.TOTAL:
-                        miny = np.amin(self.ava[k])
-                        maxy = np.amax(self.ava[k])
-                        divy = ceil(abs(maxy - miny) / (len(self.ava[k]) * 1.0))
+                        values = self.ava[k].getValues()
+                        miny = np.amin(values)
+                        maxy = np.amax(values)
+                        divy = ceil(abs(maxy - miny) / (len(values) * 1.0))
                         if DEBUG:
-                            print("setting {} y lim {}".format(k ,(miny - divy, maxy + divy)), file=sys.stderr)
+                            print("setting {} y lim {}".format(k, (miny - divy, maxy + divy)), file=sys.stderr)
                         par[k].set_ylim(miny - divy, maxy + divy)
 
                 host.legend()
 
-                # host.axis["left"].label.set_color(plots[Dumpsys.TOTAL].get_color())
-                # for k in self.ava.keys():
-                #     if k != Dumpsys.TOTAL:
-                #         par[k].axis["right"].label.set_color(plots[k].get_color())
-
-            elif self.va:
-                plt.xlabel('N')
-                plt.ylabel('V')
-                plt.plot(self.na, self.va, label="A")
+            elif len(self.va):
+                ax = figure.add_subplot(111)
+                ax.set_xlabel('N')
+                ax.set_ylabel('V')
+                ax.plot(*Plot.downsample(self.na, self.va.getValues(), maxPoints), label="A")
             else:
                 raise RuntimeError("No values to plot")
         elif _type == Dumpsys.FRAMESTATS:
+            frames = self.aava[Dumpsys.FRAMESTATS].getValues()
             if DEBUG:
-                print("    plot: histogram {}".format(self.aava[Dumpsys.FRAMESTATS]), file=sys.stderr)
-            n, bins, patches = plt.hist(self.aava[Dumpsys.FRAMESTATS])
-            ymax = np.amax(n)
-            x = []
-            y = []
-            for v in range(int(ceil(ymax)) + 1):
-                x.append(1 / 60.0 * 10 ** 3)
-                y.append(v)
-            plt.plot(x, y, linewidth=2, color='c')
-            x = []
-            y = []
-            for v in range(int(ceil(ymax)) + 1):
-                x.append(1 / 30.0 * 10 ** 3)
-                y.append(v)
-            plt.plot(x, y, linewidth=2, color='r')
-            plt.xlabel('ms')
-            plt.ylabel('Frames')
-
-        plt.title(title + ' ' + subtitle)
-        plt.grid(True)
-        plt.draw()
+                print("    plot: histogram of {} frames".format(len(frames)), file=sys.stderr)
+            ax = figure.add_subplot(111)
+            n, bins, patches = ax.hist(frames)
+            self.__drawFrameLimits(ax, np.amax(n))
+            ax.set_xlabel('ms')
+            ax.set_ylabel('Frames')
+
+        ax = figure.gca()
+        ax.set_title(title + ' ' + subtitle)
+        ax.grid(True)
         if filename:
-            plt.savefig(filename)
+            figure.savefig(filename)
         else:
             plt.show()
+
+    @staticmethod
+    def __drawFrameLimits(axes, ymax):
+        # 60 and 30 fps
+        axes.plot([1 / 60.0 * 10 ** 3] * 2, [0, ymax], linewidth=2, color='c')
+        axes.plot([1 / 30.0 * 10 ** 3] * 2, [0, ymax], linewidth=2, color='r')
+
+    def render(self, filename, _type=Dumpsys.MEMINFO, maxPoints=MAX_POINTS):
+        '''
+        Renders the values to a file without a display, using an Agg canvas.
+
+        The figure is created by the first call and the following ones only update the data of its lines, so it can
+        be called periodically during a long run to keep a chart up to date.
+
+        @param filename: the image file
+        @param _type: L{Dumpsys.MEMINFO} or L{Dumpsys.FRAMESTATS}
+        @param maxPoints: the maximum number of points drawn per series
+        '''
+
+        if self.__figure is None or self.__rendered != _type:
+            self.__figure = self.__createFigure(_type)
+            self.__rendered = _type
+        figure, axes, lines = self.__figure
+        if _type == Dumpsys.FRAMESTATS:
+            ax = axes[0]
+            ax.cla()
+            frames = self.aava[Dumpsys.FRAMESTATS].getValues() if self.aava else []
+            n, _, _ = ax.hist(frames, bins=50)
+            self.__drawFrameLimits(ax, np.amax(n) if len(n) else 1)
+            ax.set_xlabel('ms')
+            ax.set_ylabel('Frames')
+            ax.grid(True)
+        else:
+            na = self.na
+            for (series, line), ax in zip(lines, axes):
+                x, y = Plot.downsample(na[:len(series)], series.getValues(), maxPoints)
+                line.set_data(x, y)
+                ax.relim()
+                ax.autoscale_view()
+        figure.savefig(filename)
+
+    def __createFigure(self, _type):
+        figure = Plot.__aggFigure()
+        if _type == Dumpsys.FRAMESTATS:
+            ax = figure.subplots()
+            figure.suptitle('Dumpsys gfxinfo ' + Dumpsys.FRAMESTATS)
+            return figure, [ax], []
+        series = list(self.ava.values()) if self.ava else [self.va]
+        axes = figure.subplots(len(series), 1, sharex=True, squeeze=False)
+        axes = list(axes[:, 0])
+        lines = []
+        for s, ax in zip(series, axes):
+            line, = ax.plot([], [], linewidth=1)
+            ax.set_ylabel(s.name)
+            ax.grid(True)
+            lines.append((s, line))
+        axes[-1].set_xlabel('N')
+        figure.suptitle('Dumpsys ' + _type)
+        return figure, axes, lines
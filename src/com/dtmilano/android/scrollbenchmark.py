@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+'''
+Copyright (C) 2012-2018  Diego Torres Milano
+Created on Oct 18, 2018
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+       http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+@author: Diego Torres Milano
+'''
+from __future__ import print_function
+
+import json
+import sys
+import time
+
+from .adb.dumpsys import Dumpsys
+from .adb.framestatsmonitor import FrameStatsMonitor
+from .common import distribution
+
+__version__ = '15.4.0'
+
+DEBUG = False
+
+
+class ScrollBenchmark:
+    '''
+    Scroll jank benchmark.
+
+    Repeats a fling or swipe over a scrollable view, or between two points, while the framestats of the package are
+    collected continuously by a L{FrameStatsMonitor}, so long gestures don't overrun the device frame buffer.
+    Every repetition is an interaction of the monitor, including the frames rendered until the scroll settles.
+    The first L{warmup} repetitions are discarded.
+
+    Usage::
+
+        benchmark = ScrollBenchmark(device, 'com.example', view=vc.findViewByIdOrRaise('id/list'), iterations=20)
+        report = benchmark.run()
+        benchmark.writeReport('scroll.json')
+    '''
+
+    UP = 'up'
+    DOWN = 'down'
+    LEFT = 'left'
+    RIGHT = 'right'
+    ''' The directions the finger moves '''
+
+    SETTLE_POLL_INTERVAL = 0.2
+    ''' The interval, in seconds, between the checks for new frames after a gesture '''
+
+    def __init__(self, device, pkg, view=None, start=None, end=None, direction=UP, duration=150, steps=10,
+                 iterations=10, warmup=2, helper=None, settleTimeout=3.0, refreshPeriod=Dumpsys.REFRESH_PERIOD_60HZ):
+        '''
+        Constructor
+
+        @type device: AdbClient
+        @param device: the device
+        @param pkg: the package rendering the frames
+        @param view: the scrollable view, the gesture goes from 80% to 20% of its size in C{direction}
+        @param start: the start point of the gesture, if there is no C{view}
+        @param end: the end point of the gesture, if there is no C{view}
+        @param direction: the direction of the gesture over the C{view}, one of L{UP}, L{DOWN}, L{LEFT} or L{RIGHT}
+        @param duration: the gesture duration in ms, short durations fling
+        @param steps: the number of steps of the gesture
+        @param iterations: the number of repetitions measured
+        @param warmup: the number of repetitions done before, not measured
+        @type helper: UiAutomatorHelper
+        @param helper: if not C{None}, gestures are done with its C{swipe()} instead of L{AdbClient.drag()}
+        @param settleTimeout: the maximum time, in seconds, waiting for the scroll to stop rendering frames
+        @param refreshPeriod: the display refresh period in ns
+        '''
+
+        if view is not None:
+            start, end = ScrollBenchmark.gesture(view.getCoords(), direction)
+        elif start is None or end is None:
+            raise ValueError('A view or the start and end points should be specified')
+        self.device = device
+        self.pkg = pkg
+        self.start = start
+        self.end = end
+        self.duration = duration
+        self.steps = steps
+        self.iterations = iterations
+        self.warmup = warmup
+        self.helper = helper
+        self.settleTimeout = settleTimeout
+        self.refreshPeriod = refreshPeriod
+        self.monitor = None
+        self.report = None
+
+    @staticmethod
+    def gesture(coords, direction=UP):
+        '''
+        @param coords: the view coordinates ((x0, y0), (x1, y1))
+        @return: the (start, end) points of the gesture over the view
+        '''
+
+        (x0, y0), (x1, y1) = coords
+        cx = (x0 + x1) // 2
+        cy = (y0 + y1) // 2
+        near = lambda a, b: int(a + (b - a) * 0.2)
+        far = lambda a, b: int(a + (b - a) * 0.8)
+        if direction == ScrollBenchmark.UP:
+            return (cx, far(y0, y1)), (cx, near(y0, y1))
+        if direction == ScrollBenchmark.DOWN:
+            return (cx, near(y0, y1)), (cx, far(y0, y1))
+        if direction == ScrollBenchmark.LEFT:
+            return (far(x0, x1), cy), (near(x0, x1), cy)
+        if direction == ScrollBenchmark.RIGHT:
+            return (near(x0, x1), cy), (far(x0, x1), cy)
+        raise ValueError("Invalid direction '%s'" % direction)
+
+    def __gesture(self):
+        if self.helper:
+            self.helper.swipe(startX=self.start[0], startY=self.start[1], endX=self.end[0], endY=self.end[1],
+                              steps=self.steps)
+        else:
+            self.device.drag(self.start, self.end, self.duration, self.steps)
+
+    def __settle(self):
+        deadline = time.time() + self.settleTimeout
+        frames = self.monitor.getFrameCount()
+        while time.time() < deadline:
+            time.sleep(ScrollBenchmark.SETTLE_POLL_INTERVAL)
+            self.monitor.poll()
+            if self.monitor.getFrameCount() == frames:
+                break
+            frames = self.monitor.getFrameCount()
+
+    def __measuredFramestats(self):
+        '''
+        @return: the framestats of the frames rendered since the first measured iteration, or C{None} if there are
+        none
+        '''
+
+        if not self.iterations:
+            return None
+        _, start, _ = self.monitor.interactions[self.warmup]
+        return self.monitor.getFramestats(start)
+
+    def run(self):
+        '''
+        Runs the benchmark.
+
+        @return: the report, also kept in L{report}, containing the C{aggregate} L{Dumpsys.framestatsSummary()} of
+        all the measured frames, the C{distributions} of the per iteration values and the per iteration summaries
+        in C{iterations}
+        '''
+
+        self.monitor = FrameStatsMonitor(self.device, self.pkg, refreshPeriod=self.refreshPeriod)
+        with self.monitor:
+            for i in range(self.warmup + self.iterations):
+                with self.monitor.interaction(i):
+                    self.__gesture()
+                    self.__settle()
+        summaries = [s for label, s in self.monitor.getInteractionSummaries() if label >= self.warmup]
+        frames = self.__measuredFramestats()
+        self.report = {
+            'pkg': self.pkg,
+            'gesture': {'start': list(self.start), 'end': list(self.end), 'duration': self.duration,
+                        'steps': self.steps, 'method': 'swipe' if self.helper else 'drag'},
+            'warmup': self.warmup,
+            'refreshPeriod': self.refreshPeriod,
+            'gaps': self.monitor.gaps,
+            'iterations': [dict(s, iteration=n) for n, s in enumerate(summaries)],
+            'aggregate': Dumpsys.framestatsSummary(frames, self.refreshPeriod),
+            'distributions': dict((k, distribution([s[k] for s in summaries if s['frames']])) for k in
+                                  ['jankPercent', 'p50', 'p90', 'p99', 'max']),
+        }
+        if DEBUG:
+            print("ScrollBenchmark: %s" % self.report['aggregate'], file=sys.stderr)
+        return self.report
+
+    def toJson(self, indent=2):
+        return json.dumps(self.report, indent=indent, sort_keys=True)
+
+    def writeReport(self, filename):
+        '''
+        Writes the report as JSON.
+        '''
+
+        with open(filename, 'w') as f:
+            f.write(self.toJson())
+
+    def plot(self, filename=None):
+        '''
+        Plots the histogram of the frame times of the measured iterations with L{Plot}.
+
+        @param filename: the file where the plot is saved, if C{None} it is shown
+        '''
+
+        from .plot import Plot
+
+        if self.monitor is None:
+            raise RuntimeError('The benchmark should be run before plotting')
+        frames = self.__measuredFramestats()
+        if frames is None:
+            raise RuntimeError('No frames to plot')
+        plot = Plot().appendFramestats(Dumpsys.framestatsDurations(frames)['total'])
+        plot.plot(_type=Dumpsys.FRAMESTATS, filename=filename)
+        return plot
@@ -20,6 +20,7 @@ limitations under the License.
 
 __version__ = '15.4.0'
 
+import importlib.util
 import json
 import os
 import platform
@@ -27,17 +28,13 @@ import re
 import subprocess
 import sys
 import threading
-
-try:
-    import requests
-
-    REQUESTS_AVAILABLE = True
-except:
-    REQUESTS_AVAILABLE = False
 import time
 from ..adb.adbclient import AdbClient
 from ..common import obtainAdbPath
 
+REQUESTS_AVAILABLE = importlib.util.find_spec('requests') is not None
+''' Whether Python Requests can be imported. It is imported when the first L{UiAutomatorHelper} is created. '''
+
 __author__ = 'diego'
 
 DEBUG = False
@@ -105,6 +102,8 @@ On OSX install
 
    $ easy_install requests
 ''')
+        global requests
+        import requests
 
         self.adbClient = adbclient
         ''' The adb client (a.k.a. device) '''
@@ -1 +1 @@
-'''Created on Aug 6, 2013@author: diego'''import osimport reimport subprocessimport sysimport timeimport unittesttry:    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))except:    passfrom androidviewclient3.adb.adbclient import AdbClientfrom androidviewclient3.common import obtainAdbPathVERBOSE = FalseTEST_TEMPERATURE_CONVERTER_APP = FalseTEMPERATURE_CONVERTER_PKG = 'com.example.i2at.tc'TEMPERATURE_CONVERTER_ACTIVITY = 'TemperatureConverterActivity'CALCULATOR_KEYWORD = 'calculator'CALCULATOR_ACTIVITY = 'Calculator'#ANDROIANDROID_SERIAL = 'emulator-5554'class AdbClientTest(unittest.TestCase):    androidSerial = None    ''' The Android device serial number used by default'''    @classmethod    def setUpClass(cls):        cls.adb = obtainAdbPath()        # we use 'fakeserialno' and settransport=False so AdbClient does not try to find the        # serialno in setTransport()        try:            adbClient = AdbClient('fakeserialno', settransport=False)        except RuntimeError as ex:            if re.search('Connection refused', str(ex)):                raise RuntimeError("adb is not running")            raise(ex)        devices = adbClient.getDevices()        if len(devices) == 0:            raise RuntimeError("This tests require at least one device connected. None was found.")        for device in devices:            if device.status == 'device':                cls.androidSerial = device.serialno                if VERBOSE:                    print(("AdbClientTest: using device %s" % cls.androidSerial))                return        raise RuntimeError("No on-line devices found")    def setUp(self):        subprocess.check_call([self.adb, '-s', self.androidSerial, 'forward', '--remove-all'])        self.adbClient = AdbClient(self.androidSerial)        self.assertIsNotNone(self.adbClient, "adbClient is None")    def tearDown(self):        self.adbClient.close()        subprocess.check_call([self.adb, '-s', self.androidSerial, 'forward', '--remove-all'])    def testSerialno_none(self):        try:            adbClient = AdbClient(None)            self.assertTrue(adbClient.checkConnected())            # because serialno is None, transport cannot be set, so next statement            # will raise an exception            adbClient.getSdkVersion()            self.fail("No exception was generated")        except RuntimeError as ex:            self.assertIsNotNone(re.search("ERROR: Transport is not set", str(ex)), "Couldn't find error message: %s" % ex)    def testSerialno_nonExistent(self):        try:            AdbClient('doesnotexist')        except RuntimeError as ex:            self.assertIsNotNone(re.search("ERROR: couldn't find device that matches 'doesnotexist'", str(ex)), "Couldn't find error message: %s" % ex)    def testSerialno_empty(self):        try:            AdbClient('')            self.fail("No exception was generated")        except ValueError:            pass    def testGetDevices(self):        # we use 'fakeserialno' and settransport=False so AdbClient does not try to find the        # serialno in setTransport()        adbclient = AdbClient('fakeserialno', settransport=False)        self.assertTrue(len(adbclient.getDevices()) >= 1)    def testGetDevices_androidSerial(self):        devs = self.adbClient.getDevices()        self.assertTrue(self.androidSerial in [d.serialno for d in devs])    def testGetDevices_regex(self):        adbclient = AdbClient('.*', settransport=False)        self.assertTrue(len(adbclient.getDevices()) >= 1)    #@unittest.skipIf(not re.search('emulator-5554', AdbClientTest.androidSerial), "Supported only when emulator is connected")    def testAdbClient_serialnoNoRegex(self):        if re.search('emulator-5554', AdbClientTest.androidSerial):            adbClient = AdbClient('emulator-5554')            self.assertIsNotNone(adbClient)            self.assertEqual('emulator-5554', adbClient.serialno)    #@unittest.skipIf(not re.search('emulator', AdbClientTest.androidSerial), "Supported only when emulator is connected")    def testAdbClient_serialnoRegex(self):        if re.search('emulator', AdbClientTest.androidSerial):            adbClient = AdbClient('emulator-.*')            self.assertIsNotNone(adbClient)            self.assertTrue(re.match('emulator-.*', adbClient.serialno))    def testAdbClient_serialnoRegexIP(self):        IPRE = re.compile('(\d+\.){3}\d+')        if IPRE.search(AdbClientTest.androidSerial):            adbClient = AdbClient('\d+.*')            self.assertIsNotNone(adbClient)            self.assertTrue(IPRE.match(adbClient.serialno))    def testCheckVersion(self):        self.adbClient.checkVersion()    def testShell(self):        date = self.adbClient.shell('date +"%Y/%m/%d"')        # this raises a ValueError if the format is not correct        time.strptime(date, '%Y/%m/%d\r\n')    def testShell_noOutput(self):        empty = self.adbClient.shell('sleep 3')        self.assertIs('', empty, "Expected empty output but found '%s'" % empty)    def testGetProp_ro_serialno(self):        serialno = self.adbClient.getProperty('ro.serialno')        self.assertIsNotNone(serialno)        if re.search('emulator-.*', self.androidSerial):            self.assertEqual(serialno, '')        elif re.search('VirtualBox', self.adbClient.getProperty('ro.product.model')):            self.assertEqual(serialno, '')        else:            self.assertEqual(serialno, self.androidSerial)    def testGetProp_ro_kernel_qemu(self):        qemu = self.adbClient.getProperty('ro.kernel.qemu')        self.assertIsNotNone(qemu)        if re.search('emulator-.*', self.androidSerial):            self.assertEqual(qemu, '1')        else:            self.assertEqual(qemu, '')    def testPress(self):        self.adbClient.press('KEYCODE_DPAD_UP')    def testTouch(self):        self.adbClient.touch(480, 1250)    def testType(self):        self.adbClient.type('Android is cool')    def testType_digits(self):        self.adbClient.type('1234')    def testType_digits_asInt(self):        self.adbClient.type(1234)    def __checkPackageInstalled(self):        packages = self.adbClient.shell('pm list packages').splitlines()        self.assertTrue(packages, "Could not detect any packages installed")        if TEST_TEMPERATURE_CONVERTER_APP:            self.assertIn('package:' + TEMPERATURE_CONVERTER_PKG, packages, TEMPERATURE_CONVERTER_PKG + " is not installed")            return (TEMPERATURE_CONVERTER_PKG, TEMPERATURE_CONVERTER_ACTIVITY)        else:            for line in packages:                if CALCULATOR_KEYWORD in line:                    pkg = line[line.index(':')+1:]                    self.assertTrue(pkg, "No calculator package to use for testing")                    return (pkg, CALCULATOR_ACTIVITY)            return False    def testStartActivity_component(self):        pkg = self.__checkPackageInstalled()        if pkg:            self.adbClient.startActivity(pkg[0] + '/.' + pkg[1])    def testGetWindows(self):        self.assertIsNotNone(self.adbClient.getWindows())    def testGetFocusedWindow(self):        pkg = self.__checkPackageInstalled()        if pkg:            self.adbClient.startActivity(pkg[0] + '/.' + pkg[1])            time.sleep(3)            w = self.adbClient.getFocusedWindow()            self.assertIsNotNone(w)            self.assertEqual(pkg[0] + '/' + pkg[0] + '.' + pkg[1], w.activity)    def testGetFocusedWindowName(self):        pkg = self.__checkPackageInstalled()        if pkg:            self.adbClient.startActivity(pkg[0] + '/.' + pkg[1])            time.sleep(3)            n = self.adbClient.getFocusedWindowName()            self.assertIsNotNone(n)            self.assertEqual(pkg[0] + '/' + pkg[0] + '.' + pkg[1], n)    def testStartActivity_uri(self):        self.adbClient.startActivity(uri='http://www.google.com')    #@unittest.skip("sequence")    def testCommandsSequence(self):        self.adbClient.setReconnect(True)        if VERBOSE:            print("Sending touch(480, 800)")        self.adbClient.touch(480, 800)        self.assertTrue(self.adbClient.checkConnected())        if VERBOSE:            print("Typing 'command 1'")        self.adbClient.type("command 1")        self.assertTrue(self.adbClient.checkConnected())        if VERBOSE:            print("Typing 'command 2'")        self.adbClient.type("command 2")        self.assertTrue(self.adbClient.checkConnected())        if VERBOSE:            print("Pressing ENTER")        self.adbClient.press('KEYCODE_ENTER')        self.assertTrue(self.adbClient.checkConnected())    def testPressRepeat(self):        self.adbClient.press('DEL', repeat=4)    #def testWake(self):    #    self.adbClient.wake()if __name__ == "__main__":    #print >> sys.stderr, "sys.path=", sys.path    #sys.argv = ['', 'AdbClientTest']    unittest.main()
\ No newline at end of file
+'''Created on Aug 6, 2013@author: diego'''import osimport reimport subprocessimport sysimport timeimport unittesttry:    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))except:    passfrom unittest import mockfrom androidviewclient3.adb.adbclient import AdbClient, ShellSession, Timer, WifiManagerfrom androidviewclient3.common import obtainAdbPathfrom ..mocks import MockAdbServerVERBOSE = FalseTEST_TEMPERATURE_CONVERTER_APP = FalseTEMPERATURE_CONVERTER_PKG = 'com.example.i2at.tc'TEMPERATURE_CONVERTER_ACTIVITY = 'TemperatureConverterActivity'CALCULATOR_KEYWORD = 'calculator'CALCULATOR_ACTIVITY = 'Calculator'#ANDROIANDROID_SERIAL = 'emulator-5554'DUMPSYS_ACTIVITY_TOP = '''\TASK com.example id=42 userId=0\r  ACTIVITY com.example/.MainActivity 5f1e2b3 pid=4321\r    Local Activity 8a2c1d4 State:\rTASK com.android.launcher3 id=1 userId=0\r  ACTIVITY com.android.launcher3/.Launcher 9c8d7e6 pid=1234\r'''DUMPSYS_WIFI = '''\Wi-Fi is enabled\rStay-awake conditions: 0\rmWifiController:\r'''class AdbClientTest(unittest.TestCase):    androidSerial = None    ''' The Android device serial number used by default'''    @classmethod    def setUpClass(cls):        cls.adb = obtainAdbPath()        # we use 'fakeserialno' and settransport=False so AdbClient does not try to find the        # serialno in setTransport()        try:            adbClient = AdbClient('fakeserialno', settransport=False)        except RuntimeError as ex:            if re.search('Connection refused', str(ex)):                raise RuntimeError("adb is not running")            raise(ex)        devices = adbClient.getDevices()        if len(devices) == 0:            raise RuntimeError("This tests require at least one device connected. None was found.")        for device in devices:            if device.status == 'device':                cls.androidSerial = device.serialno                if VERBOSE:                    print(("AdbClientTest: using device %s" % cls.androidSerial))                return        raise RuntimeError("No on-line devices found")    def setUp(self):        subprocess.check_call([self.adb, '-s', self.androidSerial, 'forward', '--remove-all'])        self.adbClient = AdbClient(self.androidSerial)        self.assertIsNotNone(self.adbClient, "adbClient is None")    def tearDown(self):        self.adbClient.close()        subprocess.check_call([self.adb, '-s', self.androidSerial, 'forward', '--remove-all'])    def testSerialno_none(self):        try:            adbClient = AdbClient(None)            self.assertTrue(adbClient.checkConnected())            # because serialno is None, transport cannot be set, so next statement            # will raise an exception            adbClient.getSdkVersion()            self.fail("No exception was generated")        except RuntimeError as ex:            self.assertIsNotNone(re.search("ERROR: Transport is not set", str(ex)), "Couldn't find error message: %s" % ex)    def testSerialno_nonExistent(self):        try:            AdbClient('doesnotexist')        except RuntimeError as ex:            self.assertIsNotNone(re.search("ERROR: couldn't find device that matches 'doesnotexist'", str(ex)), "Couldn't find error message: %s" % ex)    def testSerialno_empty(self):        try:            AdbClient('')            self.fail("No exception was generated")        except ValueError:            pass    def testGetDevices(self):        # we use 'fakeserialno' and settransport=False so AdbClient does not try to find the        # serialno in setTransport()        adbclient = AdbClient('fakeserialno', settransport=False)        self.assertTrue(len(adbclient.getDevices()) >= 1)    def testGetDevices_androidSerial(self):        devs = self.adbClient.getDevices()        self.assertTrue(self.androidSerial in [d.serialno for d in devs])    def testGetDevices_regex(self):        adbclient = AdbClient('.*', settransport=False)        self.assertTrue(len(adbclient.getDevices()) >= 1)    #@unittest.skipIf(not re.search('emulator-5554', AdbClientTest.androidSerial), "Supported only when emulator is connected")    def testAdbClient_serialnoNoRegex(self):        if re.search('emulator-5554', AdbClientTest.androidSerial):            adbClient = AdbClient('emulator-5554')            self.assertIsNotNone(adbClient)            self.assertEqual('emulator-5554', adbClient.serialno)    #@unittest.skipIf(not re.search('emulator', AdbClientTest.androidSerial), "Supported only when emulator is connected")    def testAdbClient_serialnoRegex(self):        if re.search('emulator', AdbClientTest.androidSerial):            adbClient = AdbClient('emulator-.*')            self.assertIsNotNone(adbClient)            self.assertTrue(re.match('emulator-.*', adbClient.serialno))    def testAdbClient_serialnoRegexIP(self):        IPRE = re.compile('(\d+\.){3}\d+')        if IPRE.search(AdbClientTest.androidSerial):            adbClient = AdbClient('\d+.*')            self.assertIsNotNone(adbClient)            self.assertTrue(IPRE.match(adbClient.serialno))    def testCheckVersion(self):        self.adbClient.checkVersion()    def testShell(self):        date = self.adbClient.shell('date +"%Y/%m/%d"')        # this raises a ValueError if the format is not correct        time.strptime(date, '%Y/%m/%d\r\n')    def testShell_noOutput(self):        empty = self.adbClient.shell('sleep 3')        self.assertIs('', empty, "Expected empty output but found '%s'" % empty)    def testGetProp_ro_serialno(self):        serialno = self.adbClient.getProperty('ro.serialno')        self.assertIsNotNone(serialno)        if re.search('emulator-.*', self.androidSerial):            self.assertEqual(serialno, '')        elif re.search('VirtualBox', self.adbClient.getProperty('ro.product.model')):            self.assertEqual(serialno, '')        else:            self.assertEqual(serialno, self.androidSerial)    def testGetProp_ro_kernel_qemu(self):        qemu = self.adbClient.getProperty('ro.kernel.qemu')        self.assertIsNotNone(qemu)        if re.search('emulator-.*', self.androidSerial):            self.assertEqual(qemu, '1')        else:            self.assertEqual(qemu, '')    def testPress(self):        self.adbClient.press('KEYCODE_DPAD_UP')    def testTouch(self):        self.adbClient.touch(480, 1250)    def testType(self):        self.adbClient.type('Android is cool')    def testType_digits(self):        self.adbClient.type('1234')    def testType_digits_asInt(self):        self.adbClient.type(1234)    def __checkPackageInstalled(self):        packages = self.adbClient.shell('pm list packages').splitlines()        self.assertTrue(packages, "Could not detect any packages installed")        if TEST_TEMPERATURE_CONVERTER_APP:            self.assertIn('package:' + TEMPERATURE_CONVERTER_PKG, packages, TEMPERATURE_CONVERTER_PKG + " is not installed")            return (TEMPERATURE_CONVERTER_PKG, TEMPERATURE_CONVERTER_ACTIVITY)        else:            for line in packages:                if CALCULATOR_KEYWORD in line:                    pkg = line[line.index(':')+1:]                    self.assertTrue(pkg, "No calculator package to use for testing")                    return (pkg, CALCULATOR_ACTIVITY)            return False    def testStartActivity_component(self):        pkg = self.__checkPackageInstalled()        if pkg:            self.adbClient.startActivity(pkg[0] + '/.' + pkg[1])    def testMeasureLaunch_cold(self):        pkg = self.__checkPackageInstalled()        if pkg:            launch = self.adbClient.measureLaunch(pkg[0] + '/.' + pkg[1], mode=AdbClient.COLD, iterations=3)            self.assertEqual(3, len(launch['samples']['totalTime']))            self.assertGreater(launch['totalTime']['median'], 0)            self.assertLessEqual(launch['totalTime']['median'], launch['totalTime']['max'])    def testGetWindows(self):        self.assertIsNotNone(self.adbClient.getWindows())    def testGetFocusedWindow(self):        pkg = self.__checkPackageInstalled()        if pkg:            self.adbClient.startActivity(pkg[0] + '/.' + pkg[1])            time.sleep(3)            w = self.adbClient.getFocusedWindow()            self.assertIsNotNone(w)            self.assertEqual(pkg[0] + '/' + pkg[0] + '.' + pkg[1], w.activity)    def testGetFocusedWindowName(self):        pkg = self.__checkPackageInstalled()        if pkg:            self.adbClient.startActivity(pkg[0] + '/.' + pkg[1])            time.sleep(3)            n = self.adbClient.getFocusedWindowName()            self.assertIsNotNone(n)            self.assertEqual(pkg[0] + '/' + pkg[0] + '.' + pkg[1], n)    def testStartActivity_uri(self):        self.adbClient.startActivity(uri='http://www.google.com')    #@unittest.skip("sequence")    def testCommandsSequence(self):        self.adbClient.setReconnect(True)        if VERBOSE:            print("Sending touch(480, 800)")        self.adbClient.touch(480, 800)        self.assertTrue(self.adbClient.checkConnected())        if VERBOSE:            print("Typing 'command 1'")        self.adbClient.type("command 1")        self.assertTrue(self.adbClient.checkConnected())        if VERBOSE:            print("Typing 'command 2'")        self.adbClient.type("command 2")        self.assertTrue(self.adbClient.checkConnected())        if VERBOSE:            print("Pressing ENTER")        self.adbClient.press('KEYCODE_ENTER')        self.assertTrue(self.adbClient.checkConnected())    def testPressRepeat(self):        self.adbClient.press('DEL', repeat=4)    #def testWake(self):    #    self.adbClient.wake()class AdbClientMockTest(unittest.TestCase):    '''    Tests using a L{MockAdbServer} instead of a device.    '''    def setUp(self):        self.server = MockAdbServer()        patcher = mock.patch.object(AdbClient, 'connect', self.server.connect)        patcher.start()        self.addCleanup(patcher.stop)        self.adbClient = AdbClient(self.server.serialno)    def testShellSession(self):        self.server.respond('^getprop ro.product.model$', 'Mock\n')        self.server.respond('^false$', ('', 1))        with self.adbClient.shell() as session:            self.assertIsInstance(session, ShellSession)            self.assertEqual('Mock\n', session.shell('getprop ro.product.model'))            self.assertEqual(('', 1), session.run('false'))            self.assertEqual(('Mock\n', 0), session.run('getprop ro.product.model'))        self.assertEqual(['getprop ro.product.model', 'false', 'getprop ro.product.model'],                         self.server.commands[-3:])        self.assertRaises(RuntimeError, session.run, 'true')    def testShellSession_outputContainingSentinels(self):        output = 'a\n%s_00000000_1\n%s_00000000_1:0\nb\n' % (ShellSession.BEGIN, ShellSession.END)        self.server.respond('^cat sentinels.txt$', output)        with self.adbClient.shell() as session:            self.assertEqual((output, 0), session.run('cat sentinels.txt'))    def testShellSession_timeout(self):        self.server.respond('^sleep 100$', None)        self.server.respond('^echo ok$', 'ok\n')        with self.adbClient.shell() as session:            self.assertRaises(Timer.TimeoutException, session.run, 'sleep 100', timeout=0.1)            self.assertEqual(1, self.server.interrupts)            # the echo of the interrupted line and the ^C are not taken as the output of the next command            self.assertEqual(('ok\n', 0), session.run('echo ok'))    def __respondFiltering(self, available, outputs):        '''        Answers the commands in C{outputs}, filtered by C{grep} and C{head} like the device does, if available.        '''        def filtered(m):            lines = outputs[m.group(1)].splitlines(True)            if m.group(3):                lines = [l for l in lines if re.search(m.group(3), l)][:int(m.group(2) or len(lines))]            if m.group(4):                lines = lines[:int(m.group(4))]            return ''.join(lines)        self.server.respond(r"^echo avc \| grep -m 1 -E 'a\(v\)c' \| head -n 1$", 'avc\r\n' if available else '')        self.server.respond(r"^(%s)(?: \| grep(?: -m (\d+))? -E '(.*)')?(?: \| head -n (\d+))?$" %                            '|'.join(outputs.keys()), filtered)    def __testShellFiltered(self, available):        self.__respondFiltering(available, {'dumpsys activity top': DUMPSYS_ACTIVITY_TOP, 'dumpsys wifi': DUMPSYS_WIFI})        self.assertEqual(available, self.adbClient.isOnDeviceFilteringAvailable())        self.assertEqual(('com.example', '.MainActivity', '4321'), self.adbClient.getTopActivityNameAndPid())        self.assertEqual(WifiManager.WIFI_STATE_ENABLED, WifiManager(self.adbClient).getWifiState())        self.assertEqual('  ACTIVITY com.android.launcher3/.Launcher 9c8d7e6 pid=1234\r\n',                         self.adbClient.shellFiltered('dumpsys activity top', 'launcher3/', maxCount=1))        return self.server.commands[-3:]    def testShellFiltered_onDevice(self):        self.assertEqual(["dumpsys activity top | grep -m 1 -E '^ *ACTIVITY '", 'dumpsys wifi | head -n 1',                          "dumpsys activity top | grep -m 1 -E 'launcher3/'"], self.__testShellFiltered(True))    def testShellFiltered_host(self):        self.assertEqual(['dumpsys activity top', 'dumpsys wifi', 'dumpsys activity top'],                         self.__testShellFiltered(False))        self.assertRaises(ValueError, self.adbClient.shellFiltered, 'dumpsys wifi', "'")    def __respondLaunches(self, mode):        '''        Answers C{am start -W}, the n-th launch of the activity taking 100*n ms, and logs its C{Displayed} line,        which hot launches, except the first one, don't.        '''        launches = []        def start(m):            if 'category.HOME' in m.group(1):                return 'Status: ok\nComplete\n'            launches.append(m.group(1))            n = len(launches)            if mode != AdbClient.HOT or n == 1:                self.server.log('10-19 10:00:00.%03d  1000  1010 I ActivityTaskManager: Displayed '                                'com.example/.MainActivity: +%dms\n' % (n, 100 * n + 5))            return 'Status: ok\nThisTime: %d\nTotalTime: %d\nWaitTime: %d\nComplete\n' % (                100 * n, 100 * n, 100 * n + 10)        self.server.respond('^logcat ', None)        self.server.respond('^date ', '10-19 10:00:00.000\n')        self.server.respond('^am start -W (.*)$', start)        return launches    def testMeasureLaunch_cold(self):        launches = self.__respondLaunches(AdbClient.COLD)        launch = self.adbClient.measureLaunch('com.example/.MainActivity', mode=AdbClient.COLD, iterations=3,                                              displayed=True)        self.assertEqual(4, len(launches))        self.assertEqual([200, 300, 400], launch['samples']['totalTime'])        self.assertEqual([205, 305, 405], launch['samples']['displayed'])        self.assertEqual(4, self.server.commands.count('am force-stop com.example'))    def testMeasureLaunch_warm(self):        launches = self.__respondLaunches(AdbClient.WARM)        launch = self.adbClient.measureLaunch('com.example/.MainActivity', mode=AdbClient.WARM, iterations=3,                                              warmup=0, displayed=True)        # the pre-launch, whose Displayed line is logged before logcat is read, is not measured        self.assertEqual(['-n com.example/.MainActivity'] + ['--activity-clear-task -n com.example/.MainActivity'] * 3,                         launches)        self.assertEqual([200, 300, 400], launch['samples']['totalTime'])        self.assertEqual([205, 305, 405], launch['samples']['displayed'])        self.assertEqual(310, launch['waitTime']['median'])    def testMeasureLaunch_hot(self):        launches = self.__respondLaunches(AdbClient.HOT)        start = time.time()        launch = self.adbClient.measureLaunch('com.example/.MainActivity', mode=AdbClient.HOT, iterations=3,                                              warmup=0, displayed=True, timeout=5)        self.assertLess(time.time() - start, 5)        self.assertEqual(4, len(launches))        self.assertEqual([200, 300, 400], launch['samples']['totalTime'])        self.assertEqual([None, None, None], launch['samples']['displayed'])        self.assertFalse([c for c in self.server.commands if c.startswith('logcat')])    def testSubstituteDeviceTemplate_lazyFields(self):        calls = []        self.adbClient.registerTemplateField('counted', lambda: calls.append(1) or str(len(calls)))        self.adbClient.registerTemplateField('cached', lambda: calls.append(1) or 'cached', ttl=None)        commands = len(self.server.commands)        self.assertEqual('no fields', self.adbClient.substituteDeviceTemplate('no fields'))        self.assertEqual('MOCK12345678', self.adbClient.substituteDeviceTemplate('${serialno}'))        self.assertEqual([], calls)        # focusedwindowname was not used, so the device was not queried        self.assertEqual(commands, len(self.server.commands))        self.assertEqual('1-1', self.adbClient.substituteDeviceTemplate('${counted}-${counted}'))        self.assertEqual('2', self.adbClient.substituteDeviceTemplate('$counted'))        self.assertEqual('cached cached', self.adbClient.substituteDeviceTemplate('$cached ${cached}'))        self.assertEqual('cached', self.adbClient.substituteDeviceTemplate('$cached'))        self.assertEqual(3, len(calls))if __name__ == "__main__":    #print >> sys.stderr, "sys.path=", sys.path    #sys.argv = ['', 'AdbClientTest']    unittest.main()
\ No newline at end of file
@@ -0,0 +1,120 @@
+import math
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+try:
+    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))
+except:
+    pass
+
+from androidviewclient3.adb.adbclient import AdbClient
+from androidviewclient3.adb.devicesampler import DeviceSampler
+from ..mocks import MockAdbServer
+
+
+def sampleRecord(uptime, user, idle, utime, rss=2500, memFree=500000):
+    '''
+    @return: the record written by the loop, for a process whose name contains spaces and parenthesis
+    '''
+
+    cpu = '%d 0 %d %d 10 0 5 0 0 0' % (user, user // 2, idle)
+    pst = '4321 (com.example (main)) S 1 1 0 0 -1 1077952832 5000 0 0 0 %d %d 0 0 20 0 30 0 500 1500000000 %d' % (
+        utime, utime // 4, rss)
+    return 'S|%.2f|%s|%s| MemTotal:2000000 MemFree:%d MemAvailable:900000 Cached:300000\r\n' % (
+        uptime, cpu, pst, memFree)
+
+
+MEMINFO_RECORD = '''\
+M|101.00\r
+** MEMINFO in pid 4321 [com.example] **\r
+  Native Heap     10000    10000        0        0    16384    12000     4384\r
+  Dalvik Heap     2048     2000        0        0     4096     3000     1096\r
+        TOTAL    40000    30000     1000        0    20480    15000     5480\r
+               Views:       20         ViewRootImpl:        1\r
+         AppContexts:        3           Activities:        1\r
+E|\r
+'''
+
+LOOP_OUTPUT = sampleRecord(100.0, 1000, 8000, 100) + sampleRecord(101.0, 1050, 8150, 120, memFree=490000) + \
+              MEMINFO_RECORD + sampleRecord(102.0, 1150, 8200, 170, rss=2600)
+
+
+class DeviceSamplerTests(unittest.TestCase):
+
+    def testGetCommand(self):
+        cmd = DeviceSampler(None, 'com.example', interval=0.5).getCommand()
+        self.assertTrue(cmd.startswith('set -- $(pidof com.example); p=$1; '))
+        self.assertTrue(cmd.endswith('sleep 0.5; done'))
+        self.assertNotIn('dumpsys', cmd)
+        cmd = DeviceSampler(None, 'com.example', pid=4321, meminfoEvery=10).getCommand()
+        self.assertTrue(cmd.startswith('p=4321; '))
+        self.assertIn('if [ $((n % 10)) -eq 0 ]; then echo "M|$up"; dumpsys meminfo com.example; echo "E|"; fi', cmd)
+        self.assertRaises(ValueError, DeviceSampler, None, meminfoEvery=10)
+
+    def testFeed(self):
+        sampler = DeviceSampler(None, 'com.example', meminfoEvery=2, capacity=2)
+        data = LOOP_OUTPUT.encode('utf-8')
+        # records split at every possible place
+        for i in range(0, len(data), 7):
+            sampler.feed(data[i:i + 7])
+        self.assertEqual(3, sampler.getSampleCount())
+        self.assertEqual([100.0, 101.0, 102.0], sampler.getSamples('uptime').tolist())
+        self.assertEqual([100 + 25, 120 + 30, 170 + 42], sampler.getSamples('procCpu').tolist())
+        self.assertEqual([10000, 10000, 10400], sampler.getSamples('procRss').tolist())
+        self.assertEqual([500000, 490000, 500000], sampler.getSamples('memFree').tolist())
+        uptimes, values = sampler.getMeminfo('views')
+        self.assertEqual(([101.0], [20]), (uptimes.tolist(), values.tolist()))
+        self.assertEqual(40000, sampler.getMeminfo()[1][0][0])
+
+    def testParseLine_noProcess(self):
+        sampler = DeviceSampler(None)
+        sampler.parseLine('S|100.00|1000 0 500 8000 10 0 5 0 0 0|| MemTotal:2000000')
+        sampler.parseLine('unexpected')
+        sampler.parseLine('S|truncated')
+        self.assertEqual(1, sampler.getSampleCount())
+        samples = sampler.getSamples()[0]
+        self.assertEqual(1000 + 500 + 8000 + 10 + 5, samples[1])
+        self.assertEqual(8010, samples[2])
+        self.assertTrue(math.isnan(samples[3]))
+        self.assertTrue(math.isnan(samples[DeviceSampler.COLUMNS.index('memFree')]))
+
+    def testFeed_malformedRecords(self):
+        sampler = DeviceSampler(None, 'com.example')
+        bad = ['S|100.50|1000 0||\r\n', 'S||1000 0 500 8000 10 0 5 0 0 0|| MemTotal:2000000\r\n',
+               'S|100.70|1000 0 500 8000 10 0 5 0 0 0|4321 (com.example) S 1|\r\n', 'M|\r\n']
+        with mock.patch('sys.stderr') as stderr:
+            sampler.feed((sampleRecord(100.0, 1000, 8000, 100) + ''.join(bad) +
+                          sampleRecord(101.0, 1050, 8150, 120)).encode('utf-8'))
+        self.assertEqual(len(bad), len([c for c in stderr.write.call_args_list if 'skipping' in c[0][0]]))
+        self.assertEqual([100.0, 101.0], sampler.getSamples('uptime').tolist())
+        self.assertEqual([100 + 25, 120 + 30], sampler.getSamples('procCpu').tolist())
+
+    def testGetCpuUsage(self):
+        sampler = DeviceSampler(None, 'com.example')
+        sampler.feed(LOOP_OUTPUT.encode('utf-8'))
+        uptimes, system, process = sampler.getCpuUsage()
+        self.assertEqual([101.0, 102.0], uptimes.tolist())
+        # 50 user + 25 system + 150 idle jiffies, then 100 user + 50 system + 50 idle
+        self.assertAlmostEqual(100.0 * 75 / 225, system[0])
+        self.assertAlmostEqual(100.0 * 25 / 225, process[0])
+        self.assertAlmostEqual(100.0 * 150 / 200, system[1])
+        self.assertAlmostEqual(100.0 * 62 / 200, process[1])
+
+    def testStartStop(self):
+        server = MockAdbServer()
+        # a truncated record doesn't stop the reader thread
+        server.respond('^set -- \\$\\(pidof com.example\\); ', LOOP_OUTPUT.replace('\r\nM|', '\r\nS|1|1000 0||\r\nM|'))
+        with mock.patch.object(AdbClient, 'connect', server.connect), mock.patch('sys.stderr'):
+            with DeviceSampler(AdbClient(server.serialno), 'com.example') as sampler:
+                deadline = time.time() + 5
+                while sampler.getSampleCount() < 3 and time.time() < deadline:
+                    time.sleep(0.01)
+        self.assertEqual(3, sampler.getSampleCount())
+        self.assertIsNone(sampler.socket)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+try:
+    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))
+except:
+    pass
+
+from androidviewclient3.adb.adbclient import AdbClient
+from androidviewclient3.adb.devicestate import DeviceState
+from ..mocks import MockAdbServer
+
+DEVICE_STATE_OUT = '''\
+__AVC_SECTION__policy\r
+WINDOW MANAGER POLICY STATE (dumpsys window policy)\r
+    mScreenOnEarly=true mScreenOnFully=true\r
+    mShowingLockscreen=false mShowingDream=false mDreamingLockscreen=false\r
+__AVC_SECTION__input_method\r
+  mSystemReady=true mInteractive=true\r
+  mInputShown=true mShowRequested=true\r
+__AVC_SECTION__display\r
+  mDefaultViewport=DisplayViewport{valid=true, displayId=0, orientation=1, logicalFrame=Rect(0, 0 - 1920, 1080), deviceWidth=1080, deviceHeight=1920}\r
+__AVC_SECTION__windows\r
+  mCurrentFocus=Window{8a2c1d4 u0 com.example/com.example.MainActivity}\r
+  mFocusedApp=AppWindowToken{5f1e2b3 token=Token{9c8d7e6 ActivityRecord{3b4a5c6 u0 com.example/.MainActivity t42}}}\r
+'''
+
+DEVICE_STATE_OUT_OLD = '''\
+__AVC_SECTION__policy
+    mScreenOnFully=false
+    mShowingLockscreen=true
+__AVC_SECTION__input_method
+__AVC_SECTION__display
+  DisplayInfo{"Built-in Screen", app 480 x 800, real 480 x 800, rotation 0, density 240}
+__AVC_SECTION__windows
+  mCurrentFocus=Window{41a5e4c8 StatusBar}
+'''
+
+
+class DeviceStateTests(unittest.TestCase):
+
+    def testGetCommand(self):
+        cmd = DeviceState.getCommand()
+        self.assertTrue(cmd.startswith('echo __AVC_SECTION__policy; dumpsys window policy; '))
+        self.assertNotIn('grep', cmd)
+        self.assertEqual(len(DeviceState.SECTIONS), DeviceState.getCommand(filtered=True).count(' | grep -E '))
+
+    def testSplitSections(self):
+        sections = DeviceState.splitSections(DEVICE_STATE_OUT)
+        self.assertEqual(['policy', 'input_method', 'display', 'windows'], list(sections.keys()))
+        self.assertTrue(sections['input_method'].startswith('  mSystemReady=true'))
+
+    def testParse(self):
+        state = DeviceState(out=DEVICE_STATE_OUT)
+        self.assertTrue(state.screenOn)
+        self.assertFalse(state.locked)
+        self.assertTrue(state.keyboardShown)
+        self.assertEqual(1, state.orientation)
+        self.assertEqual('com.example/com.example.MainActivity', state.focusedWindowName)
+        self.assertEqual('com.example/.MainActivity', state.topActivityName)
+
+    def testParse_olderDevice(self):
+        state = DeviceState(out=DEVICE_STATE_OUT_OLD)
+        self.assertFalse(state.screenOn)
+        self.assertTrue(state.locked)
+        self.assertFalse(state.keyboardShown)
+        self.assertEqual(0, state.orientation)
+        self.assertEqual('StatusBar', state.focusedWindowName)
+        self.assertIsNone(state.topActivityName)
+
+    def testParse_missingSections(self):
+        state = DeviceState(out='')
+        self.assertIsNone(state.screenOn)
+        self.assertIsNone(state.locked)
+        self.assertFalse(state.keyboardShown)
+        self.assertIsNone(state.orientation)
+
+    def testAdbClientGetters(self):
+        server = MockAdbServer()
+        server.respond('^echo __AVC_SECTION__policy; ', DEVICE_STATE_OUT)
+        with mock.patch.object(AdbClient, 'connect', server.connect):
+            device = AdbClient(server.serialno)
+            self.assertTrue(device.isKeyboardShown())
+            self.assertTrue(device.isScreenOn())
+            self.assertFalse(device.isLocked())
+            # a single snapshot answered all the getters
+            self.assertEqual(1, sum(1 for c in server.commands if c.startswith('echo __AVC_SECTION__')))
+            device.touch(10, 10)
+            device.isKeyboardShown()
+            self.assertEqual(2, sum(1 for c in server.commands if c.startswith('echo __AVC_SECTION__')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1 @@
-import osimport unittestimport systry:    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))except:    passfrom androidviewclient3.adb import adbclientfrom androidviewclient3.adb.dumpsys import DumpsysSAMPLE_PROCESS_NAME = 'com.android.systemui'SERIALNO = '.*'class DumpsysTests(unittest.TestCase):    @classmethod    def setUpClass(cls):        cls.device = adbclient.AdbClient(SERIALNO, ignoreversioncheck=False, timeout=60)    def setUp(self):        super(DumpsysTests, self).setUp()        self.dumpsysMeminfo = Dumpsys.meminfo(self.device, SAMPLE_PROCESS_NAME)        self.dumpsysGfxinfo = Dumpsys.gfxinfo(self.device, SAMPLE_PROCESS_NAME, Dumpsys.FRAMESTATS)    def __check_meminfo_values(self, dumpsys):        self.assertGreater(dumpsys.total, 0)        self.assertGreater(dumpsys.nativeHeap, 0)        self.assertGreater(dumpsys.dalvikHeap, 0)        self.assertGreaterEqual(dumpsys.views, 0)        self.assertGreaterEqual(dumpsys.activities, 0)        self.assertGreaterEqual(dumpsys.appContexts, 0)        self.assertGreaterEqual(dumpsys.viewRootImpl, 0)    def test_meminfo_1(self):        self.__check_meminfo_values(self.dumpsysMeminfo)    def test_meminfo_2(self):        self.__check_meminfo_values(self.dumpsysMeminfo)    def test_listSubCommands(self):        self.assertIsNotNone(Dumpsys.listSubCommands(self.device))    def test_get_total(self):        self.assertGreater(self.dumpsysMeminfo.get(Dumpsys.TOTAL), 0)    def test_get_activities(self):        self.assertGreaterEqual(self.dumpsysMeminfo.get(Dumpsys.ACTIVITIES), 0)    def test_gfxinfo_1(self):        self.assertGreater(len(self.dumpsysGfxinfo.gfxProfileData), 0)    # def test_gfxinfo_2(self):    #     self.assertGreater(len(self.dumpsysGfxinfo.gfxProfileDataDiff), 0)    def test_parseGfxinfoFramestats(self):        out = '''\SomethingSomethingSomethingSomething---PROFILEDATA---Flags,IntendedVsync,Vsync,OldestInputEvent,NewestInputEvent,HandleInputStart,AnimationStart,PerformTraversalsStart,DrawStart,SyncQueued,SyncStart,IssueDrawCommandsStart,SwapBuffers,FrameCompleted,0,1538750837982,1539034171304,9223372036854775807,0,1539047401632,1539047424965,1539047516299,1539047541049,1539047873632,1539048042382,1539048073215,1539085917465,1539087148465,0,1808866542439,1808899875771,9223372036854775807,0,1808909338401,1808909869234,1808911205068,1808911288234,1808911729484,1808911906651,1808912287651,1808920894568,1808922659568,---PROFILEDATA---SomethingSomethingSomethingSomethingSomething---PROFILEDATA---Flags,IntendedVsync,Vsync,OldestInputEvent,NewestInputEvent,HandleInputStart,AnimationStart,PerformTraversalsStart,DrawStart,SyncQueued,SyncStart,IssueDrawCommandsStart,SwapBuffers,FrameCompleted,1,1538295812863,1538495812855,9223372036854775807,0,1538506027632,1538506079049,1538506994882,1538517724382,1538550285632,1538550403216,1538550458966,1538559445132,1538561759382,---PROFILEDATA---        '''        dumpsys = Dumpsys(None, None)        dumpsys.parseGfxinfoFramestats(out)if __name__ == '__main__':    unittest.main()
\ No newline at end of file
+import osimport unittestimport systry:    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))except:    passfrom androidviewclient3.adb import adbclientfrom androidviewclient3.adb.dumpsys import Dumpsysfrom androidviewclient3.adb.dumpsysdocument import DumpsysDocumentSAMPLE_PROCESS_NAME = 'com.android.systemui'SERIALNO = '.*'class DumpsysTests(unittest.TestCase):    @classmethod    def setUpClass(cls):        cls.device = adbclient.AdbClient(SERIALNO, ignoreversioncheck=False, timeout=60)    def setUp(self):        super(DumpsysTests, self).setUp()        self.dumpsysMeminfo = Dumpsys.meminfo(self.device, SAMPLE_PROCESS_NAME)        self.dumpsysGfxinfo = Dumpsys.gfxinfo(self.device, SAMPLE_PROCESS_NAME, Dumpsys.FRAMESTATS)    def __check_meminfo_values(self, dumpsys):        self.assertGreater(dumpsys.total, 0)        self.assertGreater(dumpsys.nativeHeap, 0)        self.assertGreater(dumpsys.dalvikHeap, 0)        self.assertGreaterEqual(dumpsys.views, 0)        self.assertGreaterEqual(dumpsys.activities, 0)        self.assertGreaterEqual(dumpsys.appContexts, 0)        self.assertGreaterEqual(dumpsys.viewRootImpl, 0)    def test_meminfo_1(self):        self.__check_meminfo_values(self.dumpsysMeminfo)    def test_meminfo_2(self):        self.__check_meminfo_values(self.dumpsysMeminfo)    def test_listSubCommands(self):        self.assertIsNotNone(Dumpsys.listSubCommands(self.device))    def test_get_total(self):        self.assertGreater(self.dumpsysMeminfo.get(Dumpsys.TOTAL), 0)    def test_get_activities(self):        self.assertGreaterEqual(self.dumpsysMeminfo.get(Dumpsys.ACTIVITIES), 0)    def test_collect(self):        meminfo = Dumpsys.MEMINFO + ' ' + SAMPLE_PROCESS_NAME        dumpsys = Dumpsys.collect(self.device, [Dumpsys.WINDOW, meminfo])        self.assertEqual([Dumpsys.WINDOW, meminfo], list(dumpsys.keys()))        self.assertTrue('windows' in dumpsys[Dumpsys.WINDOW].getDocument())        self.assertGreater(dumpsys[meminfo].get(Dumpsys.TOTAL), 0)    def test_gfxinfo_1(self):        self.assertGreater(len(self.dumpsysGfxinfo.gfxProfileData), 0)    # def test_gfxinfo_2(self):    #     self.assertGreater(len(self.dumpsysGfxinfo.gfxProfileDataDiff), 0)class DumpsysParseTests(unittest.TestCase):    '''    Parses recorded dumpsys output, no device needed.    '''    def test_parseGfxinfoFramestats(self):        out = '''\SomethingSomethingSomethingSomething---PROFILEDATA---Flags,IntendedVsync,Vsync,OldestInputEvent,NewestInputEvent,HandleInputStart,AnimationStart,PerformTraversalsStart,DrawStart,SyncQueued,SyncStart,IssueDrawCommandsStart,SwapBuffers,FrameCompleted,0,1538750837982,1539034171304,9223372036854775807,0,1539047401632,1539047424965,1539047516299,1539047541049,1539047873632,1539048042382,1539048073215,1539085917465,1539087148465,0,1808866542439,1808899875771,9223372036854775807,0,1808909338401,1808909869234,1808911205068,1808911288234,1808911729484,1808911906651,1808912287651,1808920894568,1808922659568,---PROFILEDATA---SomethingSomethingSomethingSomethingSomething---PROFILEDATA---Flags,IntendedVsync,Vsync,OldestInputEvent,NewestInputEvent,HandleInputStart,AnimationStart,PerformTraversalsStart,DrawStart,SyncQueued,SyncStart,IssueDrawCommandsStart,SwapBuffers,FrameCompleted,1,1538295812863,1538495812855,9223372036854775807,0,1538506027632,1538506079049,1538506994882,1538517724382,1538550285632,1538550403216,1538550458966,1538559445132,1538561759382,---PROFILEDATA---        '''        dumpsys = Dumpsys(None, None)        dumpsys.parseGfxinfoFramestats(out)        self.assertEqual(3, len(dumpsys.framestatsArray))        self.assertEqual(14, len(dumpsys.framestatsArray.dtype.names))        self.assertEqual(2, len(dumpsys.gfxProfileData))        self.assertAlmostEqual(336.310483, dumpsys.framestats[0])        summary = dumpsys.getFramestatsSummary()        self.assertEqual(2, summary['frames'])        self.assertEqual(2, summary['janky'])        self.assertAlmostEqual(336.310483, summary['max'])        merged = Dumpsys.mergeFramestats(dumpsys.framestatsArray, dumpsys.framestatsArray[:2])        self.assertEqual(3, len(merged))    def test_parseMeminfoValues(self):        out = '''\                   Pss  Private  Private  SwapPss     Heap     Heap     Heap                 Total    Dirty    Clean    Dirty     Size    Alloc     Free  Native Heap     5000     4000        0        0     8000     6000     2000  Dalvik Heap     3000     2000        0        0     4000     3000     1000        TOTAL    30100    20000     3000        0    12000     9000     3000 App Summary           TOTAL PSS:    30100            TOTAL RSS:    41000 Objects               Views:       11         ViewRootImpl:        1         AppContexts:        3           Activities:        2        '''        values = Dumpsys.parseMeminfoValues(out)        self.assertEqual(30100, values['total'])        self.assertEqual(5000, values['nativeHeap'])        self.assertEqual(3000, values['dalvikHeap'])        self.assertEqual(11, values['views'])        self.assertEqual(2, values['activities'])        self.assertEqual(3, values['appContexts'])        self.assertEqual(1, values['viewRootImpl'])    def test_parseGfxinfoFramestats_blankLines(self):        out = '''\---PROFILEDATA---Flags,IntendedVsync,Vsync,OldestInputEvent,NewestInputEvent,HandleInputStart,AnimationStart,PerformTraversalsStart,DrawStart,SyncQueued,SyncStart,IssueDrawCommandsStart,SwapBuffers,FrameCompleted,1,1538295812863,1538495812855,9223372036854775807,0,1538506027632,1538506079049,1538506994882,1538517724382,1538550285632,1538550403216,1538550458966,1538559445132,1538561759382,0,1538750837982,1539034171304,9223372036854775807,0,1539047401632,1539047424965,1539047516299,1539047541049,1539047873632,1539048042382,1539048073215,1539085917465,1539087148465,0,1808866542439,1808899875771,9223372036854775807,0,1808909338401,1808909869234,1808911205068,1808911288234,1808911729484,1808911906651,1808912287651,1808920894568,1808922659568,---PROFILEDATA---'''        dumpsys = Dumpsys(None, None)        dumpsys.parseGfxinfoFramestats(out)        self.assertEqual(3, len(dumpsys.framestatsArray))        self.assertEqual(['1538750837982', '1808866542439'], [row[1] for row in dumpsys.gfxProfileData])        self.assertEqual(dumpsys.framestatsArray['IntendedVsync'][1:].tolist(),                         [int(row[1]) for row in dumpsys.gfxProfileData])        self.assertEqual(14, len(dumpsys.gfxProfileData[0]))    def test_getDocument(self):        out = '''\WINDOW MANAGER POLICY STATE (dumpsys window policy)    mSafeMode=false mSystemReady=true-------------------------------------------------------------------------------WINDOW MANAGER WINDOWS (dumpsys window windows)  Window #0 Window{1a2b3c u0 NavigationBar}:    mDisplayId=0  Window #1 Window{4d5e6f u0 com.example/com.example.MainActivity}:    mDisplayId=0  mCurrentFocus=Window{4d5e6f u0 com.example/com.example.MainActivity}'''        dumpsys = Dumpsys(None, Dumpsys.WINDOW)        dumpsys.parse(out, Dumpsys.WINDOW)        document = dumpsys.getDocument()        self.assertEqual(2, len(document))        self.assertTrue('windows' in document)        self.assertEqual(['NavigationBar', 'com.example/com.example.MainActivity'], document['windows']['windows'])        self.assertEqual('Window{4d5e6f u0 com.example/com.example.MainActivity}',                         dumpsys.getSection('windows')['mCurrentFocus'])        self.assertFalse(document['policy']['mSafeMode'])    def test_getDocument_battery(self):        out = '''\Current Battery Service state:  AC powered: false  USB powered: true  Wireless powered: false  Max charging current: 500000  Max charging voltage: 5000000  Charge counter: 2721000  status: 2  health: 2  present: true  level: 85  scale: 100  voltage: 4234  temperature: 251  technology: Li-ion'''        battery = DumpsysDocument(out, Dumpsys.BATTERY)['Current Battery Service state']        self.assertEqual(85.0, battery['percent'])        self.assertEqual(('charging', 'good'), (battery['statusName'], battery['healthName']))        self.assertEqual(25.1, battery['celsius'])        self.assertEqual(['USB'], battery['plugged'])        self.assertTrue(battery['present'])        self.assertEqual('Li-ion', battery['technology'])    def test_getDocument_input(self):        out = '''\INPUT MANAGER (dumpsys input)Event Hub State:  BuiltInKeyboardId: -2  Devices:    -1: Virtual      Classes: 0x40000023      Path: <virtual>      Enabled: true      Identifier: bus=0x0000, vendor=0x0000, product=0x0000, version=0x0000    1: gpio-keys      Classes: 0x00000001      Path: /dev/input/event0      Enabled: true      Identifier: bus=0x0019, vendor=0x0001, product=0x0001, version=0x0100    3: sec_touchscreen      Classes: 0x00000014      Path: /dev/input/event2      Enabled: true      Identifier: bus=0x0018, vendor=0x0000, product=0x0000, version=0x0000  Unattached video devices:    <none>Input Reader State:  Device 3: sec_touchscreen    Generation: 9    IsExternal: false    Sources: 0x00001002    KeyboardType: 1  Device 1: gpio-keys    Generation: 4    IsExternal: false    Sources: 0x00000101    KeyboardType: 1Input Dispatcher State:  DispatchEnabled: true  Windows:    0: name='Window{4d5e6f u0 com.example/com.example.MainActivity}', displayId=0'''        document = DumpsysDocument(out, Dumpsys.INPUT)        devices = document['Event Hub State']['devices']        self.assertEqual([-1, 1, 3], sorted(devices.keys()))        self.assertEqual('sec_touchscreen', devices[3]['name'])        self.assertEqual('/dev/input/event2', devices[3]['Path'])        self.assertEqual('0x0018', devices[3]['bus'])        self.assertNotIn('Unattached video devices', devices[3])        self.assertEqual(-2, document['Event Hub State']['BuiltInKeyboardId'])        devices = document['Input Reader State']['devices']        self.assertEqual(('gpio-keys', 4, False), tuple(devices[1][k] for k in ['name', 'Generation', 'IsExternal']))        self.assertNotIn('devices', document['Input Dispatcher State'])if __name__ == '__main__':    unittest.main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import os
+import sys
+import unittest
+
+try:
+    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))
+except:
+    pass
+
+from androidviewclient3.adb.framestatsmonitor import FrameStatsMonitor
+from ..mocks import MockGfxinfoDevice
+
+PKG = 'com.example'
+
+
+class FrameStatsMonitorTests(unittest.TestCase):
+
+    def setUp(self):
+        self.device = MockGfxinfoDevice()
+        self.monitor = FrameStatsMonitor(self.device, PKG)
+
+    def testPoll_noProfileData(self):
+        self.assertEqual(0, self.monitor.poll())
+        self.assertEqual(0, self.monitor.getFrameCount())
+        self.assertIsNone(self.monitor.getFramestats())
+
+    def testPoll_overlappingDumps(self):
+        self.device.render([8] * 100)
+        self.assertEqual(100, self.monitor.poll())
+        self.device.render([20] * 50)
+        # the second dump repeats the last 70 frames of the first one
+        self.assertEqual(50, self.monitor.poll())
+        self.assertEqual(0, self.monitor.poll())
+        self.assertEqual(150, self.monitor.getFrameCount())
+        vsyncs = self.monitor.getFramestats()['IntendedVsync'].tolist()
+        self.assertEqual([vsync for _, vsync, _ in self.device.frames], vsyncs)
+        self.assertEqual(0, self.monitor.gaps)
+        summary = self.monitor.getSummary()
+        self.assertEqual((150, 50), (summary['frames'], summary['janky']))
+
+    def testPoll_gap(self):
+        self.device.render([8] * 10)
+        self.monitor.poll()
+        self.device.render([8] * (MockGfxinfoDevice.BUFFER_FRAMES + 30))
+        self.assertEqual(MockGfxinfoDevice.BUFFER_FRAMES, self.monitor.poll())
+        self.assertEqual(1, self.monitor.gaps)
+
+    def testInteraction(self):
+        self.device.render([8] * 5)
+        with self.monitor.interaction('idle'):
+            pass
+        with self.monitor.interaction('scroll'):
+            self.device.render([8, 8, 40, 8])
+        self.device.render([8] * 3)
+        self.monitor.poll()
+        self.assertEqual([('idle', 5, 5), ('scroll', 5, 9)], self.monitor.interactions)
+        summaries = self.monitor.getInteractionSummaries()
+        self.assertEqual(['idle', 'scroll'], [label for label, _ in summaries])
+        self.assertEqual(0, summaries[0][1]['frames'])
+        self.assertEqual((4, 1, 25.0, 40.0), tuple(summaries[1][1][k] for k in ['frames', 'janky', 'jankPercent',
+                                                                               'max']))
+
+    def testStartStop(self):
+        self.device.render([8] * 10)
+        with FrameStatsMonitor(self.device, PKG, interval=0.01) as monitor:
+            # the frames rendered before were reset
+            self.device.render([8] * 3)
+            self.assertRaises(RuntimeError, monitor.start)
+        self.assertEqual(3, monitor.getFrameCount())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+try:
+    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))
+except:
+    pass
+
+from androidviewclient3.adb.adbclient import AdbClient
+from androidviewclient3.adb.logcat import Logcat, LogcatRecord
+from ..mocks import MockAdbServer
+
+LOGCAT_THREADTIME = '''\
+--------- beginning of main\r
+10-18 12:00:00.100  1234  1240 I ActivityManager: START u0 {cmp=com.example/.MainActivity} from uid 2000\r
+10-18 12:00:00.200  1234  1250 D WindowManager: relayout\r
+--------- beginning of system\r
+10-18 12:00:01.500  1234  1240 I ActivityManager: Displayed com.example/.MainActivity: +1s234ms\r
+10-18 12:00:01.600  4321  4321 W example : slow frame: 32ms\r
+'''
+
+
+class LogcatTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = MockAdbServer()
+        patcher = mock.patch.object(AdbClient, 'connect', self.server.connect)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.device = AdbClient(self.server.serialno)
+        self.server.respond('^logcat ', LOGCAT_THREADTIME)
+
+    def testParse_threadtime(self):
+        with self.device.logcat(dump=True) as logcat:
+            records = list(logcat)
+        self.assertEqual(4, len(records))
+        self.assertEqual(LogcatRecord('10-18 12:00:00.100', 1234, 1240, 'I', 'ActivityManager',
+                                      'START u0 {cmp=com.example/.MainActivity} from uid 2000'), records[0])
+        self.assertEqual(('example', 'slow frame: 32ms'), (records[3].tag, records[3].message))
+
+    def testParse_otherFormats(self):
+        with self.device.logcat(format=Logcat.TIME, dump=True) as logcat:
+            self.assertEqual(LogcatRecord('10-18 12:00:00.100', 1234, -1, 'I', 'ActivityManager', 'START'),
+                             logcat.parse('10-18 12:00:00.100 I/ActivityManager( 1234): START'))
+        with self.device.logcat(format=Logcat.BRIEF, dump=True) as logcat:
+            self.assertEqual(LogcatRecord(None, 1234, -1, 'I', 'ActivityManager', 'START'),
+                             logcat.parse('I/ActivityManager( 1234): START'))
+            self.assertIsNone(logcat.parse('--------- beginning of main'))
+        self.assertRaises(ValueError, self.device.logcat, format='long')
+
+    def testParse_linesSplitBetweenChunks(self):
+        with self.device.logcat(dump=True) as logcat:
+            records = list(logcat)
+        self.server.chunkSize = 7
+        with self.device.logcat(dump=True) as logcat:
+            self.assertEqual(records, list(logcat))
+
+    def testFilters(self):
+        self.device.logcat(['ActivityManager:I', '*:S'], since=1, dump=True).close()
+        self.assertEqual("logcat -v threadtime -d -T '1' 'ActivityManager:I' '*:S'", self.server.commands[-1])
+        self.device.logcat('ActivityManager:I *:S').close()
+        self.assertEqual("logcat -v threadtime 'ActivityManager:I' '*:S'", self.server.commands[-1])
+
+    def testWaitFor(self):
+        with self.device.logcat() as logcat:
+            record = logcat.waitFor(r'Displayed (\S+): \+', tag='ActivityManager')
+            self.assertEqual('10-18 12:00:01.500', record.timestamp)
+            self.assertIsNone(logcat.waitFor('Displayed'))
+        with self.device.logcat() as logcat:
+            self.assertEqual(1, logcat.waitForAny(['Displayed', 'relayout'])[0])
+
+    def testWaitFor_thenIterate(self):
+        with self.device.logcat(timeout=5) as logcat:
+            self.assertEqual('relayout', logcat.waitFor('relayout', timeout=1).message)
+            self.assertLessEqual(logcat.socket.timeout, 1)
+            # the iteration uses the logcat timeout again, not the one left by waitFor()
+            records = iter(logcat)
+            self.assertEqual('Displayed com.example/.MainActivity: +1s234ms', next(records).message)
+            self.assertEqual(5, logcat.socket.timeout)
+            self.assertEqual(['slow frame: 32ms'], [r.message for r in records])
+        with self.device.logcat(timeout=5) as logcat:
+            logcat.next(timeout=None)
+            self.assertIsNone(logcat.socket.timeout)
+            logcat.next()
+            self.assertEqual(5, logcat.socket.timeout)
+
+    def testBuffer_evictsOldest(self):
+        with self.device.logcat(bufferSize=2) as logcat:
+            records = list(logcat)
+            self.assertEqual(records[-2:], list(logcat.buffer))
+        with self.device.logcat() as logcat:
+            list(logcat)
+            self.assertIsNone(logcat.buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import math
+import os
+import sys
+import unittest
+
+try:
+    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))
+except:
+    pass
+
+from androidviewclient3.adb.meminfosampler import MeminfoSampler
+
+MEMINFO = '''\
+Applications Memory Usage (in Kilobytes):\r
+Uptime: 1000 Realtime: 1000\r
+\r
+** MEMINFO in pid 4321 [%(pkg)s] **\r
+                   Pss  Private  Private  SwapPss     Heap     Heap     Heap\r
+                 Total    Dirty    Clean    Dirty     Size    Alloc     Free\r
+                ------   ------   ------   ------   ------   ------   ------\r
+  Native Heap     %(native)d     %(native)d        0        0    16384    12000     4384\r
+  Dalvik Heap     2048     2000        0        0     4096     3000     1096\r
+        TOTAL    %(total)d    30000     1000        0    20480    15000     5480\r
+\r
+ Objects\r
+               Views:      %(views)d         ViewRootImpl:        1\r
+         AppContexts:        3           Activities:        %(activities)d\r
+'''
+
+
+class MockMeminfoDevice(object):
+    '''
+    Mocks a device running C{com.example}, leaking an activity and its views in every repetition, and
+    C{com.stable}. C{com.missing} is not running.
+    '''
+
+    def __init__(self):
+        self.repetitions = 0
+
+    def meminfo(self, pkg):
+        if pkg == 'com.missing':
+            return 'No process found for: com.missing\r\n'
+        n = self.repetitions if pkg == 'com.example' else 0
+        return MEMINFO % {'pkg': pkg, 'native': 10000 + (n % 3) * 100, 'total': 40000 + 512 * n, 'views': 20 + 15 * n,
+                          'activities': 1 + n}
+
+    def shellStream(self, cmd, timeout=-1):
+        out = ''
+        for part in cmd.split('; '):
+            if part.startswith('echo '):
+                out += part[len('echo '):] + '\r\n'
+            else:
+                out += self.meminfo(part.split()[-1])
+        return out
+
+
+class MeminfoSamplerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.device = MockMeminfoDevice()
+
+    def testParse(self):
+        sampler = MeminfoSampler(self.device, ['com.example', 'com.missing'])
+        self.assertEqual(0, sampler.sample())
+        self.assertEqual(1, sampler.parse(self.device.shellStream('echo __AVC_MEMINFO__com.example; '
+                                                                  'dumpsys meminfo com.example'), timestamp=5.0))
+        self.assertEqual(2, sampler.getSampleCount())
+        self.assertEqual(5.0, sampler.getTimestamps()[1])
+        self.assertEqual([40000, 10000, 2048, 20, 1, 3, 1], sampler.getValues()[0].tolist())
+        self.assertEqual([20, 20], sampler.getValues('com.example', 'views').tolist())
+        self.assertTrue(all(math.isnan(v) for v in sampler.getValues('com.missing')[0]))
+        # the package not in the second output is NaN too
+        self.assertTrue(math.isnan(sampler.getValues('com.missing', 'total')[1]))
+
+    def testParse_grows(self):
+        sampler = MeminfoSampler(self.device, 'com.example', capacity=2)
+        for i in range(5):
+            self.device.repetitions = i
+            sampler.sample()
+        self.assertEqual([20, 35, 50, 65, 80], sampler.getValues(field='views').tolist())
+
+    def testSlope(self):
+        self.assertEqual(2.0, MeminfoSampler.slope([1, 3, 5, 7]))
+        self.assertAlmostEqual(0.0, MeminfoSampler.slope([5, 5, 5]))
+        self.assertEqual(2.0, MeminfoSampler.slope([1, float('nan'), 5, 7]))
+        self.assertTrue(math.isnan(MeminfoSampler.slope([1, float('nan')])))
+        # noise around a constant is not a slope
+        self.assertAlmostEqual(0.0, MeminfoSampler.slope([10, 12, 8, 12, 10]))
+
+    def testDetectLeaks(self):
+        sampler = MeminfoSampler(self.device, ['com.example', 'com.stable'])
+        scenarios = []
+
+        def scenario(i):
+            scenarios.append(i)
+            self.device.repetitions += 1
+
+        report = sampler.detectLeaks(scenario, repetitions=10, warmup=2)
+        self.assertEqual(list(range(12)), scenarios)
+        self.assertEqual(11, sampler.getSampleCount())
+        self.assertEqual(['total', 'views', 'activities'], report['com.example']['leaks'])
+        self.assertEqual(15.0, report['com.example']['slopes']['views'])
+        self.assertEqual([], report['com.stable']['leaks'])
+        report = sampler.detectLeaks(scenario, repetitions=5, warmup=0, thresholds={'total': 1024, 'views': 20})
+        self.assertEqual(['activities'], report['com.example']['leaks'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+try:
+    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))
+except:
+    pass
+
+from androidviewclient3.culebron import Culebron, Operation
+from androidviewclient3.viewclient import ViewClient
+
+
+class CulebronTests(unittest.TestCase):
+
+    def setUp(self):
+        # only the attributes used by the tested methods, no window is created
+        self.culebron = mock.Mock()
+        self.culebron.vc = mock.Mock(spec=ViewClient)
+
+    def testWaitForStable(self):
+        Culebron.waitForStable(self.culebron, 5)
+        self.culebron.vc.waitForStable.assert_called_once_with(
+            signals=[ViewClient.STABLE_FOCUS, ViewClient.STABLE_SCREENSHOT], timeout=5)
+        # the callers print the sleep
+        self.culebron.printOperation.assert_not_called()
+
+    def testWaitForStable_noVc(self):
+        self.culebron.vc = None
+        with mock.patch('time.sleep') as sleep:
+            Culebron.waitForStable(self.culebron, 1)
+        sleep.assert_called_once_with(1)
+        self.culebron.printOperation.assert_not_called()
+
+    def testSleep(self):
+        with mock.patch('time.sleep') as sleep:
+            Culebron.sleep(self.culebron, 2)
+        sleep.assert_called_once_with(2)
+        self.culebron.printOperation.assert_called_once_with(None, Operation.SLEEP, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
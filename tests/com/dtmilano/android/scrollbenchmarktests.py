@@ -0,0 +1,69 @@
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+try:
+    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))
+except:
+    pass
+
+from androidviewclient3.adb.dumpsys import Dumpsys
+from androidviewclient3.scrollbenchmark import ScrollBenchmark
+from .mocks import MockGfxinfoDevice
+
+PKG = 'com.example'
+
+
+class ScrollBenchmarkTests(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(ScrollBenchmark, 'SETTLE_POLL_INTERVAL', 0.001)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # every gesture renders 4 frames, one of them janky
+        self.device = MockGfxinfoDevice(gestureFrameTimes=[8, 8, 40, 8])
+
+    def testGesture(self):
+        coords = ((0, 0), (100, 1000))
+        self.assertEqual(((50, 800), (50, 200)), ScrollBenchmark.gesture(coords, ScrollBenchmark.UP))
+        self.assertEqual(((50, 200), (50, 800)), ScrollBenchmark.gesture(coords, ScrollBenchmark.DOWN))
+        self.assertEqual(((80, 500), (20, 500)), ScrollBenchmark.gesture(coords, ScrollBenchmark.LEFT))
+        self.assertRaises(ValueError, ScrollBenchmark.gesture, coords, 'diagonal')
+        self.assertRaises(ValueError, ScrollBenchmark, self.device, PKG, start=(50, 800))
+
+    def testRun(self):
+        benchmark = ScrollBenchmark(self.device, PKG, start=(50, 800), end=(50, 200), iterations=3, warmup=2)
+        report = benchmark.run()
+        self.assertEqual(5, self.device.gestures)
+        self.assertEqual([(i, 4 * i, 4 * i + 4) for i in range(5)], benchmark.monitor.interactions)
+        self.assertEqual([0, 1, 2], [s['iteration'] for s in report['iterations']])
+        for s in report['iterations']:
+            self.assertEqual((4, 1, 25.0, 40.0), (s['frames'], s['janky'], s['jankPercent'], s['max']))
+        # the warmup frames are not in the aggregate
+        self.assertEqual((12, 3), (report['aggregate']['frames'], report['aggregate']['janky']))
+        self.assertEqual(25.0, report['distributions']['jankPercent']['median'])
+        self.assertEqual(0, report['gaps'])
+        self.assertEqual('drag', report['gesture']['method'])
+
+    def testRun_noIterations(self):
+        benchmark = ScrollBenchmark(self.device, PKG, start=(50, 800), end=(50, 200), iterations=0, warmup=1)
+        report = benchmark.run()
+        self.assertEqual(1, self.device.gestures)
+        self.assertEqual([], report['iterations'])
+        self.assertEqual(0, report['aggregate']['frames'])
+        self.assertRaises(RuntimeError, benchmark.plot, os.path.join(tempfile.mkdtemp(), 'scroll.png'))
+
+    def testPlot(self):
+        benchmark = ScrollBenchmark(self.device, PKG, start=(50, 800), end=(50, 200), iterations=2, warmup=1)
+        filename = os.path.join(tempfile.mkdtemp(), 'scroll.png')
+        self.assertRaises(RuntimeError, benchmark.plot, filename)
+        benchmark.run()
+        plot = benchmark.plot(filename)
+        self.assertEqual(8, len(plot.aava[Dumpsys.FRAMESTATS]))
+        self.assertTrue(os.path.exists(filename))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1 +1 @@
-#! /usr/bin/env python# -*- coding: utf-8 -*-'''Copyright (C) 2012  Diego Torres MilanoCreated on Feb 5, 2012@author: diego'''import osimport sys# PyDev sets PYTHONPATH, use ittry:    for p in os.environ['PYTHONPATH'].split(':'):        if not p in sys.path:            sys.path.append(p)except:    passtry:    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))except:    passfrom androidviewclient3.viewclient import *from .mocks import MockDevicefrom .mocks import DUMP, DUMP_SAMPLE_UI, VIEW_MAP, VIEW_MAP_API_8, VIEW_MAP_API_17, RUNNING, STOPPED, WINDOWSos_name = platform.system()if os_name.startswith('Linux'):    TRUE = '/bin/true'elif os_name == 'Windows':    import tempfile    temp_true = tempfile.mkstemp(".bat", text=True)    os.close(temp_true[0])    TRUE = temp_true[1]    with open(TRUE, 'w') as f:        f.write("@echo off\r\nexit 0\r\n")    del temp_trueelse:    TRUE = '/usr/bin/true'class ViewTest(unittest.TestCase):    def setUp(self):        self.view = View(VIEW_MAP, None, -1)    def tearDown(self):        try:            del os.environ['ANDROID_SERIAL']        except:            pass    def testViewFactory_View(self):        attrs = {'class': 'android.widget.AnyView', 'text:mText': 'Button with ID'}        view = View.factory(attrs, None, -1)        self.assertTrue(isinstance(view, View))    def testViewFactory_TextView(self):        attrs = {'class': 'android.widget.TextView', 'text:mText': 'Button with ID'}        view = View.factory(attrs, None, -1)        self.assertTrue(isinstance(view, TextView))    def testViewFactory_TextView(self):        attrs = {'class': 'android.widget.EditText', 'text:mText': 'Button with ID'}        view = View.factory(attrs, None, -1)        self.assertTrue(isinstance(view, EditText))    def testView_notSpecifiedSdkVersion(self):        device = MockDevice()        view = View(VIEW_MAP, device, -1)        self.assertEqual(device.version, view.build[VERSION_SDK_PROPERTY])    def testView_specifiedSdkVersion_8(self):        view = View(VIEW_MAP_API_8, MockDevice(), 8)        self.assertEqual(8, view.build[VERSION_SDK_PROPERTY])    def testView_specifiedSdkVersion_10(self):        view = View(VIEW_MAP, MockDevice(), 10)        self.assertEqual(10, view.build[VERSION_SDK_PROPERTY])    def testView_specifiedSdkVersion_16(self):        view = View(VIEW_MAP, MockDevice(), 16)        self.assertEqual(16, view.build[VERSION_SDK_PROPERTY])    def testInnerMethod(self):        v = View({'isChecked()':'true'}, None)        self.assertTrue(v.isChecked())        v.map['isChecked()'] = 'false'        self.assertFalse(v.isChecked(), "Expected False but is %s {%s}" % (v.isChecked(), v.map['isChecked()']))        self.assertFalse(v.isChecked())        v.map['other'] = 1        self.assertEqual(1, v.other())        v.map['evenMore'] = "ABC"        self.assertEqual("ABC", v.evenMore())        v.map['more'] = "abc"        v.map['more'] = v.evenMore()        self.assertEqual("ABC", v.more())        v.map['isMore()'] = 'true'        self.assertTrue(v.isMore())    def testGetClass(self):        self.assertEqual('android.widget.ToggleButton', self.view.getClass())    def testGetId(self):        self.assertEqual('id/button_with_id', self.view.getId())    def testTextPropertyForDifferentSdkVersions(self):        VP = { -1:TEXT_PROPERTY, 8:TEXT_PROPERTY_API_10, 10:TEXT_PROPERTY_API_10, 15:TEXT_PROPERTY, 16:TEXT_PROPERTY_UI_AUTOMATOR, 17:TEXT_PROPERTY_UI_AUTOMATOR}        for version, textProperty in VP.items():            view = View(None, None, version)            self.assertEqual(textProperty, view.textProperty, msg='version %d: expected: %s actual: %s' % (version, textProperty, view.textProperty))    def testTextPropertyForDifferentSdkVersions_device(self):        VP = { -1:TEXT_PROPERTY, 8:TEXT_PROPERTY_API_10, 10:TEXT_PROPERTY_API_10, 15:TEXT_PROPERTY, 16:TEXT_PROPERTY_UI_AUTOMATOR, 17:TEXT_PROPERTY_UI_AUTOMATOR}        for version, textProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(textProperty, view.textProperty, msg='version %d' % version)    def testLeftPropertyForDifferentSdkVersions(self):        VP = { -1:LEFT_PROPERTY, 8:LEFT_PROPERTY_API_8, 10:LEFT_PROPERTY, 15:LEFT_PROPERTY, 16:LEFT_PROPERTY, 17:LEFT_PROPERTY}        for version, leftProperty in VP.items():            view = View(None, None, version)            self.assertEqual(leftProperty, view.leftProperty, msg='version %d' % version)    def testLeftPropertyForDifferentSdkVersions_device(self):        VP = { -1:LEFT_PROPERTY, 8:LEFT_PROPERTY_API_8, 10:LEFT_PROPERTY, 15:LEFT_PROPERTY, 16:LEFT_PROPERTY, 17:LEFT_PROPERTY}        for version, leftProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(leftProperty, view.leftProperty, msg='version %d' % version)    def testTopPropertyForDifferentSdkVersions(self):        VP = { -1:TOP_PROPERTY, 8:TOP_PROPERTY_API_8, 10:TOP_PROPERTY, 15:TOP_PROPERTY, 16:TOP_PROPERTY, 17:TOP_PROPERTY}        for version, topProperty in VP.items():            view = View(None, None, version)            self.assertEqual(topProperty, view.topProperty, msg='version %d' % version)    def testTopPropertyForDifferentSdkVersions_device(self):        VP = { -1:TOP_PROPERTY, 8:TOP_PROPERTY_API_8, 10:TOP_PROPERTY, 15:TOP_PROPERTY, 16:TOP_PROPERTY, 17:TOP_PROPERTY}        for version, topProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(topProperty, view.topProperty, msg='version %d' % version)    def testWidthPropertyForDifferentSdkVersions(self):        VP = { -1:WIDTH_PROPERTY, 8:WIDTH_PROPERTY_API_8, 10:WIDTH_PROPERTY, 15:WIDTH_PROPERTY, 16:WIDTH_PROPERTY, 17:WIDTH_PROPERTY}        for version, widthProperty in VP.items():            view = View(None, None, version)            self.assertEqual(widthProperty, view.widthProperty, msg='version %d' % version)    def testWidthPropertyForDifferentSdkVersions_device(self):        VP = { -1:WIDTH_PROPERTY, 8:WIDTH_PROPERTY_API_8, 10:WIDTH_PROPERTY, 15:WIDTH_PROPERTY, 16:WIDTH_PROPERTY, 17:WIDTH_PROPERTY}        for version, widthProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(widthProperty, view.widthProperty, msg='version %d' % version)    def testHeightPropertyForDifferentSdkVersions(self):        VP = { -1:HEIGHT_PROPERTY, 8:HEIGHT_PROPERTY_API_8, 10:HEIGHT_PROPERTY, 15:HEIGHT_PROPERTY, 16:HEIGHT_PROPERTY, 17:HEIGHT_PROPERTY}        for version, heightProperty in VP.items():            view = View(None, None, version)            self.assertEqual(heightProperty, view.heightProperty, msg='version %d' % version)    def testHeightPropertyForDifferentSdkVersions_device(self):        VP = { -1:HEIGHT_PROPERTY, 8:HEIGHT_PROPERTY_API_8, 10:HEIGHT_PROPERTY, 15:HEIGHT_PROPERTY, 16:HEIGHT_PROPERTY, 17:HEIGHT_PROPERTY}        for version, heightProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(heightProperty, view.heightProperty, msg='version %d' % version)    def testGetText(self):        self.assertTrue('text:mText' in self.view.map)        self.assertEqual('Button with ID', self.view.getText())        self.assertEqual('Button with ID', self.view['text:mText'])    def testGetX_specifiedSdkVersion_8(self):        view = View(VIEW_MAP_API_8, MockDevice(), 8)        self.assertEqual(8, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(50, view.getX())    def testGetX_specifiedSdkVersion_10(self):        view = View(VIEW_MAP, MockDevice(), 10)        self.assertEqual(10, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(50, view.getX())    def testGetY_specifiedSdkVersion_8(self):        view = View(VIEW_MAP_API_8, MockDevice(), 8)        self.assertEqual(8, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(316, view.getY())    def testGetY_specifiedSdkVersion_10(self):        view = View(VIEW_MAP, MockDevice(), 10)        self.assertEqual(10, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(316, view.getY())    def testGetWidth(self):        self.assertEqual(1140, self.view.getWidth())    def testGetHeight(self):        self.assertEqual(48, self.view.getHeight())    def testGetUniqueId(self):        self.assertEqual('id/button_with_id', self.view.getUniqueId())    def testGetUniqueIdEqualsToIdWhenIdIsSpecified(self):        self.assertEqual(self.view.getId(), self.view.getUniqueId())    def testName_Layout_mLeft(self):        v = View({'layout:mLeft':200}, None)        self.assertEqual(200, v.layout_mLeft())    def testNameWithColon_this_is_a_fake_name(self):        v = View({'this:is_a_fake_name':1}, None)        self.assertEqual(1, v.this_is_a_fake_name())    def testNameWith2Colons_this_is_another_fake_name(self):        v = View({'this:is:another_fake_name':1}, None)        self.assertEqual(1, v.this_is_another_fake_name())    def testViewWithoutId(self):        v = View({'mID':'id/NO_ID', 'text:mText':'Some text'}, None)        self.assertEqual('id/NO_ID', v.getId())    def testInexistentMethodName(self):        v = View({'foo':1}, None)        try:            v.bar()            raise Exception("AttributeError not raised")        except AttributeError:            pass    def testViewTreeRoot(self):        root = View({'root':1}, None)        self.assertTrue(root.parent == None)    def testViewTree(self):        root = View({'root':1}, None)        children = ["A", "B", "C"]        for s in children:            root.add(View({s:1}, None))        self.assertEqual(len(children), len(root.children))    def testViewTreeParent(self):        root = View({'root':1}, None)        children = ["A", "B", "C"]        for s in children:            root.add(View({s:1}, None))        for ch in root.children:            self.assertTrue(ch.parent == root)    def testContainsPoint_api15(self):        v = View(VIEW_MAP, MockDevice(), 15)        (X, Y, W, H) = v.getPositionAndSize()        self.assertEqual(X, v.getX())        self.assertEqual(Y, v.getY())        self.assertEqual(W, v.getWidth())        self.assertEqual(H, v.getHeight())        self.assertTrue(v.containsPoint((v.getCenter())))    def testContainsPoint_api17(self):        v = View(VIEW_MAP_API_17, MockDevice(), 17)        (X, Y, W, H) = v.getPositionAndSize()        self.assertEqual(X, v.getX())        self.assertEqual(Y, v.getY())        self.assertEqual(W, v.getWidth())        self.assertEqual(H, v.getHeight())        self.assertTrue(v.containsPoint((v.getCenter())))    def testIsClickable_api15(self):        v = View(VIEW_MAP, MockDevice(), 15)        self.assertTrue(v.isClickable())    def testIsClickable_api17(self):        v = View(VIEW_MAP_API_17, MockDevice(), 17)        self.assertTrue(v.isClickable())    def testCopyConstructor(self):        device = MockDevice()        mv = VIEW_MAP_API_17.copy()        mv['class'] = u'android.widget.View'        v = View(mv, device, 17)        self.assertEqual(v.getClass(), u'android.widget.View')        mt = VIEW_MAP_API_17.copy()        mt['class'] = u'android.widget.TextView'        t = TextView(mt, device, 17)        self.assertEqual(t.getClass(), u'android.widget.TextView')        me = VIEW_MAP_API_17.copy()        me['class'] = u'android.widget.EditText'        e = TextView(me, device, 17)        self.assertEqual(e.getClass(), u'android.widget.EditText')        v1 = View.clone(v)        self.assertEqual(u'android.widget.View', v1.getClass())        t1 = TextView.clone(t)        self.assertEqual(u'android.widget.TextView', t1.getClass())        e1 = EditText.clone(e)        self.assertEqual(u'android.widget.EditText', e1.getClass())        t2 = TextView.clone(v)        self.assertEqual(u'android.widget.TextView', t2.getClass())        e2 = EditText.clone(v)        self.assertEqual(u'android.widget.EditText', e2.getClass())        e2.setText("hello")class ViewClientTest(unittest.TestCase):    def setUp(self):        pass    def tearDown(self):        pass    def testInit_adb(self):        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)    def testInit_adbNone(self):        # FIXME: there's a problem here when the mock device is created,        # it's intended to be API=15, mock ViewServer is started and then        # adb tries (unsuccessfuly) to forward the ports (expected because        # adb does not know anything about mock devices).        # Then        #    error: device not found        # appears in the console        device = MockDevice()        try:            vc = ViewClient(device, device.serialno, adb=None, autodump=False)            self.assertIsNotNone(vc)        except subprocess.CalledProcessError:            # This is needed because the ports cannot be forwarded if there is no device connected            pass    def testExceptionDeviceNotConnected(self):        try:            vc = ViewClient(None, None)        except Exception as e:            self.assertEqual('Device is not connected', str(e))    def testConnectToDeviceOrExit_environ(self):        sys.argv = ['']        os.environ['ANDROID_SERIAL'] = 'ABC123'        try:            ViewClient.connectToDeviceOrExit(timeout=1, verbose=True)        except RuntimeError as e:            msg = str(e)            if re.search('Is adb running on your computer?', msg):                # This test required adb running                self.fail(msg)            elif re.search("There are no connected devices", msg):                # special case, when there are no devices connected then the                # serialno specified doesn't matter                pass            elif not re.search("couldn't find device that matches 'ABC123'", msg):                self.fail(msg)        except SystemExit as e:            self.assertEqual(3, e.code)        except Exception as e: #FIXME: java.lang.NullPointerException:            self.fail('Serialno was not taken from environment: ' + msg)    def testConnectToDeviceOrExit_serialno(self):        sys.argv = ['']        try:            ViewClient.connectToDeviceOrExit(timeout=1, verbose=True, serialno='ABC123')        except RuntimeError as e:            msg = str(e)            if re.search('Is adb running on your computer?', msg):                # This test required adb running                self.fail(msg)            elif re.search("There are no connected devices", msg):                # special case, when there are no devices connected then the                # serialno specified doesn't matter                pass            elif not re.search("couldn't find device that matches 'ABC123'", msg):                self.fail(msg)        except SystemExit as e:            self.assertEqual(3, e.code)        except Exception as e: #FIXME: java.lang.NullPointerException:            self.fail('Serialno was not taken from argument: ' + str(e))    def testConstructor(self):        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)    def testMapSerialNo_noPortSpecified(self):        vc = ViewClient(MockDevice(), serialno='192.168.1.100', adb=TRUE, autodump=False)        self.assertEqual('192.168.1.100:5555', vc.serialno)    def testMapSerialNo_portSpecified(self):        vc = ViewClient(MockDevice(), serialno='192.168.1.100:5555', adb=TRUE, autodump=False)        self.assertEqual('192.168.1.100:5555', vc.serialno)    def testMapSerialNo_emulator(self):        vc = ViewClient(MockDevice(), serialno='emulator-5556', adb=TRUE, autodump=False)        self.assertEqual('emulator-5556', vc.serialno)    def testMapSerialNo_regex(self):        # This is an edge case. A regex should not be used as the serialno in ViewClient as it's        # behavior is not well defined.        # MonkeyRunner.waitForConnection() accepts a regexp as serialno but adb -s doesn't        try:            ViewClient(MockDevice(),  serialno='.*', adb=TRUE, autodump=False)            self.fail()        except ValueError:            pass    def testMapSerialNo_None(self):        device = MockDevice()        try:            ViewClient(device, None, adb=TRUE, autodump=False)            self.fail()        except ValueError:            pass    def testGetProperty_displayWidth(self):        device = MockDevice()        self.assertEqual(768, device.getProperty('display.width'))    def testGetProperty_displayHeight(self):        device = MockDevice()        self.assertEqual(1184, device.getProperty('display.height'))    def __mockTree(self, dump=DUMP, version=15, language='en'):        device = MockDevice(version=version, language=language)        vc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        if version <= 15:            # We don't want to invoke the ViewServer or MockViewServer for this            vc.setViews(dump)        else:            vc.dump()        return vc    def __mockWindows(self, windows=WINDOWS):        device = MockDevice()        vc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.windows = windows        return vc    def testRoot(self):        vc = self.__mockTree()        root = vc.root        self.assertTrue(root != None)        self.assertTrue(root.parent == None)        self.assertTrue(root.getClass() == 'com.android.internal.policy.impl.PhoneWindow$DecorView')    def testParseTree(self):        vc = self.__mockTree()        # eat all the output        vc.traverse(vc.root, transform=self.__eatIt)        # We know there are 23 views in ViewServer mock tree        self.assertEqual(23, len(vc.getViewIds()))    def testParsetree_api17(self):        vc = self.__mockTree(version=17)        # eat all the output        vc.traverse(vc.root, transform=self.__eatIt)        # We know there are 9 views in UiAutomator mock tree        self.assertEqual(9, len(vc.getViewIds()))    def testParsetree_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        # eat all the output        vc.traverse(vc.root, transform=self.__eatIt)        # We know there are 21 views in UiAutomator mock tree        self.assertEqual(21, len(vc.getViewIds()))    def __testViewByIds_apiIndependent(self, vc):        viewsbyId = vc.getViewsById()        self.assertNotEqual(None, viewsbyId)        for k, v in viewsbyId.items():            self.assertTrue(isinstance(k, str))            self.assertTrue(isinstance(v, View), "v=" + str(v) + " is not a View")            self.assertTrue(re.match("id/.*", v.getUniqueId()) != None)            self.assertEqual(k, v.getUniqueId())    def testGetViewsById(self):        vc = self.__mockTree()        self.__testViewByIds_apiIndependent(vc)    def testGetViewsById_api17(self):        vc = self.__mockTree(version=17)        self.__testViewByIds_apiIndependent(vc)    def testGetViewsById_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        self.__testViewByIds_apiIndependent(vc)    def testNewViewClientInstancesDontDuplicateTree(self):        vc = {}        n = {}        for i in range(10):            vc[i] = self.__mockTree()            n[i] = len(vc[i].getViewIds())        for i in range(1, 10):            self.assertEqual(n[0], n[i])    def testTraverseShowClassIdAndText(self):        device = MockDevice()        root = View({'text:mText':'0', 'class': 'android.widget.View', 'mID': 0}, device)        root.add(View({'text:mText':'1', 'class': 'android.widget.View', 'mID': 1}, device))        root.add(View({'text:mText':'2', 'class': 'android.widget.View', 'mID': 2}, device))        v3 = View({'text:mText':'3', 'class': 'android.widget.View', 'mID':3}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35', 'class': 'android.widget.View', 'mID': 35}, device)        v3.add(v35)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        treeStr = io.StringIO()        vc.traverse(root=root, transform=ViewClient.TRAVERSE_CIT, stream=treeStr)        self.assertNotEqual(None, treeStr.getvalue())        lines = treeStr.getvalue().splitlines()        self.assertEqual(5, len(lines), "lines=%s" % lines)        self.assertEqual('android.widget.View 0 0', lines[0])        citRE = re.compile(' +android.widget.View \d+ \d+')        for l in lines[1:]:            self.assertTrue(citRE.match(l), 'l=%s' % l)    def testTraverseShowClassIdTextAndCenter(self):        device = MockDevice()        root = View({'mID':'0', 'text:mText':'0', 'layout:mLeft':0, 'layout:mTop':0}, device)        root.add(View({'mID':'1', 'text:mText':'1', 'layout:mLeft':1, 'layout:mTop':1}, device))        root.add(View({'mID':'2', 'text:mText':'2', 'layout:mLeft':2, 'layout:mTop':2}, device))        v3 = View({'mID':'3', 'text:mText':'3', 'layout:mLeft':3, 'layout:mTop':3}, device)        root.add(v3)        v35 = View({'mID':'5', 'text:mText':'5', 'getTag()':'v35', 'layout:mLeft':5, 'layout:mTop':5}, device)        v3.add(v35)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        treeStr = io.StringIO()        vc.traverse(root=root, transform=ViewClient.TRAVERSE_CITC, stream=treeStr)        self.assertNotEqual(None, treeStr.getvalue())        lines = treeStr.getvalue().splitlines()        self.assertEqual(5, len(lines))        # In Python 3, division is always float!        self.assertEqual('None 0 0 (0.0, 0.0)', lines[0])        citRE = re.compile(r' +None \d+ \d+ \(\d+\.\d+, \d+\.\d+\)')        for l in lines[1:]:            self.assertTrue(citRE.match(l))    def __getClassAndId(self, view):        try:            return "%s %s %s %s" % (view.getClass(), view.getId(), view.getUniqueId(), view.getCoords())        except Exception as e:            return "Exception in view=%s: %s" % (view.__smallStr__(), e)    def __eatIt(self, view):        return ""    def testViewWithNoIdReceivesUniqueId(self):        vc = self.__mockTree()        # We know there are 6 views without id in the mock tree        for i in range(1, 6):            self.assertNotEqual(None, vc.findViewById("id/no_id/%d" % i))    def testTextWithSpaces(self):        vc = self.__mockTree()        self.assertNotEqual(None, vc.findViewWithText('Medium Text'))    def testTextWithVeryLargeContent(self):        TEXT = """\MOCK@412a9d08 mID=7,id/test drawing:mForeground=4,null padding:mForegroundPaddingBottom=1,0 text:mText=319,[!   "   #   $   %   &   '   (   )   *   +   ,   -   .   /   0   1   2   3   4   5   6   7   8   9   :   ;   <   =   >   ?   @   A   B   C   D   E   F   G   H   I   J   K   L   M   N   O   P   Q   R   S   T   U   V   W   X   Y   Z   [   \   ]   ^   _   `   a   b   c   d   e   f   g   h   i   j   k   l   m   n   o   p] mViewFlags=11,-1744830336\"""        vc = self.__mockTree(TEXT)        test = vc.findViewById('id/test')        text = test.getText()        self.assertEqual(319, len(text))        self.assertEqual('[', text[0])        self.assertEqual(']', text[318])        self.assertEqual('-1744830336', test['mViewFlags'])    def testActionBarSubtitleCoordinates(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        toggleButton = vc.findViewById('id/button_with_id')        self.assertNotEqual(None, toggleButton)        textView3 = vc.findViewById('id/textView3')        self.assertNotEqual(None, textView3)        x = toggleButton.getX()        y = toggleButton.getY()        w = toggleButton.getWidth()        h = toggleButton.getHeight()        xy = toggleButton.getXY()        coords = toggleButton.getCoords()        self.assertNotEqual(None, textView3.getText())        self.assertNotEqual("", textView3.getText().strip())        lv = textView3.getText().strip().split()        _list = [ eval(str(v)) for v in lv ]        tx = _list[1][0]        ty = _list[1][1]        tsx = _list[1][0]        tsy = _list[1][1]        self.assertEqual(tx, x)        self.assertEqual(ty, y)        self.assertEqual((tsx, tsy), xy)        self.assertEqual(((tsx, tsy), (xy[0] + w, xy[1] + h)), coords)    def testServiceStoppedAfterDestructor(self):        device = MockDevice()        self.assertTrue(device.service == STOPPED)        if True:            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            self.assertTrue(device.service == RUNNING)            vc.__del__()        # Perhpas there are other ViewClients using the same server, we cannot expect it stops        #self.assertTrue(device.service == STOPPED)    def testList(self):        vc = self.__mockWindows()        self.assertNotEqual(None, vc.windows)    def testFindViewByIdOrRaise(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        vc.findViewByIdOrRaise('id/up')    def testFindViewByIdOrRaise_api17(self):        vc = self.__mockTree(version=17)        vc.traverse(stream=self.openDevNull())        vc.findViewByIdOrRaise('id/no_id/9')    def testFindViewByIdOrRaise_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        vc.traverse(stream=self.openDevNull())        vc.findViewByIdOrRaise('id/no_id/21')    def testFindViewByIdOrRaise_nonExistentView(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        try:            vc.findViewByIdOrRaise('id/nonexistent')            self.fail()        except ViewNotFoundException:            pass    def testFindViewByIdOrRaise_nonExistentView_api17(self):        vc = self.__mockTree(version=17)        try:            vc.findViewByIdOrRaise('id/nonexistent')            self.fail()        except ViewNotFoundException:            pass    def testFindViewByIdOrRaise_nonExistentView_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        try:            vc.findViewByIdOrRaise('id/nonexistent')            self.fail()        except ViewNotFoundException:            pass    def testFindViewById_root(self):        device = None        root = View({'mID':'0'}, device)        root.add(View({'mID':'1'}, device))        root.add(View({'mID':'2'}, device))        v3 = View({'mID':'3'}, device)        root.add(v3)        v35 = View({'mID':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'mID':'4'}, device)        root.add(v4)        v45 = View({'mID':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewById('5')        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewById('5', root=v4)        self.assertNotEqual(v5, None)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewById('5', root=v3)        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())    def testFindViewById_viewFilter(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.ImageView'        view = vc.findViewById('id/up', viewFilter=vf)        self.assertNotEqual(view, None)    def testFindViewById_viewFilterUnmatched(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.TextView'        view = vc.findViewById('id/up', viewFilter=vf)        self.assertEqual(view, None)    def testFindViewByIdOrRaise_root(self):        device = None        root = View({'mID':'0'}, device)        root.add(View({'mID':'1'}, device))        root.add(View({'mID':'2'}, device))        v3 = View({'mID':'3'}, device)        root.add(v3)        v35 = View({'mID':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'mID':'4'}, device)        root.add(v4)        v45 = View({'mID':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewByIdOrRaise('5')        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewByIdOrRaise('5', root=v4)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewByIdOrRaise('5', root=v3)        self.assertEqual('v35', v5.getTag())    def testFindViewByIdOrRaise_viewFilter(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.ImageView'        view = vc.findViewByIdOrRaise('id/up', viewFilter=vf)    def testFindViewByIdOrRaise_viewFilterUnmatched(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.TextView'        try:            view = vc.findViewByIdOrRaise('id/up', viewFilter=vf)        except ViewNotFoundException:            pass    def testFindViewWithText_root(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithText('5')        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithText('5', root=v4)        self.assertNotEqual(v5, None)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithText('5', root=v3)        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())    def testFindViewWithText_regexRoot(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithText(re.compile('[5]'))        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithText(re.compile('[5]'), root=v4)        self.assertNotEqual(v5, None)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithText(re.compile('[5]'), root=v3)        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())    def testFindViewWithTextOrRaise_root(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithTextOrRaise('5')        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v4)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v3)        self.assertEqual('v35', v5.getTag())    def testFindViewWithTextOrRaise_root_disappearingView(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithTextOrRaise('5')        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v4)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v3)        self.assertEqual('v35', v5.getTag())        # Then remove v4 and its children        root.children.remove(v4)        #vc.dump()        v4 = vc.findViewWithText('4')        self.assertEqual(v4, None, "v4 has not disappeared")    def testFindViewWithTextOrRaise_rootNonExistent(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        try:            vc.findViewWithTextOrRaise('Non Existent', root=v4)            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithTextOrRaise_api17(self):        vc = self.__mockTree(version=17)        vc.findViewWithTextOrRaise("Apps")    def openDevNull(self):        if platform.system() == "Windows":            return open('nul', 'a+', encoding='utf-8')        else:            return open('/dev/null', 'a+')    def testFindViewWithTextOrRaise_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        vc.traverse(transform=ViewClient.TRAVERSE_CIT, stream=self.openDevNull())        vc.findViewWithTextOrRaise('语言')    def testFindViewWithTextOrRaise_nonExistent_api17(self):        vc = self.__mockTree(version=17)        try:            vc.findViewWithTextOrRaise('nonexistent text')            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithTextOrRaise_nonExistent_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        try:            vc.findViewWithTextOrRaise('不存在的文本')            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithContentDescription_root(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v45 = vc.findViewWithContentDescription('CD45')        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v45 = vc.findViewWithContentDescription('CD45', root=v4)        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v35 = vc.findViewWithContentDescription('CD35', root=v3)        self.assertNotEqual(v35, None)        self.assertEqual('35', v35.getText())    def testFindViewWithContentDescription_regexRoot(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v45 = vc.findViewWithContentDescription(re.compile('CD4\d'))        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v45 = vc.findViewWithContentDescription(re.compile('CD4\d'), root=v4)        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v35 = vc.findViewWithContentDescription(re.compile('CD3\d'), root=v3)        self.assertNotEqual(v35, None)        self.assertEqual('35', v35.getText())    def testFindViewWithContentDescriptionOrRaise_root(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v45 = vc.findViewWithContentDescriptionOrRaise('CD45')        self.assertEqual('45', v45.getText())        v45 = vc.findViewWithContentDescriptionOrRaise('CD45', root=v4)        self.assertEqual('45', v45.getText())        v35 = vc.findViewWithContentDescriptionOrRaise('CD35', root=v3)        self.assertEqual('35', v35.getText())    def testFindViewWithContentDescriptionOrRaise_rootNonExistent(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        try:            vc.findViewWithContentDescriptionOrRaise('Non Existent', root=v4)            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithContentDescriptionOrRaiseExceptionMessage_regexpRoot(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        try:            vc.findViewWithContentDescriptionOrRaise(re.compile('Non Existent'), root=v4)            self.fail()        except ViewNotFoundException as e:            self.assertNotEqual(None, re.search("that matches 'Non Existent'", str(e)))    def testUiAutomatorDump(self):        device = MockDevice(version=16)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=True)    def testUiAutomatorKilled(self):        device = MockDevice(version=16, uiautomatorkilled=True)        try:            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=True, ignoreuiautomatorkilled=True)        except Exception as e:            self.assertIsNotNone(re.search('''ERROR: UiAutomator output contains no valid information. UiAutomator was killed, no reason given.''', str(e)))    def testUiViewServerDump(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump()            vc.findViewByIdOrRaise('id/home')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowStr(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window='StatusBar')            vc.findViewByIdOrRaise('id/status_bar')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowInt(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window=0xb52f7c88)            vc.findViewByIdOrRaise('id/status_bar')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowIntStr(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window='0xb52f7c88')            vc.findViewByIdOrRaise('id/status_bar')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowIntM1(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window=-1)            vc.findViewByIdOrRaise('id/home')        finally:            if device:                device.shutdownMockViewServer()    def testFindViewsContainingPoint_api15(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE)            list = vc.findViewsContainingPoint((200, 200))            self.assertNotEqual(None, list)            self.assertNotEqual(0, len(list))        finally:            if device:                device.shutdownMockViewServer()    def testFindViewsContainingPoint_api17(self):        device = MockDevice(version=17)        vc = ViewClient(device, device.serialno, adb=TRUE)        list = vc.findViewsContainingPoint((55, 75))        self.assertNotEqual(None, list)        self.assertNotEqual(0, len(list))    def testFindViewsContainingPoint_filterApi15(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE)            list = vc.findViewsContainingPoint((200, 200), _filter=View.isClickable)            self.assertNotEqual(None, list)            self.assertNotEqual(0, len(list))        finally:            if device:                device.shutdownMockViewServer()    def testFindViewsContainingPoint_filterApi17(self):        device = MockDevice(version=17)        vc = ViewClient(device, device.serialno, adb=TRUE)        list = vc.findViewsContainingPoint((55, 75), _filter=View.isClickable)        self.assertNotEqual(None, list)        self.assertNotEqual(0, len(list))if __name__ == "__main__":    print("ViewClient.__main__:", file=sys.stderr)    print("argv=", sys.argv, file=sys.stderr)    #import sys;sys.argv = ['', 'Test.testName']    #sys.argv.append('ViewClientTest.testFindViewsContainingPoint_filterApi17')    unittest.main()
\ No newline at end of file
+#! /usr/bin/env python# -*- coding: utf-8 -*-'''Copyright (C) 2012  Diego Torres MilanoCreated on Feb 5, 2012@author: diego'''import osimport sys# PyDev sets PYTHONPATH, use ittry:    for p in os.environ['PYTHONPATH'].split(':'):        if not p in sys.path:            sys.path.append(p)except:    passtry:    sys.path.insert(0, os.path.join(os.environ['ANDROID_VIEW_CLIENT_HOME'], 'src'))except:    passfrom androidviewclient3.viewclient import *from androidviewclient3.common import _nd, _nh, _nsfrom .mocks import MockDevicefrom .mocks import DUMP, DUMP_SAMPLE_UI, DUMP_API_10, VIEW_MAP, VIEW_MAP_API_8, VIEW_MAP_API_17, RUNNING, STOPPED, WINDOWSfrom .mocks import UIAUTOMATOR_DUMPos_name = platform.system()if os_name.startswith('Linux'):    TRUE = '/bin/true'elif os_name == 'Windows':    import tempfile    temp_true = tempfile.mkstemp(".bat", text=True)    os.close(temp_true[0])    TRUE = temp_true[1]    with open(TRUE, 'w') as f:        f.write("@echo off\r\nexit 0\r\n")    del temp_trueelse:    TRUE = '/usr/bin/true'class ViewTest(unittest.TestCase):    def setUp(self):        self.view = View(VIEW_MAP, None, -1)    def tearDown(self):        try:            del os.environ['ANDROID_SERIAL']        except:            pass    def testViewFactory_View(self):        attrs = {'class': 'android.widget.AnyView', 'text:mText': 'Button with ID'}        view = View.factory(attrs, None, -1)        self.assertTrue(isinstance(view, View))    def testViewFactory_TextView(self):        attrs = {'class': 'android.widget.TextView', 'text:mText': 'Button with ID'}        view = View.factory(attrs, None, -1)        self.assertTrue(isinstance(view, TextView))    def testViewFactory_TextView(self):        attrs = {'class': 'android.widget.EditText', 'text:mText': 'Button with ID'}        view = View.factory(attrs, None, -1)        self.assertTrue(isinstance(view, EditText))    def testView_notSpecifiedSdkVersion(self):        device = MockDevice()        view = View(VIEW_MAP, device, -1)        self.assertEqual(device.version, view.build[VERSION_SDK_PROPERTY])    def testView_specifiedSdkVersion_8(self):        view = View(VIEW_MAP_API_8, MockDevice(), 8)        self.assertEqual(8, view.build[VERSION_SDK_PROPERTY])    def testView_specifiedSdkVersion_10(self):        view = View(VIEW_MAP, MockDevice(), 10)        self.assertEqual(10, view.build[VERSION_SDK_PROPERTY])    def testView_specifiedSdkVersion_16(self):        view = View(VIEW_MAP, MockDevice(), 16)        self.assertEqual(16, view.build[VERSION_SDK_PROPERTY])    def testInnerMethod(self):        v = View({'isChecked()':'true'}, None)        self.assertTrue(v.isChecked())        v.map['isChecked()'] = 'false'        self.assertFalse(v.isChecked(), "Expected False but is %s {%s}" % (v.isChecked(), v.map['isChecked()']))        self.assertFalse(v.isChecked())        v.map['other'] = 1        self.assertEqual(1, v.other())        v.map['evenMore'] = "ABC"        self.assertEqual("ABC", v.evenMore())        v.map['more'] = "abc"        v.map['more'] = v.evenMore()        self.assertEqual("ABC", v.more())        v.map['isMore()'] = 'true'        self.assertTrue(v.isMore())    def testGetClass(self):        self.assertEqual('android.widget.ToggleButton', self.view.getClass())    def testGetId(self):        self.assertEqual('id/button_with_id', self.view.getId())    def testTextPropertyForDifferentSdkVersions(self):        VP = { -1:TEXT_PROPERTY, 8:TEXT_PROPERTY_API_10, 10:TEXT_PROPERTY_API_10, 15:TEXT_PROPERTY, 16:TEXT_PROPERTY_UI_AUTOMATOR, 17:TEXT_PROPERTY_UI_AUTOMATOR}        for version, textProperty in VP.items():            view = View(None, None, version)            self.assertEqual(textProperty, view.textProperty, msg='version %d: expected: %s actual: %s' % (version, textProperty, view.textProperty))    def testTextPropertyForDifferentSdkVersions_device(self):        VP = { -1:TEXT_PROPERTY, 8:TEXT_PROPERTY_API_10, 10:TEXT_PROPERTY_API_10, 15:TEXT_PROPERTY, 16:TEXT_PROPERTY_UI_AUTOMATOR, 17:TEXT_PROPERTY_UI_AUTOMATOR}        for version, textProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(textProperty, view.textProperty, msg='version %d' % version)    def testLeftPropertyForDifferentSdkVersions(self):        VP = { -1:LEFT_PROPERTY, 8:LEFT_PROPERTY_API_8, 10:LEFT_PROPERTY, 15:LEFT_PROPERTY, 16:LEFT_PROPERTY, 17:LEFT_PROPERTY}        for version, leftProperty in VP.items():            view = View(None, None, version)            self.assertEqual(leftProperty, view.leftProperty, msg='version %d' % version)    def testLeftPropertyForDifferentSdkVersions_device(self):        VP = { -1:LEFT_PROPERTY, 8:LEFT_PROPERTY_API_8, 10:LEFT_PROPERTY, 15:LEFT_PROPERTY, 16:LEFT_PROPERTY, 17:LEFT_PROPERTY}        for version, leftProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(leftProperty, view.leftProperty, msg='version %d' % version)    def testTopPropertyForDifferentSdkVersions(self):        VP = { -1:TOP_PROPERTY, 8:TOP_PROPERTY_API_8, 10:TOP_PROPERTY, 15:TOP_PROPERTY, 16:TOP_PROPERTY, 17:TOP_PROPERTY}        for version, topProperty in VP.items():            view = View(None, None, version)            self.assertEqual(topProperty, view.topProperty, msg='version %d' % version)    def testTopPropertyForDifferentSdkVersions_device(self):        VP = { -1:TOP_PROPERTY, 8:TOP_PROPERTY_API_8, 10:TOP_PROPERTY, 15:TOP_PROPERTY, 16:TOP_PROPERTY, 17:TOP_PROPERTY}        for version, topProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(topProperty, view.topProperty, msg='version %d' % version)    def testWidthPropertyForDifferentSdkVersions(self):        VP = { -1:WIDTH_PROPERTY, 8:WIDTH_PROPERTY_API_8, 10:WIDTH_PROPERTY, 15:WIDTH_PROPERTY, 16:WIDTH_PROPERTY, 17:WIDTH_PROPERTY}        for version, widthProperty in VP.items():            view = View(None, None, version)            self.assertEqual(widthProperty, view.widthProperty, msg='version %d' % version)    def testWidthPropertyForDifferentSdkVersions_device(self):        VP = { -1:WIDTH_PROPERTY, 8:WIDTH_PROPERTY_API_8, 10:WIDTH_PROPERTY, 15:WIDTH_PROPERTY, 16:WIDTH_PROPERTY, 17:WIDTH_PROPERTY}        for version, widthProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(widthProperty, view.widthProperty, msg='version %d' % version)    def testHeightPropertyForDifferentSdkVersions(self):        VP = { -1:HEIGHT_PROPERTY, 8:HEIGHT_PROPERTY_API_8, 10:HEIGHT_PROPERTY, 15:HEIGHT_PROPERTY, 16:HEIGHT_PROPERTY, 17:HEIGHT_PROPERTY}        for version, heightProperty in VP.items():            view = View(None, None, version)            self.assertEqual(heightProperty, view.heightProperty, msg='version %d' % version)    def testHeightPropertyForDifferentSdkVersions_device(self):        VP = { -1:HEIGHT_PROPERTY, 8:HEIGHT_PROPERTY_API_8, 10:HEIGHT_PROPERTY, 15:HEIGHT_PROPERTY, 16:HEIGHT_PROPERTY, 17:HEIGHT_PROPERTY}        for version, heightProperty in VP.items():            device = MockDevice(version=version)            view = View(None, device, -1)            self.assertEqual(heightProperty, view.heightProperty, msg='version %d' % version)    def testGetText(self):        self.assertTrue('text:mText' in self.view.map)        self.assertEqual('Button with ID', self.view.getText())        self.assertEqual('Button with ID', self.view['text:mText'])    def testGetX_specifiedSdkVersion_8(self):        view = View(VIEW_MAP_API_8, MockDevice(), 8)        self.assertEqual(8, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(50, view.getX())    def testGetX_specifiedSdkVersion_10(self):        view = View(VIEW_MAP, MockDevice(), 10)        self.assertEqual(10, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(50, view.getX())    def testGetY_specifiedSdkVersion_8(self):        view = View(VIEW_MAP_API_8, MockDevice(), 8)        self.assertEqual(8, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(316, view.getY())    def testGetY_specifiedSdkVersion_10(self):        view = View(VIEW_MAP, MockDevice(), 10)        self.assertEqual(10, view.build[VERSION_SDK_PROPERTY])        self.assertEqual(316, view.getY())    def testGetWidth(self):        self.assertEqual(1140, self.view.getWidth())    def testGetHeight(self):        self.assertEqual(48, self.view.getHeight())    def testGetUniqueId(self):        self.assertEqual('id/button_with_id', self.view.getUniqueId())    def testGetUniqueIdEqualsToIdWhenIdIsSpecified(self):        self.assertEqual(self.view.getId(), self.view.getUniqueId())    def testName_Layout_mLeft(self):        v = View({'layout:mLeft':200}, None)        self.assertEqual(200, v.layout_mLeft())    def testNameWithColon_this_is_a_fake_name(self):        v = View({'this:is_a_fake_name':1}, None)        self.assertEqual(1, v.this_is_a_fake_name())    def testNameWith2Colons_this_is_another_fake_name(self):        v = View({'this:is:another_fake_name':1}, None)        self.assertEqual(1, v.this_is_another_fake_name())    def testViewWithoutId(self):        v = View({'mID':'id/NO_ID', 'text:mText':'Some text'}, None)        self.assertEqual('id/NO_ID', v.getId())    def testInexistentMethodName(self):        v = View({'foo':1}, None)        try:            v.bar()            raise Exception("AttributeError not raised")        except AttributeError:            pass    def testViewTreeRoot(self):        root = View({'root':1}, None)        self.assertTrue(root.parent == None)    def testViewTree(self):        root = View({'root':1}, None)        children = ["A", "B", "C"]        for s in children:            root.add(View({s:1}, None))        self.assertEqual(len(children), len(root.children))    def testViewTreeParent(self):        root = View({'root':1}, None)        children = ["A", "B", "C"]        for s in children:            root.add(View({s:1}, None))        for ch in root.children:            self.assertTrue(ch.parent == root)    def testContainsPoint_api15(self):        v = View(VIEW_MAP, MockDevice(), 15)        (X, Y, W, H) = v.getPositionAndSize()        self.assertEqual(X, v.getX())        self.assertEqual(Y, v.getY())        self.assertEqual(W, v.getWidth())        self.assertEqual(H, v.getHeight())        self.assertTrue(v.containsPoint((v.getCenter())))    def testContainsPoint_api17(self):        v = View(VIEW_MAP_API_17, MockDevice(), 17)        (X, Y, W, H) = v.getPositionAndSize()        self.assertEqual(X, v.getX())        self.assertEqual(Y, v.getY())        self.assertEqual(W, v.getWidth())        self.assertEqual(H, v.getHeight())        self.assertTrue(v.containsPoint((v.getCenter())))    def testIsClickable_api15(self):        v = View(VIEW_MAP, MockDevice(), 15)        self.assertTrue(v.isClickable())    def testIsClickable_api17(self):        v = View(VIEW_MAP_API_17, MockDevice(), 17)        self.assertTrue(v.isClickable())    def testCopyConstructor(self):        device = MockDevice()        mv = VIEW_MAP_API_17.copy()        mv['class'] = u'android.widget.View'        v = View(mv, device, 17)        self.assertEqual(v.getClass(), u'android.widget.View')        mt = VIEW_MAP_API_17.copy()        mt['class'] = u'android.widget.TextView'        t = TextView(mt, device, 17)        self.assertEqual(t.getClass(), u'android.widget.TextView')        me = VIEW_MAP_API_17.copy()        me['class'] = u'android.widget.EditText'        e = TextView(me, device, 17)        self.assertEqual(e.getClass(), u'android.widget.EditText')        v1 = View.clone(v)        self.assertEqual(u'android.widget.View', v1.getClass())        t1 = TextView.clone(t)        self.assertEqual(u'android.widget.TextView', t1.getClass())        e1 = EditText.clone(e)        self.assertEqual(u'android.widget.EditText', e1.getClass())        t2 = TextView.clone(v)        self.assertEqual(u'android.widget.TextView', t2.getClass())        e2 = EditText.clone(v)        self.assertEqual(u'android.widget.EditText', e2.getClass())        e2.setText("hello")class ViewClientTest(unittest.TestCase):    def setUp(self):        pass    def tearDown(self):        pass    def testInit_adb(self):        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)    def testInit_adbNone(self):        # FIXME: there's a problem here when the mock device is created,        # it's intended to be API=15, mock ViewServer is started and then        # adb tries (unsuccessfuly) to forward the ports (expected because        # adb does not know anything about mock devices).        # Then        #    error: device not found        # appears in the console        device = MockDevice()        try:            vc = ViewClient(device, device.serialno, adb=None, autodump=False)            self.assertIsNotNone(vc)        except subprocess.CalledProcessError:            # This is needed because the ports cannot be forwarded if there is no device connected            pass    def testExceptionDeviceNotConnected(self):        try:            vc = ViewClient(None, None)        except Exception as e:            self.assertEqual('Device is not connected', str(e))    def testConnectToDeviceOrExit_environ(self):        sys.argv = ['']        os.environ['ANDROID_SERIAL'] = 'ABC123'        try:            ViewClient.connectToDeviceOrExit(timeout=1, verbose=True)        except RuntimeError as e:            msg = str(e)            if re.search('Is adb running on your computer?', msg):                # This test required adb running                self.fail(msg)            elif re.search("There are no connected devices", msg):                # special case, when there are no devices connected then the                # serialno specified doesn't matter                pass            elif not re.search("couldn't find device that matches 'ABC123'", msg):                self.fail(msg)        except SystemExit as e:            self.assertEqual(3, e.code)        except Exception as e: #FIXME: java.lang.NullPointerException:            self.fail('Serialno was not taken from environment: ' + msg)    def testConnectToDeviceOrExit_serialno(self):        sys.argv = ['']        try:            ViewClient.connectToDeviceOrExit(timeout=1, verbose=True, serialno='ABC123')        except RuntimeError as e:            msg = str(e)            if re.search('Is adb running on your computer?', msg):                # This test required adb running                self.fail(msg)            elif re.search("There are no connected devices", msg):                # special case, when there are no devices connected then the                # serialno specified doesn't matter                pass            elif not re.search("couldn't find device that matches 'ABC123'", msg):                self.fail(msg)        except SystemExit as e:            self.assertEqual(3, e.code)        except Exception as e: #FIXME: java.lang.NullPointerException:            self.fail('Serialno was not taken from argument: ' + str(e))    def testConstructor(self):        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)    def testMapSerialNo_noPortSpecified(self):        vc = ViewClient(MockDevice(), serialno='192.168.1.100', adb=TRUE, autodump=False)        self.assertEqual('192.168.1.100:5555', vc.serialno)    def testMapSerialNo_portSpecified(self):        vc = ViewClient(MockDevice(), serialno='192.168.1.100:5555', adb=TRUE, autodump=False)        self.assertEqual('192.168.1.100:5555', vc.serialno)    def testMapSerialNo_emulator(self):        vc = ViewClient(MockDevice(), serialno='emulator-5556', adb=TRUE, autodump=False)        self.assertEqual('emulator-5556', vc.serialno)    def testMapSerialNo_regex(self):        # This is an edge case. A regex should not be used as the serialno in ViewClient as it's        # behavior is not well defined.        # MonkeyRunner.waitForConnection() accepts a regexp as serialno but adb -s doesn't        try:            ViewClient(MockDevice(),  serialno='.*', adb=TRUE, autodump=False)            self.fail()        except ValueError:            pass    def testMapSerialNo_None(self):        device = MockDevice()        try:            ViewClient(device, None, adb=TRUE, autodump=False)            self.fail()        except ValueError:            pass    def testGetProperty_displayWidth(self):        device = MockDevice()        self.assertEqual(768, device.getProperty('display.width'))    def testGetProperty_displayHeight(self):        device = MockDevice()        self.assertEqual(1184, device.getProperty('display.height'))    def __mockTree(self, dump=DUMP, version=15, language='en'):        device = MockDevice(version=version, language=language)        vc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        if version <= 15:            # We don't want to invoke the ViewServer or MockViewServer for this            vc.setViews(dump)        else:            vc.dump()        return vc    def __mockWindows(self, windows=WINDOWS):        device = MockDevice()        vc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.windows = windows        return vc    def testRoot(self):        vc = self.__mockTree()        root = vc.root        self.assertTrue(root != None)        self.assertTrue(root.parent == None)        self.assertTrue(root.getClass() == 'com.android.internal.policy.impl.PhoneWindow$DecorView')    def testParseTree(self):        vc = self.__mockTree()        # eat all the output        vc.traverse(vc.root, transform=self.__eatIt)        # We know there are 23 views in ViewServer mock tree        self.assertEqual(23, len(vc.getViewIds()))    def testParseTree_lengthPrefixedValues(self):        dump = '''\android.widget.LinearLayout@41 mID=5,NO_ID android.widget.TextView@42 text:mText=11,hello world accessibility:getContentDescription()=13,foo@bar b@1ef mID=7,id/text android.widget.TextView@43 text:mText=4,\U0001F600 :) mID=8,id/smileDONE'''        vc = self.__mockTree(dump=dump)        self.assertEqual(3, len(vc.views))        v = vc.findViewByIdOrRaise('id/text')        self.assertEqual('hello world', v.getText())        self.assertEqual('foo@bar b@1ef', v.map['accessibility:getContentDescription()'])        self.assertEqual('android.widget.TextView', v.getClass())        self.assertEqual(vc.root, v.getParent())        self.assertEqual('\U0001F600 :)', vc.findViewByIdOrRaise('id/smile').getText())    def testParsetree_api17(self):        vc = self.__mockTree(version=17)        # eat all the output        vc.traverse(vc.root, transform=self.__eatIt)        # We know there are 9 views in UiAutomator mock tree        self.assertEqual(9, len(vc.getViewIds()))    def testParsetree_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        # eat all the output        vc.traverse(vc.root, transform=self.__eatIt)        # We know there are 21 views in UiAutomator mock tree        self.assertEqual(21, len(vc.getViewIds()))    def __testViewByIds_apiIndependent(self, vc):        viewsbyId = vc.getViewsById()        self.assertNotEqual(None, viewsbyId)        for k, v in viewsbyId.items():            self.assertTrue(isinstance(k, str))            self.assertTrue(isinstance(v, View), "v=" + str(v) + " is not a View")            self.assertTrue(re.match("id/.*", v.getUniqueId()) != None)            self.assertEqual(k, v.getUniqueId())    def testGetViewsById(self):        vc = self.__mockTree()        self.__testViewByIds_apiIndependent(vc)    def testGetViewsById_api17(self):        vc = self.__mockTree(version=17)        self.__testViewByIds_apiIndependent(vc)    def testGetViewsById_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        self.__testViewByIds_apiIndependent(vc)    def testCompactTree_api17(self):        vc = self.__mockTree(version=17)        device = MockDevice(version=17)        cvc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False, compacttree=True)        cvc.dump()        self.assertTrue(isinstance(cvc.tree, ViewTree))        self.assertEqual(len(vc.views), len(cvc.views))        for v, cv in zip(vc.views, cvc.views):            self.assertEqual(v.map, cv.map)            self.assertEqual(v.parent.getUniqueId() if v.parent else None,                             cv.parent.getUniqueId() if cv.parent else None)            self.assertEqual([c.getUniqueId() for c in v.children], [c.getUniqueId() for c in cv.children])        self.__testViewByIds_apiIndependent(cvc)    def testCompactTree_viewsCreatedOnDemand(self):        device = MockDevice(version=17)        vc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False, compacttree=True)        vc.dump()        # only the root has been created by dump()        self.assertEqual(1, len(vc.tree.views))        v = vc.findViewByIdOrRaise('id/no_id/9')        self.assertEqual('id/no_id/9', v.getUniqueId())        self.assertEqual(2, len(vc.tree.views))        self.assertIs(v, vc.findViewById('id/no_id/9'))        self.assertIs(v, vc.views[8])    def testNewViewClientInstancesDontDuplicateTree(self):        vc = {}        n = {}        for i in range(10):            vc[i] = self.__mockTree()            n[i] = len(vc[i].getViewIds())        for i in range(1, 10):            self.assertEqual(n[0], n[i])    def testTraverseShowClassIdAndText(self):        device = MockDevice()        root = View({'text:mText':'0', 'class': 'android.widget.View', 'mID': 0}, device)        root.add(View({'text:mText':'1', 'class': 'android.widget.View', 'mID': 1}, device))        root.add(View({'text:mText':'2', 'class': 'android.widget.View', 'mID': 2}, device))        v3 = View({'text:mText':'3', 'class': 'android.widget.View', 'mID':3}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35', 'class': 'android.widget.View', 'mID': 35}, device)        v3.add(v35)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        treeStr = io.StringIO()        vc.traverse(root=root, transform=ViewClient.TRAVERSE_CIT, stream=treeStr)        self.assertNotEqual(None, treeStr.getvalue())        lines = treeStr.getvalue().splitlines()        self.assertEqual(5, len(lines), "lines=%s" % lines)        self.assertEqual('android.widget.View 0 0', lines[0])        citRE = re.compile(' +android.widget.View \d+ \d+')        for l in lines[1:]:            self.assertTrue(citRE.match(l), 'l=%s' % l)    def testTraverseShowClassIdTextAndCenter(self):        device = MockDevice()        root = View({'mID':'0', 'text:mText':'0', 'layout:mLeft':0, 'layout:mTop':0}, device)        root.add(View({'mID':'1', 'text:mText':'1', 'layout:mLeft':1, 'layout:mTop':1}, device))        root.add(View({'mID':'2', 'text:mText':'2', 'layout:mLeft':2, 'layout:mTop':2}, device))        v3 = View({'mID':'3', 'text:mText':'3', 'layout:mLeft':3, 'layout:mTop':3}, device)        root.add(v3)        v35 = View({'mID':'5', 'text:mText':'5', 'getTag()':'v35', 'layout:mLeft':5, 'layout:mTop':5}, device)        v3.add(v35)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        treeStr = io.StringIO()        vc.traverse(root=root, transform=ViewClient.TRAVERSE_CITC, stream=treeStr)        self.assertNotEqual(None, treeStr.getvalue())        lines = treeStr.getvalue().splitlines()        self.assertEqual(5, len(lines))        # In Python 3, division is always float!        self.assertEqual('None 0 0 (0.0, 0.0)', lines[0])        citRE = re.compile(r' +None \d+ \d+ \(\d+\.\d+, \d+\.\d+\)')        for l in lines[1:]:            self.assertTrue(citRE.match(l))    def __getClassAndId(self, view):        try:            return "%s %s %s %s" % (view.getClass(), view.getId(), view.getUniqueId(), view.getCoords())        except Exception as e:            return "Exception in view=%s: %s" % (view.__smallStr__(), e)    def __eatIt(self, view):        return ""    def testViewWithNoIdReceivesUniqueId(self):        vc = self.__mockTree()        # We know there are 6 views without id in the mock tree        for i in range(1, 6):            self.assertNotEqual(None, vc.findViewById("id/no_id/%d" % i))    def testTextWithSpaces(self):        vc = self.__mockTree()        self.assertNotEqual(None, vc.findViewWithText('Medium Text'))    def testTextWithVeryLargeContent(self):        TEXT = """\MOCK@412a9d08 mID=7,id/test drawing:mForeground=4,null padding:mForegroundPaddingBottom=1,0 text:mText=319,[!   "   #   $   %   &   '   (   )   *   +   ,   -   .   /   0   1   2   3   4   5   6   7   8   9   :   ;   <   =   >   ?   @   A   B   C   D   E   F   G   H   I   J   K   L   M   N   O   P   Q   R   S   T   U   V   W   X   Y   Z   [   \   ]   ^   _   `   a   b   c   d   e   f   g   h   i   j   k   l   m   n   o   p] mViewFlags=11,-1744830336\"""        vc = self.__mockTree(TEXT)        test = vc.findViewById('id/test')        text = test.getText()        self.assertEqual(319, len(text))        self.assertEqual('[', text[0])        self.assertEqual(']', text[318])        self.assertEqual('-1744830336', test['mViewFlags'])    def testActionBarSubtitleCoordinates(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        toggleButton = vc.findViewById('id/button_with_id')        self.assertNotEqual(None, toggleButton)        textView3 = vc.findViewById('id/textView3')        self.assertNotEqual(None, textView3)        x = toggleButton.getX()        y = toggleButton.getY()        w = toggleButton.getWidth()        h = toggleButton.getHeight()        xy = toggleButton.getXY()        coords = toggleButton.getCoords()        self.assertNotEqual(None, textView3.getText())        self.assertNotEqual("", textView3.getText().strip())        lv = textView3.getText().strip().split()        _list = [ eval(str(v)) for v in lv ]        tx = _list[1][0]        ty = _list[1][1]        tsx = _list[1][0]        tsy = _list[1][1]        self.assertEqual(tx, x)        self.assertEqual(ty, y)        self.assertEqual((tsx, tsy), xy)        self.assertEqual(((tsx, tsy), (xy[0] + w, xy[1] + h)), coords)    def testServiceStoppedAfterDestructor(self):        device = MockDevice()        self.assertTrue(device.service == STOPPED)        if True:            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            self.assertTrue(device.service == RUNNING)            vc.__del__()        # Perhpas there are other ViewClients using the same server, we cannot expect it stops        #self.assertTrue(device.service == STOPPED)    def testList(self):        vc = self.__mockWindows()        self.assertNotEqual(None, vc.windows)    def testFindViewByIdOrRaise(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        vc.findViewByIdOrRaise('id/up')    def testFindViewByIdOrRaise_api17(self):        vc = self.__mockTree(version=17)        vc.traverse(stream=self.openDevNull())        vc.findViewByIdOrRaise('id/no_id/9')    def testFindViewByIdOrRaise_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        vc.traverse(stream=self.openDevNull())        vc.findViewByIdOrRaise('id/no_id/21')    def testFindViewByIdOrRaise_nonExistentView(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        try:            vc.findViewByIdOrRaise('id/nonexistent')            self.fail()        except ViewNotFoundException:            pass    def testFindViewByIdOrRaise_nonExistentView_api17(self):        vc = self.__mockTree(version=17)        try:            vc.findViewByIdOrRaise('id/nonexistent')            self.fail()        except ViewNotFoundException:            pass    def testFindViewByIdOrRaise_nonExistentView_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        try:            vc.findViewByIdOrRaise('id/nonexistent')            self.fail()        except ViewNotFoundException:            pass    def testFindViewById_root(self):        device = None        root = View({'mID':'0'}, device)        root.add(View({'mID':'1'}, device))        root.add(View({'mID':'2'}, device))        v3 = View({'mID':'3'}, device)        root.add(v3)        v35 = View({'mID':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'mID':'4'}, device)        root.add(v4)        v45 = View({'mID':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewById('5')        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewById('5', root=v4)        self.assertNotEqual(v5, None)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewById('5', root=v3)        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())    def testFindViewById_viewFilter(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.ImageView'        view = vc.findViewById('id/up', viewFilter=vf)        self.assertNotEqual(view, None)    def testFindViewById_viewFilterUnmatched(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.TextView'        view = vc.findViewById('id/up', viewFilter=vf)        self.assertEqual(view, None)    def testFindViewByIdOrRaise_root(self):        device = None        root = View({'mID':'0'}, device)        root.add(View({'mID':'1'}, device))        root.add(View({'mID':'2'}, device))        v3 = View({'mID':'3'}, device)        root.add(v3)        v35 = View({'mID':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'mID':'4'}, device)        root.add(v4)        v45 = View({'mID':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewByIdOrRaise('5')        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewByIdOrRaise('5', root=v4)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewByIdOrRaise('5', root=v3)        self.assertEqual('v35', v5.getTag())    def testFindViewByIdOrRaise_viewFilter(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.ImageView'        view = vc.findViewByIdOrRaise('id/up', viewFilter=vf)    def testFindViewByIdOrRaise_viewFilterUnmatched(self):        vc = self.__mockTree(dump=DUMP_SAMPLE_UI)        def vf(view):            return view.getClass() == 'android.widget.TextView'        try:            view = vc.findViewByIdOrRaise('id/up', viewFilter=vf)        except ViewNotFoundException:            pass    def testFindViewWithText_root(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithText('5')        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithText('5', root=v4)        self.assertNotEqual(v5, None)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithText('5', root=v3)        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())    def testFindViewWithText_regexRoot(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithText(re.compile('[5]'))        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithText(re.compile('[5]'), root=v4)        self.assertNotEqual(v5, None)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithText(re.compile('[5]'), root=v3)        self.assertNotEqual(v5, None)        self.assertEqual('v35', v5.getTag())    def testFindViewWithTextOrRaise_root(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithTextOrRaise('5')        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v4)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v3)        self.assertEqual('v35', v5.getTag())    def testFindViewWithTextOrRaise_root_disappearingView(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v5 = vc.findViewWithTextOrRaise('5')        self.assertEqual('v35', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v4)        self.assertEqual('v45', v5.getTag())        v5 = vc.findViewWithTextOrRaise('5', root=v3)        self.assertEqual('v35', v5.getTag())        # Then remove v4 and its children        root.children.remove(v4)        #vc.dump()        v4 = vc.findViewWithText('4')        self.assertEqual(v4, None, "v4 has not disappeared")    def testFindViewWithTextOrRaise_rootNonExistent(self):        device = None        root = View({'text:mText':'0'}, device)        root.add(View({'text:mText':'1'}, device))        root.add(View({'text:mText':'2'}, device))        v3 = View({'text:mText':'3'}, device)        root.add(v3)        v35 = View({'text:mText':'5', 'getTag()':'v35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4'}, device)        root.add(v4)        v45 = View({'text:mText':'5', 'getTag()':'v45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        try:            vc.findViewWithTextOrRaise('Non Existent', root=v4)            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithTextOrRaise_api17(self):        vc = self.__mockTree(version=17)        vc.findViewWithTextOrRaise("Apps")    def testFindViewWithAttribute_indexSameAsTraversal(self):        for vc in [self.__mockTree(), self.__mockTree(version=17), self.__mockTree(version=17, language='zh')]:            viewIndex = vc.viewIndex            self.assertNotEqual(None, viewIndex)            for v in vc.views:                for root in ['ROOT', v.parent or 'ROOT']:                    found = []                    for vc.viewIndex in [viewIndex, None]:                        found.append([vc.findViewById(v.getId(), root), vc.findViewById(v.getUniqueId(), root)])                        for attr in ['class', vc.textProperty, 'content-desc']:                            if attr in v.map:                                found[-1].append(vc.findViewWithAttribute(attr, v.map[attr], root))                                found[-1].append(vc.findViewsWithAttribute(attr, v.map[attr], root))                                found[-1].append(vc.findViewWithAttributeThatMatches(attr, re.compile(                                    re.escape(v.map[attr][:2]) + '.*'), root))                    self.assertEqual(found[0], found[1])    def testViewIndex_literalPrefix(self):        self.assertEqual('Apps', ViewIndex.literalPrefix(re.compile('Apps')))        self.assertEqual('App', ViewIndex.literalPrefix(re.compile('Apps?')))        self.assertEqual('App', ViewIndex.literalPrefix(re.compile('App.*')))        self.assertEqual('', ViewIndex.literalPrefix(re.compile('Apps|Widgets')))        self.assertEqual('', ViewIndex.literalPrefix(re.compile('apps', re.IGNORECASE)))    def testFindViewsWithSelector(self):        device = MockDevice(version=17)        cvc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False, compacttree=True)        cvc.dump()        for vc in [self.__mockTree(version=17), cvc]:            byClass = lambda c: [v for v in vc.views if v.getClass() == 'android.widget.' + c]            apps = byClass('TextView')            self.assertEqual(1, len(apps))            self.assertEqual(apps, vc.findViewsWithSelector('TextView'))            self.assertEqual(apps, vc.findViewsWithSelector('TabHost > LinearLayout TextView'))            self.assertEqual(apps, vc.findViewsWithSelector("*[clickable=true][desc*=pp][text!='']"))            self.assertEqual([], vc.findViewsWithSelector('TabHost > TextView'))            self.assertEqual(byClass('TabWidget'),                             vc.findViewsWithSelector('class=TextView[text~=/^apps$/i] > parent::TabWidget'))            self.assertEqual(byClass('FrameLayout'), vc.findViewsWithSelector('TextView ancestor::FrameLayout'))            tabHost = byClass('TabHost')[0]            self.assertEqual(byClass('FrameLayout')[-1:], vc.findViewsWithSelector('FrameLayout', root=tabHost))            self.assertEqual(apps[0], vc.findViewWithSelector('desc@Apps,text@Apps'))            self.assertEqual(apps[0], vc.findViewWithSelectorOrRaise('pkg@com.android.launcher,text@Apps'))            with self.assertRaises(ViewNotFoundException):                vc.findViewWithSelectorOrRaise('text@Widgets')    def testFindViewsWithSelector_notDumped(self):        device = MockDevice()        root = View({'text:mText': '0', 'class': 'android.widget.LinearLayout'}, device)        v1 = View({'text:mText': '1', 'class': 'android.widget.Button'}, device)        root.add(v1)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        vc.root = root        self.assertEqual([v1], vc.findViewsWithSelector('LinearLayout > Button[text:mText=1]'))    def testSelector_compile(self):        query = "ListView > LinearLayout TextView[text^='Item ']"        self.assertIs(Selector.compile(query), Selector.compile(query))        self.assertEqual(['descendant-or-self', 'child', 'descendant'], [s.axis for s in Selector.compile(query).steps])        for query in ['', 'TextView >', 'TextView[text=Apps', "text='Apps", 'text^=/A/', 'res@id/ok,Apps']:            with self.assertRaises(ValueError):                Selector(query)    def testFindViewsContainingPoint_spatialIndexSameAsScan(self):        device = MockDevice(version=17)        cvc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False, compacttree=True)        cvc.dump()        for vc in [self.__mockTree(), self.__mockTree(version=17), cvc]:            for v in vc.views:                ((x0, y0), (x1, y1)) = v.getCoords()                for xy in [(x0, y0), (x1, y1), ((x0 + x1) // 2, (y0 + y1) // 2), (x0 - 1, y1 + 1)]:                    self.assertEqual([_v for _v in vc.views if _v.containsPoint(xy)], vc.findViewsContainingPoint(xy))    def testFindViewsIntersectingRect(self):        vc = self.__mockTree(version=17)        rect = ((100, 200), (300, 400))        intersect = lambda v: v.getX() <= 300 and 100 <= v.getX() + v.getWidth() and \                              v.getY() <= 400 and 200 <= v.getY() + v.getHeight()        self.assertEqual([v for v in vc.views if intersect(v)], vc.findViewsIntersectingRect(rect))    def testFindViewNearestToPoint(self):        vc = self.__mockTree(version=17)        clickable = lambda v: v.isClickable()        for v in vc.views:            ((x0, y0), (x1, y1)) = v.getCoords()            xy = ((x0 + x1) // 2, (y0 + y1) // 2)            self.assertEqual(vc.findViewsContainingPoint(xy)[-1], vc.findViewNearestToPoint(xy))            nearest = vc.findViewNearestToPoint(xy, clickable)            if nearest:                distance = lambda _v: SpatialIndex(vc.views).distance(vc.views.index(_v), xy)                self.assertEqual(min(distance(_v) for _v in vc.views if clickable(_v)), distance(nearest))        self.assertEqual(None, vc.findViewNearestToPoint((-100, -100), maxDistance=10))    def testDistance_sameTree(self):        for version in [15, 17]:            vc1 = self.__mockTree(version=version)            vc2 = self.__mockTree(version=version)            self.assertEqual(0.0, ViewClient.distance(vc1.views, vc2.views))            self.assertEqual(0.0, vc1.distanceTo(vc2.views))            self.assertTrue(vc1.diff(vc2.views).isEqual())    def testDiff_changedAndRemoved(self):        vc1 = self.__mockTree(version=17)        vc2 = self.__mockTree(version=17)        dump = re.sub('<node index="0" text="Apps".*?/>', '', UIAUTOMATOR_DUMP, flags=re.DOTALL)        vc2.setViewsFromUiAutomatorDump(dump.replace('text="" class="android.widget.TabWidget"',                                                     'text="changed" class="android.widget.TabWidget"'))        diff = TreeDiff(vc1.views, vc2.views)        self.assertEqual([], diff.inserted)        self.assertEqual([vc1.views[-1]], diff.removed)        self.assertEqual([vc2.views[-1]], [new for old, new in diff.changed])        self.assertEqual('changed', diff.changed[0][1].getText())        self.assertEqual([], diff.moved)        self.assertAlmostEqual(2.0 / (len(vc1.views) + len(vc2.views)), diff.distance)        self.assertEqual(len(vc1.views) - 1, len([q for q in diff.matches1 if q != -1]))    def testDiff_moved(self):        vc1 = self.__mockTree(version=17)        vc2 = self.__mockTree(version=17)        vc2.setViewsFromUiAutomatorDump(UIAUTOMATOR_DUMP.replace('bounds="[1,38][105,116]"', 'bounds="[0,0][1,1]"'))        diff = vc2.diff(vc1.views)        self.assertEqual([vc2.views[-1]], [new for old, new in diff.moved])        self.assertEqual([], diff.changed)        self.assertEqual([], diff.inserted + diff.removed)    def testTreeHash(self):        for version in [15, 17]:            vc1 = self.__mockTree(version=version)            vc2 = self.__mockTree(version=version)            self.assertNotEqual(None, vc1.treeHash)            self.assertEqual(vc1.treeHash, vc2.treeHash)            self.assertEqual([v.getSubtreeHash() for v in vc1.views], [v.getSubtreeHash() for v in vc2.views])        device = MockDevice(version=17)        cvc = ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False, compacttree=True)        cvc.dump()        self.assertEqual(vc2.treeHash, cvc.treeHash)        self.assertEqual([v.getContentHash() for v in vc2.views], [v.getContentHash() for v in cvc.views])        vc2.setViewsFromUiAutomatorDump(UIAUTOMATOR_DUMP.replace('text="Apps"', 'text="Widgets"'))        self.assertNotEqual(vc1.treeHash, vc2.treeHash)        self.assertEqual(vc1.views[0].getContentHash(), vc2.views[0].getContentHash())        self.assertNotEqual(vc1.views[0].getSubtreeHash(), vc2.views[0].getSubtreeHash())    def testChangedSubtrees(self):        vc1 = self.__mockTree(version=17)        vc2 = self.__mockTree(version=17)        self.assertEqual([], TreeDiff.changedSubtrees(vc1.root, vc2.root))        vc2.setViewsFromUiAutomatorDump(UIAUTOMATOR_DUMP.replace('text="Apps"', 'text="Widgets"'))        self.assertEqual([(vc1.views[-1], vc2.views[-1])], TreeDiff.changedSubtrees(vc1.views[0], vc2.views[0]))    def testWaitForStable_dump(self):        vc = self.__mockTree(version=17)        vc.views = []        self.assertTrue(vc.waitForStable(quiet=0.2, timeout=5, interval=0.05))        self.assertNotEqual(0, len(vc.views))        self.assertNotEqual(None, vc.treeHash)    def testWaitForStable_settles(self):        vc = self.__mockTree(version=17)        values = iter([1, 2, 3])        start = time.time()        self.assertTrue(vc.waitForStable(signals=[lambda: next(values, 3)], quiet=0.2, timeout=5, interval=0.05))        self.assertLess(time.time() - start, 1)    def testWaitForStable_timeout(self):        vc = self.__mockTree(version=17)        values = iter(range(1000))        start = time.time()        self.assertFalse(vc.waitForStable(signals=[lambda: next(values)], quiet=0.2, timeout=0.5, interval=0.05))        self.assertGreaterEqual(time.time() - start, 0.5)    def testDump_stable(self):        vc = self.__mockTree(version=17)        start = time.time()        views = vc.dump(stable=True)        self.assertLess(time.time() - start, 1)        self.assertEqual(vc.views, views)        self.assertEqual('Apps', views[-1].getText())    def openDevNull(self):        if platform.system() == "Windows":            return open('nul', 'a+', encoding='utf-8')        else:            return open('/dev/null', 'a+')    def testFindViewWithTextOrRaise_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        vc.traverse(transform=ViewClient.TRAVERSE_CIT, stream=self.openDevNull())        vc.findViewWithTextOrRaise('语言')    def testFindViewWithTextOrRaise_nonExistent_api17(self):        vc = self.__mockTree(version=17)        try:            vc.findViewWithTextOrRaise('nonexistent text')            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithTextOrRaise_nonExistent_api17_zh(self):        vc = self.__mockTree(version=17, language='zh')        try:            vc.findViewWithTextOrRaise('不存在的文本')            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithContentDescription_root(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v45 = vc.findViewWithContentDescription('CD45')        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v45 = vc.findViewWithContentDescription('CD45', root=v4)        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v35 = vc.findViewWithContentDescription('CD35', root=v3)        self.assertNotEqual(v35, None)        self.assertEqual('35', v35.getText())    def testFindViewWithContentDescription_regexRoot(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v45 = vc.findViewWithContentDescription(re.compile('CD4\d'))        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v45 = vc.findViewWithContentDescription(re.compile('CD4\d'), root=v4)        self.assertNotEqual(v45, None)        self.assertEqual('45', v45.getText())        v35 = vc.findViewWithContentDescription(re.compile('CD3\d'), root=v3)        self.assertNotEqual(v35, None)        self.assertEqual('35', v35.getText())    def testFindViewWithContentDescriptionOrRaise_root(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        v45 = vc.findViewWithContentDescriptionOrRaise('CD45')        self.assertEqual('45', v45.getText())        v45 = vc.findViewWithContentDescriptionOrRaise('CD45', root=v4)        self.assertEqual('45', v45.getText())        v35 = vc.findViewWithContentDescriptionOrRaise('CD35', root=v3)        self.assertEqual('35', v35.getText())    def testFindViewWithContentDescriptionOrRaise_rootNonExistent(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        try:            vc.findViewWithContentDescriptionOrRaise('Non Existent', root=v4)            self.fail()        except ViewNotFoundException:            pass    def testFindViewWithContentDescriptionOrRaiseExceptionMessage_regexpRoot(self):        device = None        root = View({'text:mText':'0', 'content-desc':'CD0'}, device)        root.add(View({'text:mText':'1', 'content-desc':'CD1'}, device))        root.add(View({'text:mText':'2', 'content-desc':'CD2'}, device))        v3 = View({'text:mText':'3', 'content-desc':'CD3'}, device)        root.add(v3)        v35 = View({'text:mText':'35', 'content-desc':'CD35'}, device)        v3.add(v35)        v4 = View({'text:mText':'4', 'conent-desc':'CD4'}, device)        root.add(v4)        v45 = View({'text:mText':'45', 'content-desc':'CD45'}, device)        v4.add(v45)        device = MockDevice()        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        self.assertNotEqual(None, vc)        vc.root = root        try:            vc.findViewWithContentDescriptionOrRaise(re.compile('Non Existent'), root=v4)            self.fail()        except ViewNotFoundException as e:            self.assertNotEqual(None, re.search("that matches 'Non Existent'", str(e)))    def testUiAutomatorDump(self):        device = MockDevice(version=16)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=True)    def testUiAutomatorKilled(self):        device = MockDevice(version=16, uiautomatorkilled=True)        try:            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=True, ignoreuiautomatorkilled=True)        except Exception as e:            self.assertIsNotNone(re.search('''ERROR: UiAutomator output contains no valid information. UiAutomator was killed, no reason given.''', str(e)))    def testDump_gzipped(self):        device = MockDevice(version=24)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        vc.dump(sleep=0)        for compacttree in [False, True]:            gzdevice = MockDevice(version=24, gzip=True)            gzvc = ViewClient(gzdevice, gzdevice.serialno, adb=TRUE, autodump=False, compacttree=compacttree)            gzvc.dump(sleep=0)            self.assertEqual([v.map for v in vc.views], [v.map for v in gzvc.views])            self.assertEqual(vc.treeHash, gzvc.treeHash)    def testUiAutomatorDumpStream_noise(self):        warning = 'WARNING: linker: libdvm.so has text relocations. This is wasting memory and is a security risk. Please fix.\r\n'        received = (warning + UIAUTOMATOR_DUMP + 'Killed\r\n').encode('utf-8')        stream = UiAutomatorDumpStream(UiAutomator2AndroidViewClient(None, 17, None))        # small chunks, so </hierarchy> is split between them        for i in range(0, len(received), 5):            stream.feed(received[i:i + 5])        root = stream.close()        noise = stream.getNoise()        self.assertTrue(noise.startswith(warning))        self.assertEqual('Killed', noise[len(warning):].strip())        vc = self.__mockTree(version=17)        self.assertEqual([v.map for v in vc.views], [v.map for v in stream.handler.views])        self.assertEqual(vc.root.map, root.map)    def testDecodeBounds(self):        parser = UiAutomator2AndroidViewClient(None, 17, None)        self.assertEqual(((0, -25), (1080, 1920)), parser.decodeBounds('[0,-25][1080,1920]'))        self.assertIs(parser.decodeBounds('[0,-25][1080,1920]'), parser.decodeBounds('[0,-25][1080,1920]'))        root = parser.Parse(UIAUTOMATOR_DUMP.encode('utf-8'))        vc = self.__mockTree(version=17)        self.assertEqual([v.map for v in vc.views], [v.map for v in parser.views])        self.assertEqual(vc.root.getCoords(), root.getCoords())    def testSetViewsFromUiAutomatorDumpStream_noXml(self):        device = MockDevice(version=17)        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)        with self.assertRaises(RuntimeError) as cm:            vc.setViewsFromUiAutomatorDumpStream([b'ERROR: could not get idle state.\r\n'])        self.assertIn('too frequently', str(cm.exception))        with self.assertRaises(RuntimeError):            vc.setViewsFromUiAutomatorDumpStream([b'not compressed'], gzipped=True)    def testSetViewsFromUiAutomatorDumpStream_killed(self):        device = MockDevice(version=17)        chunks = [(UIAUTOMATOR_DUMP + 'Killed\r\n').encode('utf-8')]        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False, ignoreuiautomatorkilled=False)        with self.assertRaises(RuntimeError) as cm:            vc.setViewsFromUiAutomatorDumpStream(chunks)        self.assertIn('UiAutomator was killed', str(cm.exception))        vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False, ignoreuiautomatorkilled=True)        vc.setViewsFromUiAutomatorDumpStream(chunks)        self.assertEqual([v.map for v in self.__mockTree(version=17).views], [v.map for v in vc.views])    def testUiViewServerDump(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump()            vc.findViewByIdOrRaise('id/home')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowStr(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window='StatusBar')            vc.findViewByIdOrRaise('id/status_bar')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowInt(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window=0xb52f7c88)            vc.findViewByIdOrRaise('id/status_bar')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowIntStr(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window='0xb52f7c88')            vc.findViewByIdOrRaise('id/status_bar')        finally:            if device:                device.shutdownMockViewServer()    def testUiViewServerDump_windowIntM1(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE, autodump=False)            vc.dump(window=-1)            vc.findViewByIdOrRaise('id/home')        finally:            if device:                device.shutdownMockViewServer()    def testFindViewsContainingPoint_api15(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE)            list = vc.findViewsContainingPoint((200, 200))            self.assertNotEqual(None, list)            self.assertNotEqual(0, len(list))        finally:            if device:                device.shutdownMockViewServer()    def testFindViewsContainingPoint_api17(self):        device = MockDevice(version=17)        vc = ViewClient(device, device.serialno, adb=TRUE)        list = vc.findViewsContainingPoint((55, 75))        self.assertNotEqual(None, list)        self.assertNotEqual(0, len(list))    def testFindViewsContainingPoint_filterApi15(self):        device = None        try:            device = MockDevice(version=15, startviewserver=True)            vc = ViewClient(device, device.serialno, adb=TRUE)            list = vc.findViewsContainingPoint((200, 200), _filter=View.isClickable)            self.assertNotEqual(None, list)            self.assertNotEqual(0, len(list))        finally:            if device:                device.shutdownMockViewServer()    def testFindViewsContainingPoint_filterApi17(self):        device = MockDevice(version=17)        vc = ViewClient(device, device.serialno, adb=TRUE)        list = vc.findViewsContainingPoint((55, 75), _filter=View.isClickable)        self.assertNotEqual(None, list)        self.assertNotEqual(0, len(list))class ImportTest(unittest.TestCase):    IMPORT_TIME_BUDGET = 1.0    ''' The maximum time, in seconds, importing the modules used by culebra and dump may take '''    HEAVY_MODULES = ['numpy', 'PIL', 'requests', 'pkg_resources', 'matplotlib']    ''' The modules that should be imported only when they are used '''    def __python(self, *args):        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))        return subprocess.check_output([sys.executable] + list(args), env=env,                                       stderr=subprocess.STDOUT).decode('utf-8')    def testImport_heavyModulesNotLoaded(self):        modules = self.__python('-c', 'import sys; import androidviewclient3.culebron; '                                      'print(" ".join(sys.modules))').split()        for m in ImportTest.HEAVY_MODULES:            self.assertNotIn(m, modules)    def testImport_requestsAvailable(self):        import importlib.util        out = self.__python('-c', 'import sys; from androidviewclient3.uiautomator import uiautomatorhelper; '                                  'print(uiautomatorhelper.REQUESTS_AVAILABLE, "requests" in sys.modules)')        self.assertEqual('%s False' % (importlib.util.find_spec('requests') is not None), out.strip())    def testImport_timeBudget(self):        out = self.__python('-X', 'importtime', '-c', 'import androidviewclient3.culebron')        # the last line is the top level import, its cumulative time is in the second column in us        cumulative = int(out.splitlines()[-1].split('|')[1])        self.assertLess(cumulative / 1e6, ImportTest.IMPORT_TIME_BUDGET)class ViewServerParseBenchmarkTest(unittest.TestCase):    '''    Benchmarks the parsing of the recorded ViewServer dumps.    '''    DUMPS = [('DUMP', DUMP, 15), ('DUMP_SAMPLE_UI', DUMP_SAMPLE_UI, 15), ('DUMP_API_10', DUMP_API_10, 10)]    ''' The recorded dumps and the API level of the device that produced them '''    REPEAT = 31    ''' The times the children of the root are repeated to obtain a larger dump '''    SET_VIEWS_TIME_BUDGET = 2.0    ''' The maximum time, in seconds, setViews() may take on every larger dump '''    @staticmethod    def oldSplitAttrs(strArgs, textProperty):        '''        The tokenizer replaced by the length-prefixed one in ViewClient.__splitAttrs(), kept as the reference.        '''        textRE = re.compile('%s=%s,' % (textProperty, _nd('len')))        m = textRE.search(strArgs)        if m:            s1 = strArgs[m.end():m.end() + int(m.group('len'))]            strArgs = strArgs.replace(s1, s1.replace(' ', WS), 1)        attrRE = re.compile('%s(?P<parens>\(\))?=%s,(?P<val>[^ ]*)' % (_ns('attr'), _nd('len')), flags=re.DOTALL)        hashRE = re.compile('%s@%s' % (_ns('class'), _nh('oid')))        attrs = {}        for attr in strArgs.split():            m = attrRE.match(attr)            if m:                val = m.group('val')                if m.group('attr') == textProperty:                    val = val.replace(WS, ' ')                attrs[m.group('attr') + ('()' if m.group('parens') else '')] = val            else:                m = hashRE.match(attr)                if m:                    attrs['class'] = m.group('class')                    attrs['oid'] = m.group('oid')        return attrs    @staticmethod    def __time(method, n=20):        start = time.perf_counter()        for _ in range(n):            method()        return (time.perf_counter() - start) / n    def __viewClient(self, version):        device = MockDevice(version=version)        return ViewClient(device, serialno=device.serialno, adb=TRUE, autodump=False)    @staticmethod    def __lines(dump):        return [l for l in dump.split('\n') if l not in ('', 'DONE', 'DONE.')]    def testSplitAttrs_fasterThanOldTokenizer(self):        for name, dump, version in ViewServerParseBenchmarkTest.DUMPS:            vc = self.__viewClient(version)            splitAttrs = vc._ViewClient__splitAttrs            lines = ViewServerParseBenchmarkTest.__lines(dump)            for line in lines:                old = ViewServerParseBenchmarkTest.oldSplitAttrs(line, vc.textProperty)                attrs, _ = splitAttrs(line)                self.assertEqual(old, dict((k, v) for k, v in attrs.items() if k != 'uniqueId'))            oldTime = ViewServerParseBenchmarkTest.__time(                lambda: [ViewServerParseBenchmarkTest.oldSplitAttrs(l, vc.textProperty) for l in lines])            newTime = ViewServerParseBenchmarkTest.__time(lambda: [splitAttrs(l) for l in lines])            print('%s: __splitAttrs() per line %d -> %d us' % (name, oldTime / len(lines) * 1e6,                                                                newTime / len(lines) * 1e6), file=sys.stderr)            self.assertLess(newTime, oldTime)    def testSetViews_timeBudget(self):        for name, dump, version in ViewServerParseBenchmarkTest.DUMPS:            vc = self.__viewClient(version)            lines = ViewServerParseBenchmarkTest.__lines(dump)            larger = '\n'.join(lines[:1] + lines[1:] * ViewServerParseBenchmarkTest.REPEAT) + '\nDONE\n'            elapsed = ViewServerParseBenchmarkTest.__time(lambda: vc.setViews(larger), n=3)            print('%s: setViews() on %d views %d ms' % (name, len(vc.views), elapsed * 1e3), file=sys.stderr)            self.assertEqual(1 + (len(lines) - 1) * ViewServerParseBenchmarkTest.REPEAT, len(vc.views))            self.assertLess(elapsed, ViewServerParseBenchmarkTest.SET_VIEWS_TIME_BUDGET)if __name__ == "__main__":    print("ViewClient.__main__:", file=sys.stderr)    print("argv=", sys.argv, file=sys.stderr)    #import sys;sys.argv = ['', 'Test.testName']    #sys.argv.append('ViewClientTest.testFindViewsContainingPoint_filterApi17')    unittest.main()
\ No newline at end of file